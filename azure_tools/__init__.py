@@ -9,32 +9,97 @@ Provides simplified interfaces for managing Azure resources including:
 - Subscription and Resource Group Management
 """
 
-from .auth import AzureAuthentication
-from .base import AzureResourceBase
-from .subscription_resource import SubscriptionResourceManager
-from .batch import AzureBatchPool
-from .keyvault import AzureKeyVault
-from .locks import AzureResourceLock
-from .adf import (
-    ADFLinkedServices,
-    ADFIntegrationRuntime,
-    ADFManagedPrivateEndpoint,
-    ADFTrigger,
-    ADFPipeline,
-)
+import importlib
+
+# Public names and the submodule defining each. Submodules (and the Azure SDK
+# packages behind them) are imported on first attribute access, so importing
+# azure_tools itself stays cheap for CLI and MCP entry points.
+_LAZY_EXPORTS = {
+    "AzureAuthentication": ".auth",
+    "AzureResourceBase": ".base",
+    "ClientRegistry": ".client_registry",
+    "get_client_registry": ".client_registry",
+    "ArmHttpSession": ".http_session",
+    "configure_http_session": ".http_session",
+    "get_http_session": ".http_session",
+    "ArmRateLimiter": ".throttling",
+    "RetryEngine": ".throttling",
+    "get_rate_limiter": ".throttling",
+    "PersistentTokenCache": ".token_cache",
+    "SecretCache": ".secret_cache",
+    "get_secret_cache": ".secret_cache",
+    "Waiter": ".waiters",
+    "WaitCancelledError": ".waiters",
+    "async_wait_until": ".waiters",
+    "wait_until": ".waiters",
+    "SubscriptionResourceManager": ".subscription_resource",
+    "AzureBatchPool": ".batch",
+    "BatchScalingOrchestrator": ".batch_scaling",
+    "AzureKeyVault": ".keyvault",
+    "SecretHygieneScan": ".secret_hygiene",
+    "AzureResourceLock": ".locks",
+    "LockJournal": ".lock_window",
+    "LockIndex": ".lock_inventory",
+    "LockInventory": ".lock_inventory",
+    "UnlockedWindow": ".lock_window",
+    "ADFLinkedServices": ".adf",
+    "ADFIntegrationRuntime": ".adf",
+    "ADFManagedPrivateEndpoint": ".adf",
+    "ADFTrigger": ".adf",
+    "ADFPipeline": ".adf",
+    "PipelineRunHandle": ".adf",
+    "PipelineRunMonitor": ".adf",
+}
+
+
+def __getattr__(name):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
 
 __version__ = "0.1.0"
 
 __all__ = [
     "AzureAuthentication",
-    "AzureResourceBase", 
+    "AzureResourceBase",
+    "ClientRegistry",
+    "get_client_registry",
+    "ArmHttpSession",
+    "configure_http_session",
+    "get_http_session",
+    "ArmRateLimiter",
+    "RetryEngine",
+    "get_rate_limiter",
+    "PersistentTokenCache",
+    "SecretCache",
+    "get_secret_cache",
+    "Waiter",
+    "WaitCancelledError",
+    "async_wait_until",
+    "wait_until",
     "SubscriptionResourceManager",
     "AzureBatchPool",
+    "BatchScalingOrchestrator",
     "AzureKeyVault",
+    "SecretHygieneScan",
     "AzureResourceLock",
+    "LockJournal",
+    "LockIndex",
+    "LockInventory",
+    "UnlockedWindow",
     "ADFLinkedServices",
     "ADFIntegrationRuntime",
     "ADFManagedPrivateEndpoint",
     "ADFTrigger",
     "ADFPipeline",
-] 
\ No newline at end of file
+    "PipelineRunHandle",
+    "PipelineRunMonitor",
+]
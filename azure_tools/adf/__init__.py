@@ -2,23 +2,40 @@
 Azure Data Factory Module
 
 Provides interfaces for managing ADF resources:
-- Linked Services
-- Integration Runtimes  
+- Linked Services (and a TTL/ETag definition cache)
+- Bulk Snowflake account migration and connectivity sweeps
+- Integration Runtimes
 - Managed Private Endpoints
 - Triggers
-- Pipelines
+- Pipelines (and run handles / monitoring)
 """
 
 from .linked_services import ADFLinkedServices
+from .linked_service_cache import (
+    LinkedServiceCache,
+    LinkedServiceIndex,
+    get_linked_service_cache,
+)
+from .connectivity import ConnectivitySweep
+from .snowflake_migration import SnowflakeAccountMigration, SnowflakeMigrationItem
 from .integration_runtime import ADFIntegrationRuntime
 from .managed_pe import ADFManagedPrivateEndpoint
 from .triggers import ADFTrigger
 from .pipelines import ADFPipeline
+from .runs import PipelineRunHandle, PipelineRunMonitor
 
 __all__ = [
     "ADFLinkedServices",
-    "ADFIntegrationRuntime", 
+    "LinkedServiceCache",
+    "LinkedServiceIndex",
+    "get_linked_service_cache",
+    "ConnectivitySweep",
+    "SnowflakeAccountMigration",
+    "SnowflakeMigrationItem",
+    "ADFIntegrationRuntime",
     "ADFManagedPrivateEndpoint",
     "ADFTrigger",
     "ADFPipeline",
-] 
\ No newline at end of file
+    "PipelineRunHandle",
+    "PipelineRunMonitor",
+]
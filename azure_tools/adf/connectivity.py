@@ -0,0 +1,150 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Tuple, Union
+from ..auth import AzureAuthentication
+from .linked_services import ADFLinkedServices, FactoryRef, resolve_factories
+
+
+class ConnectivitySweep:
+    """
+    Runs testConnectivity for every (or every type-filtered) linked service in
+    one or more factories. Each test can take up to a minute on the service
+    side, so tests run concurrently under a cap, each with its own timeout,
+    and the outcome is summarized as one table with the latency of each test.
+    """
+
+    def __init__(
+        self,
+        factories: Iterable[FactoryRef],
+        filter_by_type: Union[str, List[str]] = None,
+        subscription_id: str = None,
+        auth: AzureAuthentication = None,
+        max_workers: int = 8,
+        timeout: float = 120,
+    ):
+        """
+        Initialize the sweep.
+
+        Args:
+            factories: Factories to test, as (resource_group, factory) or
+                (subscription_id, resource_group, factory) tuples
+            filter_by_type: Optional linked service type or list of types to test
+            subscription_id: Subscription for factories given without one
+            auth: Optional AzureAuthentication instance. If not provided, uses the shared instance
+            max_workers: Maximum number of tests in flight
+            timeout: Overall timeout in seconds for each test, retries included
+        """
+        self.factories = resolve_factories(factories, subscription_id)
+        self.filter_by_type = filter_by_type
+        self.auth = auth if auth is not None else AzureAuthentication.shared()
+        self.max_workers = max_workers
+        self.timeout = timeout
+
+    def _helper(self, factory: Tuple[str, str, str]) -> ADFLinkedServices:
+        subscription_id, resource_group_name, factory_name = factory
+        return ADFLinkedServices(
+            resource_group_name=resource_group_name,
+            resource_name=factory_name,
+            subscription_id=subscription_id,
+            auth=self.auth,
+        )
+
+    def _list_targets(
+        self, factory: Tuple[str, str, str]
+    ) -> List[Tuple[Tuple[str, str, str], str, str]]:
+        with self._helper(factory) as helper:
+            services = helper.list_linked_services(filter_by_type=self.filter_by_type)
+        return [
+            (factory, service["name"], service.get("properties", {}).get("type"))
+            for service in services
+        ]
+
+    def _test(self, target: Tuple[Tuple[str, str, str], str, str]) -> Dict:
+        factory, name, service_type = target
+        result = {
+            "factory": factory[2],
+            "linked_service": name,
+            "type": service_type,
+            "status": "failed",
+            "seconds": None,
+            "error": None,
+        }
+        started = time.monotonic()
+        try:
+            with self._helper(factory) as helper:
+                response = helper.test_linked_service_connection(
+                    name, timeout=self.timeout, quiet=True
+                )
+            if response.get("succeeded"):
+                result["status"] = "succeeded"
+            else:
+                result["error"] = response.get("errors", [{}])[0].get(
+                    "message", "Unknown error"
+                )
+        except Exception as e:
+            timed_out = (
+                "timed out" in str(e).lower() or "timeout" in type(e).__name__.lower()
+            )
+            result["status"] = "timeout" if timed_out else "error"
+            result["error"] = str(e)
+        result["seconds"] = round(time.monotonic() - started, 2)
+        return result
+
+    def run(self) -> List[Dict]:
+        """
+        Discover the linked services and test them concurrently.
+
+        Returns:
+            One result per linked service with 'factory', 'linked_service', 'type',
+            'status' ('succeeded', 'failed', 'timeout' or 'error'), 'seconds' and 'error',
+            ordered by factory and linked service name
+        """
+        targets = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for listed in executor.map(self._safe_list_targets, self.factories):
+                targets.extend(listed)
+
+            print(
+                f"Testing {len(targets)} linked services in {len(self.factories)} factories "
+                f"with {self.max_workers} workers"
+            )
+            results = list(executor.map(self._test, targets))
+        results.sort(key=lambda r: (r["factory"], r["linked_service"]))
+        return results
+
+    def _safe_list_targets(self, factory: Tuple[str, str, str]) -> List:
+        try:
+            return self._list_targets(factory)
+        except Exception as e:
+            print(f"Error listing linked services in {factory[2]}: {str(e)}")
+            return []
+
+    @staticmethod
+    def print_summary(results: List[Dict]) -> None:
+        """Print the sweep results as a table followed by per-status totals."""
+        if not results:
+            print("No linked services tested")
+            return
+        columns = ("factory", "linked_service", "type", "status", "seconds")
+        rows = [
+            [str(r[c]) if r[c] is not None else "-" for c in columns] for r in results
+        ]
+        widths = [
+            max(len(c), *(len(row[i]) for row in rows)) for i, c in enumerate(columns)
+        ]
+        print("  ".join(c.ljust(w) for c, w in zip(columns, widths)))
+        print("  ".join("-" * w for w in widths))
+        for row, result in zip(rows, results):
+            line = "  ".join(value.ljust(w) for value, w in zip(row, widths))
+            if result["error"]:
+                line += f"  {result['error']}"
+            print(line)
+
+        totals: Dict[str, int] = {}
+        for result in results:
+            totals[result["status"]] = totals.get(result["status"], 0) + 1
+        latencies = sorted(r["seconds"] for r in results if r["seconds"] is not None)
+        print(
+            ", ".join(f"{count} {status}" for status, count in sorted(totals.items()))
+            + f"; slowest {latencies[-1]:.1f}s, median {latencies[len(latencies) // 2]:.1f}s"
+        )
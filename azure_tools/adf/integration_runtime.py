@@ -1,7 +1,6 @@
-import requests
-import time
 from ..base import AzureResourceBase
 from ..auth import AzureAuthentication
+from ..waiters import Waiter
 
 
 class ADFIntegrationRuntime(AzureResourceBase):
@@ -19,7 +18,7 @@ class ADFIntegrationRuntime(AzureResourceBase):
             resource_group_name: Name of the resource group
             resource_name: Name of the Azure Data Factory
             subscription_id: Azure subscription ID. If not provided, will be retrieved from Azure CLI
-            auth: Optional AzureAuthentication instance. If not provided, creates a new one
+            auth: Optional AzureAuthentication instance. If not provided, uses the shared instance
         """
         super().__init__(
             resource_group_name=resource_group_name,
@@ -39,13 +38,8 @@ class ADFIntegrationRuntime(AzureResourceBase):
             ir_resource_id = f"subscriptions/{self.subscription_id}/resourcegroups/{self.resource_group_name}/providers/Microsoft.DataFactory/factories/{self.resource_name}/integrationruntimes/{ir_name}"
             api_url = f"https://management.azure.com/{ir_resource_id}/getStatus?api-version=2018-06-01"
 
-            # Make the API call
-            headers = {
-                "Authorization": f"Bearer {self._get_token()}",
-                "Content-Type": "application/json",
-            }
-
-            response = requests.post(api_url, headers=headers)
+            # Make the API call (getStatus is a read, so it is safe to resend)
+            response = self._arm_request("POST", api_url, retry_transient=True)
             response.raise_for_status()
 
             return response.json()
@@ -93,10 +87,18 @@ class ADFIntegrationRuntime(AzureResourceBase):
             print(f"Error getting integration runtime type: {str(e)}")
             raise
 
-    def enable_interactive_authoring(self, ir_name, minutes=10):
+    def enable_interactive_authoring(
+        self, ir_name, minutes=10, timeout: float = 600, waiter: Waiter = None
+    ):
         """
         Enable interactive authoring for the specified integration runtime.
         Only works for Managed integration runtimes.
+
+        Args:
+            ir_name: Name of the integration runtime
+            minutes: Minutes before interactive authoring is turned off again
+            timeout: Seconds to wait for interactive authoring to become enabled
+            waiter: Optional Waiter controlling the polling schedule
         """
         # First check if it's a Managed integration runtime
         ir_type = self.get_ir_type(ir_name)
@@ -118,17 +120,19 @@ class ADFIntegrationRuntime(AzureResourceBase):
         api_url = f"https://management.azure.com/{ir_resource_id}/enableInteractiveQuery?api-version=2018-06-01"
 
         # Make the API call
-        headers = {
-            "Authorization": f"Bearer {self._get_token()}",
-            "Content-Type": "application/json",
-        }
         body = {"autoTerminationMinutes": minutes}
-
-        response = requests.post(api_url, headers=headers, json=body)
+        response = self._arm_request("POST", api_url, json=body)
         response.raise_for_status()
 
         print(f"Successfully triggered interactive authoring for {minutes} minutes")
-        while not self.get_ir_status(ir_name):
-            print("Waiting for interactive authoring to be enabled...")
-            time.sleep(10)
-        print("Interactive authoring is now enabled") 
\ No newline at end of file
+        waiter = waiter or Waiter(
+            timeout=timeout,
+            on_progress=lambda *_: print(
+                "Waiting for interactive authoring to be enabled..."
+            ),
+        )
+        waiter.wait_until(
+            lambda: self.get_ir_status(ir_name),
+            description=f"interactive authoring on {ir_name}",
+        )
+        print("Interactive authoring is now enabled")
@@ -0,0 +1,180 @@
+import copy
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# (subscription, resource group, factory)
+FactoryKey = Tuple[str, str, str]
+
+
+@dataclass
+class CachedLinkedService:
+    """One cached linked service definition in ARM REST (camelCase) shape."""
+
+    definition: Dict
+    etag: Optional[str]
+    fetched_at: float
+
+    def is_fresh(self, ttl: float) -> bool:
+        return time.monotonic() - self.fetched_at < ttl
+
+
+@dataclass
+class LinkedServiceIndex:
+    """
+    Compact index of one factory's linked services, built from a full listing.
+    Holds a small record per service (name, type, etag, ...) instead of the
+    full definition, and the names of each type.
+    """
+
+    records: Dict[str, Dict]
+    by_type: Dict[str, List[str]] = field(default_factory=dict)
+    built_at: float = field(default_factory=time.monotonic)
+
+    @classmethod
+    def build(cls, records: Iterable[Dict]) -> "LinkedServiceIndex":
+        by_name = {}
+        by_type: Dict[str, List[str]] = {}
+        for record in records:
+            by_name[record["name"]] = record
+            by_type.setdefault(record.get("type"), []).append(record["name"])
+        return cls(records=by_name, by_type=by_type)
+
+    def is_fresh(self, ttl: float) -> bool:
+        return time.monotonic() - self.built_at < ttl
+
+    def names(self, service_type=None) -> List[str]:
+        """
+        Names of the linked services, optionally only those of a type or list of types.
+        """
+        if service_type is None:
+            return list(self.records)
+        types = [service_type] if isinstance(service_type, str) else service_type
+        return [name for t in types for name in self.by_type.get(t, [])]
+
+
+class LinkedServiceCache:
+    """
+    Per-factory cache of linked service definitions keyed by name.
+    Entries younger than the TTL are served from memory; older entries are
+    revalidated with a conditional GET on their ETag by the caller.
+    Definitions are copied in and out, so callers can mutate what they get.
+    """
+
+    def __init__(self, ttl: float = 300):
+        """
+        Initialize the linked service cache.
+
+        Args:
+            ttl: Seconds an entry is served without revalidation
+        """
+        self.ttl = ttl
+        self._factories: Dict[FactoryKey, Dict[str, CachedLinkedService]] = {}
+        self._indexes: Dict[FactoryKey, LinkedServiceIndex] = {}
+        self._lock = threading.Lock()
+
+    def get(self, factory_key: FactoryKey, name: str) -> Optional[CachedLinkedService]:
+        """
+        Get the cache entry for a linked service, fresh or not.
+
+        Returns:
+            The entry, or None if the service was never cached
+        """
+        with self._lock:
+            return self._factories.get(factory_key, {}).get(name)
+
+    def put(self, factory_key: FactoryKey, definition: Dict) -> Dict:
+        """
+        Store a linked service definition as returned by ARM.
+
+        Args:
+            factory_key: (subscription, resource group, factory)
+            definition: Linked service resource in REST shape (with name and etag)
+
+        Returns:
+            A copy of the stored definition
+        """
+        entry = CachedLinkedService(
+            definition=copy.deepcopy(definition),
+            etag=definition.get("etag"),
+            fetched_at=time.monotonic(),
+        )
+        with self._lock:
+            self._factories.setdefault(factory_key, {})[definition["name"]] = entry
+        return copy.deepcopy(definition)
+
+    def touch(self, factory_key: FactoryKey, name: str) -> Optional[Dict]:
+        """
+        Mark an entry as revalidated (the server answered 304 Not Modified).
+
+        Returns:
+            A copy of the cached definition, or None if it was evicted meanwhile
+        """
+        with self._lock:
+            entry = self._factories.get(factory_key, {}).get(name)
+            if entry is None:
+                return None
+            entry.fetched_at = time.monotonic()
+            return copy.deepcopy(entry.definition)
+
+    def get_index(self, factory_key: FactoryKey) -> Optional[LinkedServiceIndex]:
+        """
+        Get the factory's index if it was built within the TTL.
+        """
+        with self._lock:
+            index = self._indexes.get(factory_key)
+        if index is None or not index.is_fresh(self.ttl):
+            return None
+        return index
+
+    def put_index(
+        self, factory_key: FactoryKey, records: Iterable[Dict]
+    ) -> LinkedServiceIndex:
+        """
+        Replace the factory's index with one built from compact records.
+
+        Returns:
+            The new index
+        """
+        index = LinkedServiceIndex.build(records)
+        with self._lock:
+            self._indexes[factory_key] = index
+        return index
+
+    def invalidate(self, factory_key: FactoryKey, name: str = None) -> None:
+        """
+        Drop one linked service, or the whole factory when name is None.
+        The factory's index is dropped either way, since an update can add a
+        service or change its type.
+        """
+        with self._lock:
+            self._indexes.pop(factory_key, None)
+            if name is None:
+                self._factories.pop(factory_key, None)
+            else:
+                self._factories.get(factory_key, {}).pop(name, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._factories.clear()
+            self._indexes.clear()
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def get_linked_service_cache() -> LinkedServiceCache:
+    """
+    Get the process-wide linked service cache shared by all ADFLinkedServices helpers.
+
+    Returns:
+        The default LinkedServiceCache instance
+    """
+    global _default_cache
+    if _default_cache is None:
+        with _default_cache_lock:
+            if _default_cache is None:
+                _default_cache = LinkedServiceCache()
+    return _default_cache
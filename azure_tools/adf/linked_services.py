@@ -1,9 +1,111 @@
-import requests
+import copy
 import json
 import re
-from typing import List, Dict, Union
+import time
+from functools import lru_cache
+from typing import Iterable, Iterator, List, Dict, Optional, Sequence, Tuple, Union
 from ..base import AzureResourceBase
 from ..auth import AzureAuthentication
+from ..subscription_resource import SubscriptionResourceManager
+from .linked_service_cache import (
+    LinkedServiceCache,
+    LinkedServiceIndex,
+    get_linked_service_cache,
+)
+
+# Linked service types that carry a Snowflake account
+SNOWFLAKE_TYPES = ("Snowflake", "SnowflakeV2")
+
+
+@lru_cache(maxsize=256)
+def snowflake_host_pattern(old_fqdn: str) -> "re.Pattern":
+    """
+    Compiled pattern matching the account part of a Snowflake host in a
+    connection string (jdbc:snowflake://<account>.snowflakecomputing.com).
+    Compiled once per account and reused across calls.
+    """
+    return re.compile(rf"(?<=://){re.escape(old_fqdn)}(?=\.)")
+
+
+def _to_plain(value):
+    if hasattr(value, "as_dict"):
+        return value.as_dict()
+    if isinstance(value, list):
+        return [_to_plain(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _to_plain(v) for k, v in value.items()}
+    return value
+
+
+def project_linked_service(service, projection: Sequence[str]) -> Dict:
+    """
+    Build a dictionary holding only the requested fields of a linked service model.
+    Paths use the same snake_case keys as as_dict(), e.g. "properties.type" or
+    "properties.connect_via.reference_name". Missing fields are left out.
+
+    Args:
+        service: LinkedServiceResource model
+        projection: Dotted field paths to keep
+
+    Returns:
+        Nested dictionary with the requested fields
+    """
+    result: Dict = {}
+    for path in projection:
+        parts = path.split(".")
+        value = service
+        for part in parts:
+            value = (
+                value.get(part)
+                if isinstance(value, dict)
+                else getattr(value, part, None)
+            )
+            if value is None:
+                break
+        if value is None:
+            continue
+        target = result
+        for part in parts[:-1]:
+            target = target.setdefault(part, {})
+        target[parts[-1]] = _to_plain(value)
+    return result
+
+
+def linked_service_record(service) -> Dict:
+    """Compact index record for a linked service model."""
+    properties = service.properties
+    connect_via = getattr(properties, "connect_via", None)
+    return {
+        "name": service.name,
+        "type": properties.type,
+        "etag": service.etag,
+        "description": getattr(properties, "description", None),
+        "connect_via": connect_via.reference_name if connect_via is not None else None,
+    }
+
+
+# A factory is (resource group, factory) or (subscription, resource group, factory)
+FactoryRef = Union[Tuple[str, str], Tuple[str, str, str]]
+
+
+def resolve_factories(
+    factories: Iterable[FactoryRef], subscription_id: str = None
+) -> List[Tuple[str, str, str]]:
+    """
+    Normalize factory references to (subscription, resource group, factory).
+    The subscription of two-element references is resolved once.
+    """
+    default_subscription = None
+    resolved = []
+    for factory in factories:
+        if len(factory) == 2:
+            if default_subscription is None:
+                default_subscription = SubscriptionResourceManager.get_subscription_id(
+                    subscription_id
+                )
+            factory = (default_subscription,) + tuple(factory)
+        resolved.append(tuple(factory))
+    return resolved
 
 
 class ADFLinkedServices(AzureResourceBase):
@@ -13,6 +115,7 @@ class ADFLinkedServices(AzureResourceBase):
         resource_name: str,
         subscription_id: str = None,
         auth: AzureAuthentication = None,
+        cache: LinkedServiceCache = None,
     ):
         """
         Initialize ADF Linked Services resource.
@@ -21,7 +124,8 @@ class ADFLinkedServices(AzureResourceBase):
             resource_group_name: Name of the resource group
             resource_name: Name of the Azure Data Factory
             subscription_id: Azure subscription ID. If not provided, will be retrieved from Azure CLI
-            auth: Optional AzureAuthentication instance. If not provided, creates a new one
+            auth: Optional AzureAuthentication instance. If not provided, uses the shared instance
+            cache: Optional LinkedServiceCache. If not provided, uses the process-wide cache
         """
         super().__init__(
             resource_group_name=resource_group_name,
@@ -30,68 +134,161 @@ class ADFLinkedServices(AzureResourceBase):
             subscription_id=subscription_id,
             auth=auth,
         )
+        self.cache = cache if cache is not None else get_linked_service_cache()
+
+    @property
+    def factory_key(self) -> tuple:
+        """(subscription, resource group, factory) used as the cache key."""
+        return (self.subscription_id, self.resource_group_name, self.resource_name)
 
     def list_linked_services(
-        self, filter_by_type: Union[str, List[str]] = None
+        self,
+        filter_by_type: Union[str, List[str]] = None,
+        projection: Sequence[str] = None,
     ) -> List[Dict]:
         """
         List all linked services in the Azure Data Factory.
+
+        Args:
+            filter_by_type: Optional linked service type or list of types to keep
+            projection: Optional field paths to return, e.g. ["name", "properties.type"].
+                Without it each service is returned in full and its definition is cached
+
+        Returns:
+            List of linked service dictionaries
+        """
+        return list(
+            self._iter_linked_services(
+                filter_by_type, projection, cache_definitions=projection is None
+            )
+        )
+
+    def iter_linked_services(
+        self,
+        filter_by_type: Union[str, List[str]] = None,
+        projection: Sequence[str] = None,
+    ) -> Iterator[Dict]:
         """
+        Stream linked services page by page without holding the whole listing.
+        Type filtering and projection are applied to each model before it is
+        converted, so skipped services and unrequested fields are never materialized.
+
+        Args:
+            filter_by_type: Optional linked service type or list of types to keep
+            projection: Optional field paths to return, e.g. ["name", "properties.type"]
+
+        Yields:
+            Linked service dictionaries
+        """
+        yield from self._iter_linked_services(filter_by_type, projection)
+
+    def _iter_linked_services(
+        self,
+        filter_by_type: Union[str, List[str]] = None,
+        projection: Sequence[str] = None,
+        cache_definitions: bool = False,
+    ) -> Iterator[Dict]:
         try:
-            # Get all linked services
-            linked_services = self.client.linked_services.list_by_factory(
+            types = (
+                [filter_by_type] if isinstance(filter_by_type, str) else filter_by_type
+            )
+            records = []
+            # ARM has no $select for linked services, so fields are trimmed as each page arrives
+            for service in self.client.linked_services.list_by_factory(
                 resource_group_name=self.resource_group_name,
                 factory_name=self.resource_name,
-            )
-
-            # Convert to list of dictionaries and filter if needed
-            services_list = []
-            for service in linked_services:
-                service_dict = service.as_dict()
-
-                # If filter_by_type is specified, check if service type matches
-                if filter_by_type:
-                    service_type = service_dict.get("properties", {}).get("type")
-                    if isinstance(filter_by_type, str):
-                        # Single type filter
-                        if service_type == filter_by_type:
-                            services_list.append(service_dict)
-                    elif isinstance(filter_by_type, list):
-                        # Multiple type filter
-                        if service_type in filter_by_type:
-                            services_list.append(service_dict)
+            ):
+                records.append(linked_service_record(service))
+                if cache_definitions:
+                    # Keep the REST-shaped definition so later detail calls are served from cache
+                    self.cache.put(
+                        self.factory_key, service.serialize(keep_readonly=True)
+                    )
+                if types and service.properties.type not in types:
+                    continue
+                if projection is None:
+                    yield service.as_dict()
                 else:
-                    services_list.append(service_dict)
+                    yield project_linked_service(service, projection)
 
-            return services_list
+            # Only a complete listing can replace the index
+            self.cache.put_index(self.factory_key, records)
 
         except Exception as e:
             print(f"Error listing linked services: {str(e)}")
             raise
 
-    def get_linked_service_details(self, linked_service_name):
+    def get_linked_service_index(self, refresh: bool = False) -> LinkedServiceIndex:
+        """
+        Get the factory's compact index of linked services (name -> record, type -> names).
+        The index is rebuilt from a streamed listing when missing, older than the
+        cache TTL, or when refresh is True.
+
+        Args:
+            refresh: If True, always rebuild the index
+
+        Returns:
+            LinkedServiceIndex for this factory
+        """
+        index = None if refresh else self.cache.get_index(self.factory_key)
+        if index is None:
+            for _ in self._iter_linked_services(projection=()):
+                pass
+            index = self.cache.get_index(self.factory_key)
+        return index
+
+    def list_linked_service_names(
+        self, filter_by_type: Union[str, List[str]] = None
+    ) -> List[str]:
+        """
+        Names of the factory's linked services, optionally of a type or list of types,
+        served from the index.
+        """
+        return self.get_linked_service_index().names(filter_by_type)
+
+    def get_linked_service_details(self, linked_service_name, use_cache: bool = True):
         """
         Get the details of a linked service using API calls.
+        Definitions cached within the TTL are returned without a call; older
+        ones are revalidated with a conditional GET on their ETag.
+
+        Args:
+            linked_service_name: Name of the linked service
+            use_cache: If False, always fetch the full definition from the service
         """
         try:
+            cached = (
+                self.cache.get(self.factory_key, linked_service_name)
+                if use_cache
+                else None
+            )
+            if cached is not None and cached.is_fresh(self.cache.ttl):
+                return copy.deepcopy(cached.definition)
+
             # Construct the API URL
             api_url = f"https://management.azure.com/subscriptions/{self.subscription_id}/resourcegroups/{self.resource_group_name}/providers/Microsoft.DataFactory/factories/{self.resource_name}/linkedservices/{linked_service_name}?api-version=2018-06-01"
 
-            # Make the API call
-            headers = {
-                "Authorization": f"Bearer {self._get_token()}",
-                "Content-Type": "application/json",
-            }
-
-            response = requests.get(api_url, headers=headers)
+            # Make the API call, conditional on the cached ETag when there is one
+            headers = (
+                {"If-None-Match": cached.etag}
+                if cached is not None and cached.etag
+                else {}
+            )
+            response = self._arm_request("GET", api_url, headers=headers)
+            if response.status_code == 304:
+                definition = self.cache.touch(self.factory_key, linked_service_name)
+                if definition is not None:
+                    return definition
+                return self.get_linked_service_details(
+                    linked_service_name, use_cache=False
+                )
             response.raise_for_status()
 
-            return response.json()
+            return self.cache.put(self.factory_key, response.json())
         except Exception as e:
             print(f"Error getting linked service details: {str(e)}")
             raise
 
-
     def update_linked_service_sf_account(
         self,
         linked_service_name: str,
@@ -101,6 +298,8 @@ class ADFLinkedServices(AzureResourceBase):
     ) -> Dict:
         """
         Update the Snowflake account FQDN in a linked service.
+        The update is conditional on the ETag of the definition it was built from,
+        so it fails with 412 if the service was changed since that was read.
         """
         try:
             # Get the current linked service details
@@ -118,8 +317,8 @@ class ADFLinkedServices(AzureResourceBase):
                 connection_string = linked_service["properties"]["typeProperties"][
                     "connectionString"
                 ]
-                new_connection_string = re.sub(
-                    rf"(?<=://){re.escape(old_fqdn)}(?=\.)", new_fqdn, connection_string,
+                new_connection_string = snowflake_host_pattern(old_fqdn).sub(
+                    new_fqdn, connection_string
                 )
                 # Check if the regex found a match, no replacement happened
                 if new_connection_string == connection_string:
@@ -137,11 +336,6 @@ class ADFLinkedServices(AzureResourceBase):
                 current_identifier = linked_service["properties"]["typeProperties"][
                     "accountIdentifier"
                 ]
-                new_identifier = re.sub(
-                    rf"(?<=://){re.escape(old_fqdn)}(?=\.)",
-                    new_fqdn,
-                    current_identifier,
-                )
                 # Check if the regex found a match, no replacement happened
                 if new_fqdn == current_identifier:
                     print(
@@ -158,25 +352,67 @@ class ADFLinkedServices(AzureResourceBase):
                 print(json.dumps(linked_service, indent=2))
                 return
 
-            # Update the linked service using Azure SDK
-            response = self.client.linked_services.create_or_update(
-                resource_group_name=self.resource_group_name,
-                factory_name=self.resource_name,
-                linked_service_name=linked_service_name,
-                linked_service=linked_service,
+            # The definition may come from the cache, so the update is conditional on
+            # its ETag: an edit made elsewhere since then fails with 412 instead of
+            # being overwritten
+            response = self.put_linked_service(
+                linked_service_name, linked_service, if_match=linked_service.get("etag")
             )
 
             print(f"Successfully updated linked service: {linked_service_name}")
-            return response.as_dict()
+            return response
 
         except Exception as e:
             print(f"Error updating linked service: {str(e)}")
             raise
 
-    def test_linked_service_connection(self, linked_service_name, parameters=None):
+    def put_linked_service(
+        self,
+        linked_service_name: str,
+        linked_service: Dict,
+        if_match: Optional[str] = None,
+    ) -> Dict:
+        """
+        Create or update a linked service and drop its cached definition.
+
+        Args:
+            linked_service_name: Name of the linked service
+            linked_service: Linked service resource in REST shape
+            if_match: Optional ETag; the update fails with 412 if the service changed since
+
+        Returns:
+            The updated linked service as a dictionary
+        """
+        try:
+            response = self.client.linked_services.create_or_update(
+                resource_group_name=self.resource_group_name,
+                factory_name=self.resource_name,
+                linked_service_name=linked_service_name,
+                linked_service=linked_service,
+                if_match=if_match,
+            )
+            return response.as_dict()
+        finally:
+            self.cache.invalidate(self.factory_key, linked_service_name)
+
+    def test_linked_service_connection(
+        self,
+        linked_service_name,
+        parameters=None,
+        timeout: float = None,
+        quiet: bool = False,
+    ):
         """
         Test the connection of a linked service
+
+        Args:
+            linked_service_name: Name of the linked service
+            parameters: Optional linked service parameters to test with
+            timeout: Optional overall timeout in seconds for the test, throttling
+                retries included; a timeout error is raised when it expires
+            quiet: If True, print nothing; the outcome is only returned or raised
         """
+        deadline = time.monotonic() + timeout if timeout else None
         try:
             # First get the linked service details
             linked_service = self.get_linked_service_details(linked_service_name)
@@ -191,27 +427,57 @@ class ADFLinkedServices(AzureResourceBase):
             # Construct the API URL
             api_url = f"https://management.azure.com/subscriptions/{self.subscription_id}/resourcegroups/{self.resource_group_name}/providers/Microsoft.DataFactory/factories/{self.resource_name}/testConnectivity?api-version=2018-06-01"
 
-            # Make the API call
-            headers = {
-                "Authorization": f"Bearer {self._get_token()}",
-                "Content-Type": "application/json",
-            }
-
-            print("Testing linked service connection with the following configuration:")
-            print(json.dumps(body, indent=2))
+            if not quiet:
+                print(
+                    "Testing linked service connection with the following configuration:"
+                )
+                print(json.dumps(body, indent=2))
 
-            response = requests.post(api_url, headers=headers, json=body)
+            # Make the API call
+            response = self._arm_request("POST", api_url, json=body, deadline=deadline)
             response.raise_for_status()
 
             result = response.json()
-            if result.get("succeeded"):
-                print("Linked service connection test successful")
-            else:
-                print(
-                    f"Linked service connection test failed: {result.get('errors', [{}])[0].get('message', 'Unknown error')}"
-                )
+            if not quiet:
+                if result.get("succeeded"):
+                    print("Linked service connection test successful")
+                else:
+                    print(
+                        f"Linked service connection test failed: {result.get('errors', [{}])[0].get('message', 'Unknown error')}"
+                    )
 
             return result
         except Exception as e:
-            print(f"Error testing linked service connection: {str(e)}")
-            raise 
\ No newline at end of file
+            if not quiet:
+                print(f"Error testing linked service connection: {str(e)}")
+            raise
+
+    def test_all_connections(
+        self,
+        filter_by_type: Union[str, List[str]] = None,
+        max_workers: int = 8,
+        timeout: float = 120,
+    ) -> List[Dict]:
+        """
+        Test every (or every type-filtered) linked service in this factory concurrently.
+
+        Args:
+            filter_by_type: Optional linked service type or list of types to test
+            max_workers: Maximum number of tests in flight
+            timeout: Overall timeout in seconds for each test, retries included
+
+        Returns:
+            One result per linked service, see ConnectivitySweep.run
+        """
+        from .connectivity import ConnectivitySweep
+
+        sweep = ConnectivitySweep(
+            factories=[self.factory_key],
+            filter_by_type=filter_by_type,
+            auth=self.auth,
+            max_workers=max_workers,
+            timeout=timeout,
+        )
+        results = sweep.run()
+        sweep.print_summary(results)
+        return results
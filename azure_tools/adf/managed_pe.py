@@ -18,7 +18,7 @@ class ADFManagedPrivateEndpoint(AzureResourceBase):
             resource_group_name: Name of the resource group
             resource_name: Name of the Azure Data Factory
             subscription_id: Azure subscription ID. If not provided, will be retrieved from Azure CLI
-            auth: Optional AzureAuthentication instance. If not provided, creates a new one
+            auth: Optional AzureAuthentication instance. If not provided, uses the shared instance
         """
         super().__init__(
             resource_group_name=resource_group_name,
@@ -29,7 +29,9 @@ class ADFManagedPrivateEndpoint(AzureResourceBase):
         )
 
     def get_managed_private_endpoint(
-        self, managed_private_endpoint_name: str, managed_vnet_name: str = "default",
+        self,
+        managed_private_endpoint_name: str,
+        managed_vnet_name: str = "default",
     ) -> Dict:
         """
         Get details of a managed private endpoint in Azure Data Factory.
@@ -79,4 +81,4 @@ class ADFManagedPrivateEndpoint(AzureResourceBase):
             return response
         except Exception as e:
             print(f"Error updating managed private endpoint: {str(e)}")
-            raise 
\ No newline at end of file
+            raise
@@ -1,15 +1,21 @@
-import time
-from typing import Dict, Union, List
-from datetime import datetime
+from typing import Dict, Iterator, Union, List
+from datetime import datetime, timedelta, timezone
 from ..base import AzureResourceBase
 from ..auth import AzureAuthentication
+from ..waiters import Waiter
+from .runs import (
+    TERMINAL_STATUSES,
+    PipelineRunHandle,
+    activity_query_window,
+    iter_run_query,
+)
 
 
 class ADFPipeline(AzureResourceBase):
     def __init__(
-        self, 
-        resource_group_name: str, 
-        resource_name: str, 
+        self,
+        resource_group_name: str,
+        resource_name: str,
         subscription_id: str = None,
         auth: AzureAuthentication = None,
     ):
@@ -20,7 +26,7 @@ class ADFPipeline(AzureResourceBase):
             resource_group_name: Name of the resource group
             resource_name: Name of the ADF factory
             subscription_id: Azure subscription ID. If not provided, will be retrieved from Azure CLI
-            auth: Optional AzureAuthentication instance. If not provided, creates a new one
+            auth: Optional AzureAuthentication instance. If not provided, uses the shared instance
         """
         super().__init__(
             resource_group_name=resource_group_name,
@@ -29,18 +35,22 @@ class ADFPipeline(AzureResourceBase):
             subscription_id=subscription_id,
             auth=auth,
         )
+        # Most recent run started by this instance, kept for callers that
+        # use check_status()/fetch_activity() without passing a run
         self.run_id = None
 
-    def create_run(self, pipeline_name: str, parameters: Dict = None) -> str:
+    def create_run(
+        self, pipeline_name: str, parameters: Dict = None
+    ) -> PipelineRunHandle:
         """
-        Create a pipeline run and store the run ID as instance variable.
+        Create a pipeline run and return a handle that tracks it.
 
         Args:
             pipeline_name: Name of the pipeline to run
             parameters: Optional dictionary of parameters to pass to the pipeline
 
         Returns:
-            Pipeline run ID as a string
+            PipelineRunHandle for the new run (str() of it is the run ID)
         """
         try:
             print(f"Starting pipeline: {pipeline_name}")
@@ -57,91 +67,232 @@ class ADFPipeline(AzureResourceBase):
             )
 
             self.run_id = run_response.run_id
-            return self.run_id
+            return PipelineRunHandle(
+                run_id=run_response.run_id,
+                pipeline_name=pipeline_name,
+                resource_group_name=self.resource_group_name,
+                factory_name=self.resource_name,
+                subscription_id=self.subscription_id,
+            )
 
         except Exception as e:
             print(f"Error starting pipeline {pipeline_name}: {str(e)}")
             raise
 
-    def check_status(self) -> Dict:
+    def _resolve_run(self, run: Union[PipelineRunHandle, str, None]) -> str:
+        """Get the run ID for a handle, a run ID, or the last run of this instance."""
+        run_id = (
+            run.run_id if isinstance(run, PipelineRunHandle) else run or self.run_id
+        )
+        if not run_id:
+            raise ValueError("No active pipeline run. Call create_run() first.")
+        return run_id
+
+    def check_status(self, run: Union[PipelineRunHandle, str] = None) -> Dict:
         """
-        Check the status of the current pipeline run.
+        Check the status of a pipeline run.
+
+        Args:
+            run: Run handle or run ID. Defaults to the last run created by this instance.
+                A handle's cached status is updated with the result
 
         Returns:
             Dictionary containing pipeline run details including status
         """
+        run_id = None
         try:
-            if not self.run_id:
-                raise ValueError("No active pipeline run. Call create_run() first.")
+            run_id = self._resolve_run(run)
 
             run_details = self.client.pipeline_runs.get(
                 resource_group_name=self.resource_group_name,
                 factory_name=self.resource_name,
-                run_id=self.run_id,
+                run_id=run_id,
+            ).as_dict()
+            if isinstance(run, PipelineRunHandle):
+                run.update(run_details)
+            return run_details
+
+        except Exception as e:
+            print(f"Error getting pipeline run status for {run_id}: {str(e)}")
+            raise
+
+    def iter_activity_runs(
+        self,
+        run: Union[PipelineRunHandle, str] = None,
+        activity_name: str = None,
+        status: Union[str, List[str]] = None,
+    ) -> Iterator[Dict]:
+        """
+        Stream the activity runs of a pipeline run, following continuation tokens.
+        Filters are applied server-side, and runs are yielded as each page arrives,
+        so memory stays flat for large ForEach fan-outs.
+
+        Args:
+            run: Run handle or run ID. Defaults to the last run created by this instance
+            activity_name: Optional activity name to filter on
+            status: Optional activity status or list of statuses to filter on
+                (e.g. 'Failed', ['InProgress', 'Queued'])
+
+        Yields:
+            Dictionaries of activity run details
+        """
+        run_details = self.check_status(run)
+        yield from self._iter_activity_runs(
+            self._resolve_run(run), run_details, activity_name, status
+        )
+
+    def _iter_activity_runs(
+        self,
+        run_id: str,
+        run_details: Dict,
+        activity_name: str = None,
+        status: Union[str, List[str]] = None,
+    ) -> Iterator[Dict]:
+        from azure.mgmt.datafactory.models import RunFilterParameters, RunQueryFilter
+
+        last_updated_after, last_updated_before = activity_query_window(run_details)
+
+        filters = []
+        if activity_name:
+            filters.append(
+                RunQueryFilter(
+                    operand="ActivityName", operator="Equals", values=[activity_name]
+                )
             )
-            return run_details.as_dict()
+        if status:
+            filters.append(
+                RunQueryFilter(
+                    operand="Status",
+                    operator="In",
+                    values=[status] if isinstance(status, str) else list(status),
+                )
+            )
+
+        filter_parameters = RunFilterParameters(
+            last_updated_after=last_updated_after,
+            last_updated_before=last_updated_before,
+            filters=filters or None,
+        )
+        for activity_run in iter_run_query(
+            self.client.activity_runs.query_by_pipeline_run,
+            filter_parameters,
+            resource_group_name=self.resource_group_name,
+            factory_name=self.resource_name,
+            run_id=run_id,
+        ):
+            yield activity_run.as_dict()
+
+    def iter_pipeline_runs(
+        self,
+        pipeline_name: str = None,
+        status: Union[str, List[str]] = None,
+        last_updated_after: datetime = None,
+        last_updated_before: datetime = None,
+    ) -> Iterator[Dict]:
+        """
+        Stream pipeline runs in the factory, following continuation tokens.
+
+        Args:
+            pipeline_name: Optional pipeline name to filter on
+            status: Optional run status or list of statuses to filter on
+            last_updated_after: Start of the time window. Defaults to 24 hours ago
+            last_updated_before: End of the time window. Defaults to now
+
+        Yields:
+            Dictionaries of pipeline run details
+        """
+        from azure.mgmt.datafactory.models import RunFilterParameters, RunQueryFilter
+
+        try:
+            now = datetime.now(timezone.utc)
+            filters = []
+            if pipeline_name:
+                filters.append(
+                    RunQueryFilter(
+                        operand="PipelineName",
+                        operator="Equals",
+                        values=[pipeline_name],
+                    )
+                )
+            if status:
+                filters.append(
+                    RunQueryFilter(
+                        operand="Status",
+                        operator="In",
+                        values=[status] if isinstance(status, str) else list(status),
+                    )
+                )
+
+            filter_parameters = RunFilterParameters(
+                last_updated_after=last_updated_after or now - timedelta(days=1),
+                last_updated_before=last_updated_before or now,
+                filters=filters or None,
+            )
+            for pipeline_run in iter_run_query(
+                self.client.pipeline_runs.query_by_factory,
+                filter_parameters,
+                resource_group_name=self.resource_group_name,
+                factory_name=self.resource_name,
+            ):
+                yield pipeline_run.as_dict()
 
         except Exception as e:
-            print(f"Error getting pipeline run status for {self.run_id}: {str(e)}")
+            print(f"Error listing pipeline runs: {str(e)}")
             raise
 
-    def fetch_activity(self, activity_name: str = None) -> Union[Dict, List[Dict]]:
+    def fetch_activity(
+        self, activity_name: str = None, run: Union[PipelineRunHandle, str] = None
+    ) -> Union[Dict, List[Dict]]:
         """
         Fetch activity results after pipeline run is successful.
+        All pages of activity runs are read; use iter_activity_runs to stream them instead.
 
         Args:
             activity_name: Optional specific activity name. If None, returns all activities.
+            run: Run handle or run ID. Defaults to the last run created by this instance
 
         Returns:
             Dictionary for specific activity or List of dictionaries for all activities
         """
         try:
-            if not self.run_id:
-                raise ValueError("No active pipeline run. Call create_run() first.")
+            run_id = self._resolve_run(run)
 
             # Check if pipeline is successful
-            status_result = self.check_status()
+            status_result = self.check_status(run)
             if status_result.get("status") != "Succeeded":
                 print(
                     f"Warning: Pipeline status is {status_result.get('status')}, not 'Succeeded'"
                 )
 
-            # Get pipeline run details to get timing
-            run_start = status_result.get("runStart")
-            run_end = status_result.get("runEnd") or datetime.utcnow().isoformat() + "Z"
-
-            # Query activity runs
-            activity_runs = self.client.activity_runs.query_by_pipeline_run(
-                resource_group_name=self.resource_group_name,
-                factory_name=self.resource_name,
-                run_id=self.run_id,
-                filter_parameters={
-                    "lastUpdatedAfter": run_start,
-                    "lastUpdatedBefore": run_end,
-                },
+            activities = self._iter_activity_runs(
+                run_id, status_result, activity_name=activity_name
             )
 
-            activities_list = [run.as_dict() for run in activity_runs.value]
-
             # Return all activities if no specific name provided
             if activity_name is None:
+                activities_list = list(activities)
                 print(f"Retrieved {len(activities_list)} activities")
                 return activities_list
 
-            # Find specific activity
-            for activity in activities_list:
-                if activity.get("activity_name") == activity_name:
-                    print(
-                        f"Found activity {activity_name} with status: {activity.get('status')}"
-                    )
-                    return activity
+            # Find specific activity (filtered server-side)
+            activity = next(activities, None)
+            if activity is not None:
+                print(
+                    f"Found activity {activity_name} with status: {activity.get('status')}"
+                )
+                return activity
 
         except Exception as e:
             print(f"Error fetching activity results: {str(e)}")
             raise
 
     def run_and_fetch(
-        self, pipeline_name: str, activity_name: str = None, parameters: Dict = None,
+        self,
+        pipeline_name: str,
+        activity_name: str = None,
+        parameters: Dict = None,
+        timeout: float = None,
+        waiter: Waiter = None,
     ):
         """
         Wrapper to run pipeline and fetch activity results.
@@ -150,32 +301,41 @@ class ADFPipeline(AzureResourceBase):
             pipeline_name: Name of the pipeline to run
             activity_name: Optional specific activity name. If None, returns all activities.
             parameters: Optional dictionary of parameters to pass to the pipeline
+            timeout: Optional overall timeout in seconds for the run to finish
+            waiter: Optional Waiter controlling the polling schedule. Defaults to
+                1s initial delay doubling up to 30s
 
         Returns:
             Dictionary for specific activity or List of dictionaries for all activities
         """
         try:
-            # Create and run pipeline
-            self.create_run(pipeline_name, parameters)
+            # Create and run pipeline; the local handle keeps concurrent callers
+            # sharing this instance from clobbering each other's runs
+            run = self.create_run(pipeline_name, parameters)
 
-            # Wait for completion
+            # Wait for completion, polling quickly at first and backing off for long runs
             print("Waiting for pipeline to complete...")
-            while True:
-                status_result = self.check_status()
-                status = status_result.get("status")
-                print(f"Pipeline status: {status}")
-
-                if status in ["Succeeded", "Failed", "Cancelled"]:
-                    break
-
-                time.sleep(10)  # Wait 10 seconds before checking again
+            waiter = waiter or Waiter(
+                timeout=timeout,
+                on_progress=lambda attempt, elapsed, _: print(
+                    f"Pipeline status: {run.status} ({elapsed:.0f}s elapsed)"
+                ),
+            )
+            waiter.wait_until(
+                lambda: self.check_status(run).get("status") in TERMINAL_STATUSES,
+                description=f"pipeline run {run.run_id}",
+            )
+            status = run.status
+            print(f"Pipeline status: {status}")
 
             # Fetch activity results
             if status == "Succeeded":
-                return self.fetch_activity(activity_name)["output"]["resultSets"]
+                return self.fetch_activity(activity_name, run=run)["output"][
+                    "resultSets"
+                ]
             else:
                 raise Exception(f"Pipeline failed with status: {status}")
 
         except Exception as e:
             print(f"Error in run_and_fetch: {str(e)}")
-            raise 
\ No newline at end of file
+            raise
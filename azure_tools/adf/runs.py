@@ -0,0 +1,347 @@
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from ..auth import AzureAuthentication
+from ..client_registry import get_client_registry
+
+# Pipeline run statuses after which a run never changes again
+TERMINAL_STATUSES = {"Succeeded", "Failed", "Cancelled"}
+
+# Run IDs per query_by_factory request
+QUERY_BATCH_SIZE = 200
+
+# Slack added around the lastUpdated window to absorb clock skew
+QUERY_WINDOW_SLACK = timedelta(minutes=5)
+
+
+@dataclass(eq=False)
+class PipelineRunHandle:
+    """
+    Lightweight reference to one pipeline run.
+    Returned by ADFPipeline.create_run so each caller owns its run instead of
+    sharing a single run ID on the helper.
+    """
+
+    run_id: str
+    pipeline_name: str
+    resource_group_name: str
+    factory_name: str
+    subscription_id: str
+    status: Optional[str] = None
+    run_start: Optional[str] = None
+    run_end: Optional[str] = None
+    message: Optional[str] = None
+    last_checked: Optional[float] = None
+    created: float = field(default_factory=time.monotonic)
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+    @property
+    def factory_key(self) -> tuple:
+        """(subscription, resource group, factory) the run belongs to."""
+        return (self.subscription_id, self.resource_group_name, self.factory_name)
+
+    @property
+    def is_terminal(self) -> bool:
+        return self.status in TERMINAL_STATUSES
+
+    def update(self, run_details: Dict) -> None:
+        """
+        Cache the latest run details returned by the service.
+
+        Args:
+            run_details: Pipeline run as returned by as_dict()
+        """
+        self.status = run_details.get("status", self.status)
+        self.run_start = run_details.get("run_start", self.run_start)
+        self.run_end = run_details.get("run_end", self.run_end)
+        self.message = run_details.get("message", self.message)
+        self.last_checked = time.monotonic()
+
+    def __str__(self) -> str:
+        return self.run_id
+
+
+def _as_datetime(value) -> Optional[datetime]:
+    """Datetime of a run model attribute, or of its ISO string from as_dict()."""
+    if value is None or isinstance(value, datetime):
+        return value
+    parsed = datetime.fromisoformat(value)
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def activity_query_window(run_details: Dict) -> Tuple[datetime, datetime]:
+    """
+    lastUpdated window holding the activity runs of a pipeline run: its start to
+    its end (now while it is still running), widened by QUERY_WINDOW_SLACK.
+
+    Args:
+        run_details: Pipeline run as returned by as_dict() (ISO strings) or
+            a dict of datetimes
+
+    Returns:
+        (last_updated_after, last_updated_before)
+    """
+    now = datetime.now(timezone.utc)
+    run_start = _as_datetime(run_details.get("run_start")) or now
+    run_end = _as_datetime(run_details.get("run_end")) or now
+    return run_start - QUERY_WINDOW_SLACK, run_end + QUERY_WINDOW_SLACK
+
+
+def iter_run_query(query, filter_parameters, **kwargs) -> Iterator:
+    """
+    Yield the items of a pipeline/activity/trigger run query page by page,
+    following continuation tokens until the service reports no more pages.
+
+    Args:
+        query: Bound SDK method such as client.pipeline_runs.query_by_factory
+        filter_parameters: RunFilterParameters for the query. Its continuation_token is advanced in place
+        **kwargs: Remaining arguments of the query method (resource group, factory, run ID)
+
+    Yields:
+        Run model objects in the order the service returns them
+    """
+    while True:
+        response = query(filter_parameters=filter_parameters, **kwargs)
+        yield from response.value
+        if not response.continuation_token:
+            return
+        filter_parameters.continuation_token = response.continuation_token
+
+
+class PipelineRunMonitor:
+    """
+    Tracks many pipeline run handles across factories from one process.
+    Status is polled with one query_by_factory call per factory (not one GET
+    per run) by a single background poller, and results are fanned out to
+    every waiting caller. The polling interval grows with the age of the
+    youngest active run, so new runs are detected quickly and long runs
+    cost few requests.
+    """
+
+    def __init__(
+        self,
+        auth: AzureAuthentication = None,
+        max_workers: int = 16,
+        min_interval: float = 1.0,
+        max_interval: float = 60.0,
+    ):
+        """
+        Initialize the run monitor.
+
+        Args:
+            auth: Optional AzureAuthentication instance. If not provided, uses the shared instance
+            max_workers: Maximum number of factories queried concurrently
+            min_interval: Shortest delay between polls in seconds
+            max_interval: Longest delay between polls in seconds
+        """
+        self.auth = auth if auth is not None else AzureAuthentication.shared()
+        self.max_workers = max_workers
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self._handles: Dict[str, PipelineRunHandle] = {}
+        self._clients: Dict[str, object] = {}
+        self._lock = threading.Lock()
+        self._condition = threading.Condition()
+        self._poller: Optional[threading.Thread] = None
+        # Set when new handles are tracked, so the poller picks them up without
+        # finishing a long sleep first
+        self._wakeup = threading.Event()
+
+    def track(self, *handles: PipelineRunHandle) -> None:
+        """Start tracking the given run handles."""
+        with self._lock:
+            for handle in handles:
+                self._handles[handle.run_id] = handle
+        self._wakeup.set()
+
+    def untrack(self, *handles: PipelineRunHandle) -> None:
+        """Stop tracking the given run handles."""
+        with self._lock:
+            for handle in handles:
+                self._handles.pop(handle.run_id, None)
+
+    @property
+    def handles(self) -> List[PipelineRunHandle]:
+        with self._lock:
+            return list(self._handles.values())
+
+    def active_handles(self) -> List[PipelineRunHandle]:
+        """Tracked handles whose runs have not reached a terminal status."""
+        return [h for h in self.handles if not h.is_terminal]
+
+    def _client(self, subscription_id: str):
+        """Shared DataFactory client for a subscription, acquired once per monitor."""
+        with self._lock:
+            client = self._clients.get(subscription_id)
+            if client is None:
+                client = get_client_registry().acquire(
+                    "adf", subscription_id, self.auth.credential
+                )
+                self._clients[subscription_id] = client
+            return client
+
+    def close(self) -> None:
+        """Release the monitor's references on its shared clients."""
+        with self._lock:
+            subscriptions = list(self._clients)
+            self._clients.clear()
+        for subscription_id in subscriptions:
+            get_client_registry().release("adf", subscription_id, self.auth.credential)
+
+    def _query_factory(self, handles: List[PipelineRunHandle]) -> None:
+        """
+        Refresh all handles of one factory with batched query_by_factory calls.
+        ADF has no RunId filter operand; RunGroupId equals the run ID for runs
+        started through create_run, and anything the query misses (e.g. recovery
+        runs) falls back to an individual GET.
+        """
+        from azure.mgmt.datafactory.models import RunFilterParameters, RunQueryFilter
+
+        subscription_id, resource_group_name, factory_name = handles[0].factory_key
+        client = self._client(subscription_id)
+        by_id = {h.run_id: h for h in handles}
+        seen = set()
+        try:
+            for i in range(0, len(handles), QUERY_BATCH_SIZE):
+                batch = handles[i : i + QUERY_BATCH_SIZE]
+                filter_parameters = RunFilterParameters(
+                    last_updated_after=min(h.created_at for h in batch)
+                    - QUERY_WINDOW_SLACK,
+                    last_updated_before=datetime.now(timezone.utc) + QUERY_WINDOW_SLACK,
+                    filters=[
+                        RunQueryFilter(
+                            operand="RunGroupId",
+                            operator="In",
+                            values=[h.run_id for h in batch],
+                        )
+                    ],
+                )
+                for run in iter_run_query(
+                    client.pipeline_runs.query_by_factory,
+                    filter_parameters,
+                    resource_group_name=resource_group_name,
+                    factory_name=factory_name,
+                ):
+                    handle = by_id.get(run.run_id)
+                    if handle is not None:
+                        handle.update(run.as_dict())
+                        seen.add(run.run_id)
+        except Exception as e:
+            print(f"Error querying pipeline runs in {factory_name}: {str(e)}")
+            return
+
+        for run_id in by_id.keys() - seen:
+            handle = by_id[run_id]
+            try:
+                handle.update(
+                    client.pipeline_runs.get(
+                        resource_group_name=resource_group_name,
+                        factory_name=factory_name,
+                        run_id=run_id,
+                    ).as_dict()
+                )
+            except Exception as e:
+                print(f"Error getting pipeline run status for {run_id}: {str(e)}")
+
+    def refresh(self) -> List[PipelineRunHandle]:
+        """
+        Refresh the cached status of every active handle, one query per factory.
+
+        Returns:
+            Handles that reached a terminal status during this refresh
+        """
+        active = self.active_handles()
+        by_factory = defaultdict(list)
+        for handle in active:
+            by_factory[handle.factory_key].append(handle)
+        if by_factory:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                list(executor.map(self._query_factory, by_factory.values()))
+        with self._condition:
+            self._condition.notify_all()
+        return [h for h in active if h.is_terminal]
+
+    def next_interval(self) -> float:
+        """
+        Delay before the next poll, based on how long the youngest active run has been going.
+        """
+        active = self.active_handles()
+        if not active:
+            return self.max_interval
+        youngest_age = time.monotonic() - max(h.created for h in active)
+        return min(self.max_interval, max(self.min_interval, youngest_age / 10))
+
+    def _stop_if_idle(self) -> bool:
+        """
+        Clear the poller if no tracked run is active. The check and the clear
+        happen under the lock start() takes, so a handle tracked in between is
+        either seen here or gets a new poller from start().
+        """
+        with self._lock:
+            if any(not h.is_terminal for h in self._handles.values()):
+                return False
+            self._poller = None
+            return True
+
+    def _poll_loop(self) -> None:
+        while not self._stop_if_idle():
+            self._wakeup.clear()
+            self.refresh()
+            if self._stop_if_idle():
+                break
+            self._wakeup.wait(self.next_interval())
+        with self._condition:
+            self._condition.notify_all()
+
+    def start(self) -> None:
+        """Start the background poller if there are active runs and it is not running."""
+        with self._lock:
+            if self._poller is not None:
+                return
+            self._poller = threading.Thread(
+                target=self._poll_loop, name="pipeline-run-monitor", daemon=True
+            )
+            self._poller.start()
+
+    def wait(
+        self,
+        handles: Iterable[PipelineRunHandle] = None,
+        timeout: float = None,
+    ) -> List[PipelineRunHandle]:
+        """
+        Block until the given handles (default: all tracked) reach a terminal status.
+        Any number of threads can wait at once; they share the same poller.
+
+        Args:
+            handles: Handles to wait for. They are tracked if not already
+            timeout: Optional overall timeout in seconds
+
+        Returns:
+            The handles waited for
+
+        Raises:
+            TimeoutError: If the timeout expires before all runs finish
+        """
+        handles = list(handles) if handles is not None else self.handles
+        self.track(*handles)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while True:
+                pending = [h for h in handles if not h.is_terminal]
+                if not pending:
+                    return handles
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError(
+                        f"{len(pending)} pipeline runs still in progress after {timeout}s"
+                    )
+                self.start()
+                self._condition.wait(
+                    self.max_interval
+                    if remaining is None
+                    else min(remaining, self.max_interval)
+                )
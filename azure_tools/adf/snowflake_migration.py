@@ -0,0 +1,352 @@
+import copy
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+from ..auth import AzureAuthentication
+from .linked_services import (
+    SNOWFLAKE_TYPES,
+    ADFLinkedServices,
+    FactoryRef,
+    resolve_factories,
+    snowflake_host_pattern,
+)
+
+
+@dataclass
+class SnowflakeMigrationItem:
+    """One linked service that points at an account being migrated."""
+
+    subscription_id: str
+    resource_group_name: str
+    factory_name: str
+    linked_service_name: str
+    service_type: str
+    field: str
+    old_value: str
+    new_value: str
+    etag: Optional[str] = None
+
+    @property
+    def key(self) -> str:
+        """Stable identifier used in the progress file."""
+        return "/".join(
+            (
+                self.subscription_id,
+                self.resource_group_name,
+                self.factory_name,
+                self.linked_service_name,
+            )
+        )
+
+
+def rewrite_snowflake_account(
+    definition: Dict, fqdn_map: Dict[str, str]
+) -> Optional[Tuple[str, str, str]]:
+    """
+    Work out how a Snowflake linked service changes under an old->new account map.
+    V1 services are matched on the host in their connection string; V2 services
+    on their account identifier.
+
+    Args:
+        definition: Linked service resource in REST shape
+        fqdn_map: Mapping of old account FQDN to new account FQDN
+
+    Returns:
+        (field, old value, new value), or None if the service uses none of the old accounts
+    """
+    properties = definition.get("properties", {})
+    type_properties = properties.get("typeProperties", {})
+    if properties.get("type") == "Snowflake":
+        connection_string = type_properties.get("connectionString")
+        if not isinstance(connection_string, str):
+            # Connection strings kept in Key Vault cannot be rewritten here
+            return None
+        for old_fqdn, new_fqdn in fqdn_map.items():
+            new_connection_string = snowflake_host_pattern(old_fqdn).sub(
+                new_fqdn, connection_string
+            )
+            if new_connection_string != connection_string:
+                return "connectionString", connection_string, new_connection_string
+    else:
+        identifier = type_properties.get("accountIdentifier")
+        if not isinstance(identifier, str):
+            return None
+        for old_fqdn, new_fqdn in fqdn_map.items():
+            if identifier.lower() == old_fqdn.lower():
+                return "accountIdentifier", identifier, new_fqdn
+    return None
+
+
+class SnowflakeAccountMigration:
+    """
+    Moves Snowflake linked services from old to new accounts across many factories.
+    Discovery lists every factory concurrently, the plan is reviewed as one
+    dry run, and apply updates services with bounded parallelism. Each update is
+    conditional on the ETag seen at discovery, and finished items are recorded in
+    an optional JSON progress file so an interrupted run can be resumed. Apply is
+    refused while any factory could not be discovered, since the plan would be partial.
+    """
+
+    def __init__(
+        self,
+        factories: Iterable[FactoryRef],
+        fqdn_map: Dict[str, str],
+        subscription_id: str = None,
+        auth: AzureAuthentication = None,
+        max_workers: int = 16,
+        progress_path: str = None,
+    ):
+        """
+        Initialize the migration.
+
+        Args:
+            factories: Factories to migrate, as (resource_group, factory) or
+                (subscription_id, resource_group, factory) tuples
+            fqdn_map: Mapping of old account FQDN to new account FQDN
+            subscription_id: Subscription for factories given without one. If not provided,
+                resolved the same way as for the resource helpers
+            auth: Optional AzureAuthentication instance. If not provided, uses the shared instance
+            max_workers: Maximum number of concurrent discovery and update calls
+            progress_path: Optional JSON file recording finished items, used to resume.
+                A file written for a different fqdn_map is rejected
+        """
+        if not fqdn_map:
+            raise ValueError(
+                "fqdn_map must contain at least one old -> new account mapping"
+            )
+        self.factories = resolve_factories(factories, subscription_id)
+        self.fqdn_map = dict(fqdn_map)
+        self.auth = auth if auth is not None else AzureAuthentication.shared()
+        self.max_workers = max_workers
+        self.progress_path = progress_path
+        self.items: List[SnowflakeMigrationItem] = []
+        # Factories whose linked services could not be listed: "sub/rg/factory" -> error
+        self.failed_factories: Dict[str, str] = {}
+        self._discovered = False
+        self._progress = self._load_progress()
+        self._progress_lock = threading.Lock()
+
+    def _helper(self, factory: Tuple[str, str, str]) -> ADFLinkedServices:
+        subscription_id, resource_group_name, factory_name = factory
+        return ADFLinkedServices(
+            resource_group_name=resource_group_name,
+            resource_name=factory_name,
+            subscription_id=subscription_id,
+            auth=self.auth,
+        )
+
+    def _discover_factory(
+        self, factory: Tuple[str, str, str]
+    ) -> List[SnowflakeMigrationItem]:
+        subscription_id, resource_group_name, factory_name = factory
+        items = []
+        with self._helper(factory) as helper:
+            # The list call fills the definition cache, so the detail lookups below are local
+            for service in helper.list_linked_services(
+                filter_by_type=list(SNOWFLAKE_TYPES)
+            ):
+                definition = helper.get_linked_service_details(service["name"])
+                change = rewrite_snowflake_account(definition, self.fqdn_map)
+                if change is None:
+                    continue
+                field, old_value, new_value = change
+                items.append(
+                    SnowflakeMigrationItem(
+                        subscription_id=subscription_id,
+                        resource_group_name=resource_group_name,
+                        factory_name=factory_name,
+                        linked_service_name=service["name"],
+                        service_type=definition["properties"]["type"],
+                        field=field,
+                        old_value=old_value,
+                        new_value=new_value,
+                        etag=definition.get("etag"),
+                    )
+                )
+        return items
+
+    def discover(self) -> List[SnowflakeMigrationItem]:
+        """
+        Find every Snowflake linked service that uses one of the old accounts.
+        Factories are listed concurrently; a factory that fails is reported and
+        recorded in failed_factories, and apply() refuses to run until it is discovered.
+
+        Returns:
+            Items to migrate, ordered by factory and linked service name
+        """
+        items = []
+        failed = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(self._discover_factory, f): f for f in self.factories
+            }
+            for future in as_completed(futures):
+                factory = futures[future]
+                try:
+                    items.extend(future.result())
+                except Exception as e:
+                    print(
+                        f"Error discovering linked services in {factory[2]}: {str(e)}"
+                    )
+                    failed["/".join(factory)] = str(e)
+        items.sort(key=lambda item: item.key)
+        self.items = items
+        self.failed_factories = dict(sorted(failed.items()))
+        self._discovered = True
+        print(
+            f"Found {len(items)} Snowflake linked services to migrate in "
+            f"{len(self.factories) - len(failed)} of {len(self.factories)} factories"
+        )
+        if failed:
+            print(
+                f"WARNING: {len(failed)} factories could not be discovered; "
+                "the plan is incomplete"
+            )
+        return items
+
+    def plan(self) -> Dict:
+        """
+        Build the consolidated dry-run plan, discovering first if needed.
+        Items already recorded as updated in the progress file are listed as done.
+
+        Returns:
+            Dictionary with 'pending', 'done', per-factory counts and
+            'failed_factories' (factories that could not be discovered, with the error)
+        """
+        if not self._discovered:
+            self.discover()
+        pending = [item for item in self.items if not self._is_done(item)]
+        by_factory: Dict[str, int] = {}
+        for item in pending:
+            by_factory[item.factory_name] = by_factory.get(item.factory_name, 0) + 1
+        return {
+            "pending": [asdict(item) for item in pending],
+            "done": [item.key for item in self.items if self._is_done(item)],
+            "by_factory": by_factory,
+            "failed_factories": dict(self.failed_factories),
+        }
+
+    def print_plan(self, plan: Dict = None) -> None:
+        plan = plan or self.plan()
+        if plan["failed_factories"]:
+            print(
+                f"INCOMPLETE PLAN: {len(plan['failed_factories'])} factories could not "
+                "be discovered and are not included:"
+            )
+            for factory, error in plan["failed_factories"].items():
+                print(f"  {factory}: {error}")
+        print(
+            f"What if: Would update {len(plan['pending'])} linked services ({len(plan['done'])} already done)"
+        )
+        for item in plan["pending"]:
+            print(
+                f"  {item['factory_name']}/{item['linked_service_name']} ({item['service_type']}) "
+                f"{item['field']}: {item['old_value']} -> {item['new_value']}"
+            )
+
+    def _apply_item(self, item: SnowflakeMigrationItem) -> Dict:
+        started = time.monotonic()
+        result = {
+            "key": item.key,
+            "status": "updated",
+            "new_value": item.new_value,
+            "error": None,
+        }
+        try:
+            with self._helper(
+                (item.subscription_id, item.resource_group_name, item.factory_name)
+            ) as helper:
+                definition = copy.deepcopy(
+                    helper.get_linked_service_details(item.linked_service_name)
+                )
+                definition["properties"]["typeProperties"][item.field] = item.new_value
+                helper.put_linked_service(
+                    item.linked_service_name, definition, if_match=item.etag
+                )
+        except Exception as e:
+            result.update(status="failed", error=str(e))
+        result["seconds"] = round(time.monotonic() - started, 3)
+        self._record(result)
+        return result
+
+    def apply(
+        self, dry_run: bool = True, allow_partial: bool = False
+    ) -> Union[Dict, List[Dict]]:
+        """
+        Apply the plan with up to max_workers concurrent updates.
+
+        Args:
+            dry_run: If True, only print the consolidated plan
+            allow_partial: If True, apply even though some factories could not be discovered
+
+        Returns:
+            The plan when dry_run is True, otherwise one result per pending item
+            with 'key', 'status' ('updated' or 'failed'), 'new_value', 'error' and 'seconds'
+
+        Raises:
+            RuntimeError: If any factory could not be discovered and allow_partial is False
+        """
+        plan = self.plan()
+        if dry_run:
+            self.print_plan(plan)
+            return plan
+        if self.failed_factories and not allow_partial:
+            raise RuntimeError(
+                f"{len(self.failed_factories)} factories could not be discovered "
+                f"({', '.join(self.failed_factories)}); run discover() again or "
+                "pass allow_partial=True to migrate the rest"
+            )
+
+        pending = [item for item in self.items if not self._is_done(item)]
+        print(
+            f"Updating {len(pending)} linked services with {self.max_workers} workers"
+        )
+        started = time.monotonic()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = list(executor.map(self._apply_item, pending))
+        failed = [r for r in results if r["status"] == "failed"]
+        print(
+            f"Updated {len(results) - len(failed)} linked services, {len(failed)} failed "
+            f"in {time.monotonic() - started:.1f}s"
+        )
+        for result in failed:
+            print(f"  {result['key']}: {result['error']}")
+        return results
+
+    def _is_done(self, item: SnowflakeMigrationItem) -> bool:
+        recorded = self._progress.get(item.key, {})
+        return (
+            recorded.get("status") == "updated"
+            and recorded.get("new_value", item.new_value) == item.new_value
+        )
+
+    def _load_progress(self) -> Dict[str, Dict]:
+        if not self.progress_path or not os.path.exists(self.progress_path):
+            return {}
+        with open(self.progress_path, encoding="utf-8") as f:
+            progress = json.load(f)
+        if progress.get("fqdn_map") != self.fqdn_map:
+            message = (
+                f"Progress file {self.progress_path} was written for a different "
+                f"fqdn_map ({progress.get('fqdn_map')}); use a new progress file"
+            )
+            print(f"Error loading migration progress: {message}")
+            raise ValueError(message)
+        return progress.get("items", {})
+
+    def _record(self, result: Dict) -> None:
+        """Record one result and rewrite the progress file atomically."""
+        with self._progress_lock:
+            self._progress[result["key"]] = result
+            if not self.progress_path:
+                return
+            tmp_path = f"{self.progress_path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"fqdn_map": self.fqdn_map, "items": self._progress}, f, indent=2
+                )
+            os.replace(tmp_path, self.progress_path)
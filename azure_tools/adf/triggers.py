@@ -1,4 +1,6 @@
-from typing import List, Union
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Union
 from datetime import datetime
 from ..base import AzureResourceBase
 from ..auth import AzureAuthentication
@@ -19,7 +21,7 @@ class ADFTrigger(AzureResourceBase):
             resource_group_name: Name of the resource group
             resource_name: Name of the Azure Data Factory
             subscription_id: Azure subscription ID. If not provided, will be retrieved from Azure CLI
-            auth: Optional AzureAuthentication instance. If not provided, creates a new one
+            auth: Optional AzureAuthentication instance. If not provided, uses the shared instance
         """
         super().__init__(
             resource_group_name=resource_group_name,
@@ -127,12 +129,21 @@ class ADFTrigger(AzureResourceBase):
             print(f"Error managing trigger {trigger_name}: {str(e)}")
             raise
 
-    def manage_all_triggers(self, action: str) -> None:
+    def manage_all_triggers(
+        self, action: str, concurrent: bool = False, max_workers: int = 16
+    ) -> Optional[Dict]:
         """
         Manage all triggers in the Data Factory (start/stop).
 
         Args:
             action: Action to perform ('start' or 'stop')
+            concurrent: If True, reuse the runtime state returned by list_triggers and
+                run all start/stop operations in parallel instead of one by one
+            max_workers: Maximum number of start/stop operations in flight when concurrent
+
+        Returns:
+            None in sequential mode. In concurrent mode, a dict with per-trigger
+            results and the total wall-clock time in seconds
         """
         try:
             print(
@@ -140,6 +151,9 @@ class ADFTrigger(AzureResourceBase):
             )
             triggers = self.list_triggers()
 
+            if concurrent:
+                return self._manage_triggers_concurrently(triggers, action, max_workers)
+
             for trigger in triggers:
                 print(
                     f"Working on {trigger.name} under {self.resource_group_name}/{self.resource_name}..."
@@ -150,6 +164,69 @@ class ADFTrigger(AzureResourceBase):
             print(f"Error managing all triggers: {str(e)}")
             raise
 
+    def _manage_triggers_concurrently(
+        self, triggers: List, action: str, max_workers: int
+    ) -> Dict:
+        """
+        Start or stop the given triggers in parallel with a bounded window.
+        Triggers already in the desired state are skipped without a call.
+        """
+        if action not in ("start", "stop"):
+            raise ValueError(f"Invalid action: {action}. Must be 'start' or 'stop'")
+
+        started = time.perf_counter()
+        from_state = "Stopped" if action == "start" else "Started"
+        pending = [t for t in triggers if t.properties.runtime_state == from_state]
+        results = [
+            {"trigger": t.name, "status": "skipped", "seconds": 0.0, "error": None}
+            for t in triggers
+            if t.properties.runtime_state != from_state
+        ]
+
+        print(
+            f"{len(pending)} triggers to {action}, {len(results)} already in the desired state"
+        )
+        if pending:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results.extend(
+                    executor.map(
+                        lambda trigger: self._run_trigger_action(trigger.name, action),
+                        pending,
+                    )
+                )
+
+        elapsed = time.perf_counter() - started
+        failed = [r for r in results if r["status"] == "failed"]
+        print(
+            f"Finished {action} for {len(pending)} triggers in {elapsed:.1f}s "
+            f"({len(failed)} failed)"
+        )
+        return {"action": action, "results": results, "elapsed_seconds": elapsed}
+
+    def _run_trigger_action(self, trigger_name: str, action: str) -> Dict:
+        """
+        Run one start/stop long-running operation and time it.
+        Errors are captured in the result instead of raised.
+        """
+        started = time.perf_counter()
+        begin = (
+            self.client.triggers.begin_start
+            if action == "start"
+            else self.client.triggers.begin_stop
+        )
+        try:
+            begin(self.resource_group_name, self.resource_name, trigger_name).result()
+            status, error = "succeeded", None
+        except Exception as e:
+            print(f"Error managing trigger {trigger_name}: {str(e)}")
+            status, error = "failed", str(e)
+        return {
+            "trigger": trigger_name,
+            "status": status,
+            "seconds": time.perf_counter() - started,
+            "error": error,
+        }
+
     def reset_tumbling_with_start_time(
         self, trigger_name: str, new_start_time: Union[str, datetime]
     ) -> None:
@@ -212,7 +289,10 @@ class ADFTrigger(AzureResourceBase):
             # Recreate the trigger with updated start time
             print(f"Recreating trigger {trigger_name} with new start time...")
             self.client.triggers.create_or_update(
-                self.resource_group_name, self.resource_name, trigger_name, trigger_obj,
+                self.resource_group_name,
+                self.resource_name,
+                trigger_name,
+                trigger_obj,
             )
 
             # Restore original state if it was running
@@ -226,4 +306,4 @@ class ADFTrigger(AzureResourceBase):
 
         except Exception as e:
             print(f"Error resetting trigger start time: {str(e)}")
-            raise 
\ No newline at end of file
+            raise
@@ -0,0 +1,38 @@
+"""
+Azure Tools Async Package
+
+Asyncio variants of the azure_tools resource helpers, built on the
+azure.mgmt.*.aio clients and azure.identity.aio credentials. Method names
+and arguments match the synchronous helpers; every operation is a coroutine.
+"""
+
+from .auth import AzureAuthentication
+from .base import AzureResourceBase
+from .client_registry import AsyncClientRegistry, get_async_client_registry
+from .batch import AzureBatchPool
+from .keyvault import AzureKeyVault
+from .locks import AzureResourceLock
+from .lock_window import UnlockedWindow
+from .adf import (
+    ADFLinkedServices,
+    ADFIntegrationRuntime,
+    ADFManagedPrivateEndpoint,
+    ADFTrigger,
+    ADFPipeline,
+)
+
+__all__ = [
+    "AzureAuthentication",
+    "AzureResourceBase",
+    "AsyncClientRegistry",
+    "get_async_client_registry",
+    "AzureBatchPool",
+    "AzureKeyVault",
+    "AzureResourceLock",
+    "UnlockedWindow",
+    "ADFLinkedServices",
+    "ADFIntegrationRuntime",
+    "ADFManagedPrivateEndpoint",
+    "ADFTrigger",
+    "ADFPipeline",
+]
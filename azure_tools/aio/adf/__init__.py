@@ -0,0 +1,24 @@
+"""
+Async Azure Data Factory Module
+
+Asyncio counterparts of the azure_tools.adf helpers:
+- Linked Services
+- Integration Runtimes
+- Managed Private Endpoints
+- Triggers
+- Pipelines
+"""
+
+from .linked_services import ADFLinkedServices
+from .integration_runtime import ADFIntegrationRuntime
+from .managed_pe import ADFManagedPrivateEndpoint
+from .triggers import ADFTrigger
+from .pipelines import ADFPipeline
+
+__all__ = [
+    "ADFLinkedServices",
+    "ADFIntegrationRuntime",
+    "ADFManagedPrivateEndpoint",
+    "ADFTrigger",
+    "ADFPipeline",
+]
@@ -0,0 +1,123 @@
+from ..base import AzureResourceBase
+from ..auth import AzureAuthentication
+from ...waiters import Waiter
+
+
+class ADFIntegrationRuntime(AzureResourceBase):
+    def __init__(
+        self,
+        resource_group_name: str,
+        resource_name: str,
+        subscription_id: str = None,
+        auth: AzureAuthentication = None,
+    ):
+        """
+        Initialize async ADF Integration Runtime resource.
+
+        Args:
+            resource_group_name: Name of the resource group
+            resource_name: Name of the Azure Data Factory
+            subscription_id: Azure subscription ID. If not provided, will be retrieved from Azure CLI
+            auth: Optional async AzureAuthentication instance. If not provided, uses the shared instance
+        """
+        super().__init__(
+            resource_group_name=resource_group_name,
+            resource_name=resource_name,
+            resource_type="adf",
+            subscription_id=subscription_id,
+            auth=auth,
+        )
+
+    def _ir_resource_id(self, ir_name):
+        return f"subscriptions/{self.subscription_id}/resourcegroups/{self.resource_group_name}/providers/Microsoft.DataFactory/factories/{self.resource_name}/integrationruntimes/{ir_name}"
+
+    async def get_ir(self, ir_name):
+        """
+        Get the details of an integration runtime
+        Returns the JSON response from the API
+        """
+        try:
+            api_url = f"https://management.azure.com/{self._ir_resource_id(ir_name)}/getStatus?api-version=2018-06-01"
+            return await self._send_arm_request("POST", api_url)
+        except Exception as e:
+            print(f"Error getting integration runtime details: {str(e)}")
+            raise
+
+    async def get_ir_status(self, ir_name):
+        """
+        Get the status of an integration runtime
+        Returns True if interactive authoring is enabled, False otherwise
+        """
+        try:
+            status_data = await self.get_ir(ir_name)
+            interactive_status = (
+                status_data.get("properties", {})
+                .get("typeProperties", {})
+                .get("interactiveQuery", {})
+                .get("status")
+            )
+            return interactive_status == "Enabled"
+        except Exception as e:
+            print(f"Error getting integration runtime status: {str(e)}")
+            raise
+
+    async def get_ir_type(self, ir_name):
+        """
+        Get the type of an integration runtime
+        Returns the type as a string (e.g., "Managed", "SelfHosted", etc.)
+        """
+        try:
+            ir_details = await self.get_ir(ir_name)
+            ir_type = ir_details.get("properties", {}).get("type", None)
+
+            if ir_type is None:
+                raise ValueError(f"Integration runtime type not found for {ir_name}")
+
+            return ir_type
+        except Exception as e:
+            print(f"Error getting integration runtime type: {str(e)}")
+            raise
+
+    async def enable_interactive_authoring(
+        self, ir_name, minutes=10, timeout: float = 600, waiter: Waiter = None
+    ):
+        """
+        Enable interactive authoring for the specified integration runtime.
+        Only works for Managed integration runtimes.
+
+        Args:
+            ir_name: Name of the integration runtime
+            minutes: Minutes before interactive authoring is turned off again
+            timeout: Seconds to wait for interactive authoring to become enabled
+            waiter: Optional Waiter controlling the polling schedule
+        """
+        ir_type = await self.get_ir_type(ir_name)
+        if ir_type != "Managed":
+            print(
+                f"Interactive authoring is only supported for Managed integration runtimes. Current type: {ir_type}"
+            )
+            return
+
+        if await self.get_ir_status(ir_name):
+            print(
+                f"Interactive authoring is already enabled for integration runtime {ir_name}"
+            )
+            return
+
+        api_url = f"https://management.azure.com/{self._ir_resource_id(ir_name)}/enableInteractiveQuery?api-version=2018-06-01"
+        await self._send_arm_request(
+            "POST", api_url, json={"autoTerminationMinutes": minutes}
+        )
+
+        print(f"Successfully triggered interactive authoring for {minutes} minutes")
+        waiter = waiter or Waiter(
+            timeout=timeout,
+            on_progress=lambda *_: print(
+                "Waiting for interactive authoring to be enabled..."
+            ),
+        )
+        await waiter.async_wait_until(
+            lambda: self.get_ir_status(ir_name),
+            description=f"interactive authoring on {ir_name}",
+        )
+        print("Interactive authoring is now enabled")
@@ -0,0 +1,311 @@
+import copy
+import json
+from typing import AsyncIterator, List, Dict, Optional, Sequence, Union
+from ..base import AzureResourceBase
+from ..auth import AzureAuthentication
+from ...adf.linked_service_cache import (
+    LinkedServiceCache,
+    LinkedServiceIndex,
+    get_linked_service_cache,
+)
+from ...adf.linked_services import (
+    linked_service_record,
+    project_linked_service,
+    snowflake_host_pattern,
+)
+
+
+class ADFLinkedServices(AzureResourceBase):
+    def __init__(
+        self,
+        resource_group_name: str,
+        resource_name: str,
+        subscription_id: str = None,
+        auth: AzureAuthentication = None,
+        cache: LinkedServiceCache = None,
+    ):
+        """
+        Initialize async ADF Linked Services resource.
+
+        Args:
+            resource_group_name: Name of the resource group
+            resource_name: Name of the Azure Data Factory
+            subscription_id: Azure subscription ID. If not provided, will be retrieved from Azure CLI
+            auth: Optional async AzureAuthentication instance. If not provided, uses the shared instance
+            cache: Optional LinkedServiceCache. If not provided, uses the process-wide cache
+        """
+        super().__init__(
+            resource_group_name=resource_group_name,
+            resource_name=resource_name,
+            resource_type="adf",
+            subscription_id=subscription_id,
+            auth=auth,
+        )
+        self.cache = cache if cache is not None else get_linked_service_cache()
+
+    @property
+    def factory_key(self) -> tuple:
+        """(subscription, resource group, factory) used as the cache key."""
+        return (self.subscription_id, self.resource_group_name, self.resource_name)
+
+    async def list_linked_services(
+        self,
+        filter_by_type: Union[str, List[str]] = None,
+        projection: Sequence[str] = None,
+    ) -> List[Dict]:
+        """
+        List all linked services in the Azure Data Factory.
+
+        Args:
+            filter_by_type: Optional linked service type or list of types to keep
+            projection: Optional field paths to return, e.g. ["name", "properties.type"].
+                Without it each service is returned in full and its definition is cached
+
+        Returns:
+            List of linked service dictionaries
+        """
+        return [
+            service
+            async for service in self._iter_linked_services(
+                filter_by_type, projection, cache_definitions=projection is None
+            )
+        ]
+
+    async def iter_linked_services(
+        self,
+        filter_by_type: Union[str, List[str]] = None,
+        projection: Sequence[str] = None,
+    ) -> AsyncIterator[Dict]:
+        """
+        Stream linked services page by page without holding the whole listing.
+
+        Args:
+            filter_by_type: Optional linked service type or list of types to keep
+            projection: Optional field paths to return, e.g. ["name", "properties.type"]
+
+        Yields:
+            Linked service dictionaries
+        """
+        async for service in self._iter_linked_services(filter_by_type, projection):
+            yield service
+
+    async def _iter_linked_services(
+        self,
+        filter_by_type: Union[str, List[str]] = None,
+        projection: Sequence[str] = None,
+        cache_definitions: bool = False,
+    ) -> AsyncIterator[Dict]:
+        try:
+            types = (
+                [filter_by_type] if isinstance(filter_by_type, str) else filter_by_type
+            )
+            records = []
+            async for service in self.client.linked_services.list_by_factory(
+                resource_group_name=self.resource_group_name,
+                factory_name=self.resource_name,
+            ):
+                records.append(linked_service_record(service))
+                if cache_definitions:
+                    self.cache.put(
+                        self.factory_key, service.serialize(keep_readonly=True)
+                    )
+                if types and service.properties.type not in types:
+                    continue
+                if projection is None:
+                    yield service.as_dict()
+                else:
+                    yield project_linked_service(service, projection)
+
+            self.cache.put_index(self.factory_key, records)
+
+        except Exception as e:
+            print(f"Error listing linked services: {str(e)}")
+            raise
+
+    async def get_linked_service_index(
+        self, refresh: bool = False
+    ) -> LinkedServiceIndex:
+        """
+        Get the factory's compact index of linked services (name -> record, type -> names).
+
+        Args:
+            refresh: If True, always rebuild the index
+
+        Returns:
+            LinkedServiceIndex for this factory
+        """
+        index = None if refresh else self.cache.get_index(self.factory_key)
+        if index is None:
+            async for _ in self._iter_linked_services(projection=()):
+                pass
+            index = self.cache.get_index(self.factory_key)
+        return index
+
+    async def list_linked_service_names(
+        self, filter_by_type: Union[str, List[str]] = None
+    ) -> List[str]:
+        """
+        Names of the factory's linked services, optionally of a type or list of types,
+        served from the index.
+        """
+        return (await self.get_linked_service_index()).names(filter_by_type)
+
+    async def get_linked_service_details(
+        self, linked_service_name, use_cache: bool = True
+    ):
+        """
+        Get the details of a linked service using API calls.
+        Definitions cached within the TTL are returned without a call.
+
+        Args:
+            linked_service_name: Name of the linked service
+            use_cache: If False, always fetch the definition from the service
+        """
+        try:
+            cached = (
+                self.cache.get(self.factory_key, linked_service_name)
+                if use_cache
+                else None
+            )
+            if cached is not None and cached.is_fresh(self.cache.ttl):
+                return copy.deepcopy(cached.definition)
+
+            api_url = f"https://management.azure.com/subscriptions/{self.subscription_id}/resourcegroups/{self.resource_group_name}/providers/Microsoft.DataFactory/factories/{self.resource_name}/linkedservices/{linked_service_name}?api-version=2018-06-01"
+            return self.cache.put(
+                self.factory_key, await self._send_arm_request("GET", api_url)
+            )
+        except Exception as e:
+            print(f"Error getting linked service details: {str(e)}")
+            raise
+
+    async def update_linked_service_sf_account(
+        self,
+        linked_service_name: str,
+        old_fqdn: str,
+        new_fqdn: str,
+        dry_run: bool = True,
+    ) -> Dict:
+        """
+        Update the Snowflake account FQDN in a linked service.
+        The update is conditional on the ETag of the definition it was built from,
+        so it fails with 412 if the service was changed since that was read.
+        """
+        try:
+            linked_service = await self.get_linked_service_details(linked_service_name)
+
+            service_type = linked_service.get("properties", {}).get("type")
+            print(
+                f"\nUpdating {service_type} Linked Service {linked_service_name} from {old_fqdn} to {new_fqdn}"
+            )
+
+            if service_type == "Snowflake":
+                # For Snowflake V1
+                connection_string = linked_service["properties"]["typeProperties"][
+                    "connectionString"
+                ]
+                new_connection_string = snowflake_host_pattern(old_fqdn).sub(
+                    new_fqdn, connection_string
+                )
+                if new_connection_string == connection_string:
+                    print(
+                        f"Warning: Could not find exact match for '{old_fqdn}' in connection string"
+                    )
+                    return
+                print(f"New ConnectionString: {new_connection_string}")
+                linked_service["properties"]["typeProperties"][
+                    "connectionString"
+                ] = new_connection_string
+
+            else:
+                # For Snowflake V2
+                current_identifier = linked_service["properties"]["typeProperties"][
+                    "accountIdentifier"
+                ]
+                if new_fqdn == current_identifier:
+                    print(
+                        f"Warning: Could not find exact match for '{old_fqdn}' in account identifier"
+                    )
+                    return
+                linked_service["properties"]["typeProperties"][
+                    "accountIdentifier"
+                ] = new_fqdn
+
+            if dry_run:
+                print(f"What if: Would update linked service {linked_service_name}")
+                print("New configuration:")
+                print(json.dumps(linked_service, indent=2))
+                return
+
+            # The definition may come from the cache, so the update is conditional on
+            # its ETag: an edit made elsewhere since then fails with 412 instead of
+            # being overwritten
+            response = await self.put_linked_service(
+                linked_service_name, linked_service, if_match=linked_service.get("etag")
+            )
+
+            print(f"Successfully updated linked service: {linked_service_name}")
+            return response
+
+        except Exception as e:
+            print(f"Error updating linked service: {str(e)}")
+            raise
+
+    async def put_linked_service(
+        self,
+        linked_service_name: str,
+        linked_service: Dict,
+        if_match: Optional[str] = None,
+    ) -> Dict:
+        """
+        Create or update a linked service and drop its cached definition.
+
+        Args:
+            linked_service_name: Name of the linked service
+            linked_service: Linked service resource in REST shape
+            if_match: Optional ETag; the update fails with 412 if the service changed since
+
+        Returns:
+            The updated linked service as a dictionary
+        """
+        try:
+            response = await self.client.linked_services.create_or_update(
+                resource_group_name=self.resource_group_name,
+                factory_name=self.resource_name,
+                linked_service_name=linked_service_name,
+                linked_service=linked_service,
+                if_match=if_match,
+            )
+            return response.as_dict()
+        finally:
+            self.cache.invalidate(self.factory_key, linked_service_name)
+
+    async def test_linked_service_connection(
+        self, linked_service_name, parameters=None
+    ):
+        """
+        Test the connection of a linked service
+        """
+        try:
+            linked_service = await self.get_linked_service_details(linked_service_name)
+
+            if parameters:
+                linked_service["properties"]["parameters"] = parameters
+
+            body = {"linkedService": linked_service}
+            api_url = f"https://management.azure.com/subscriptions/{self.subscription_id}/resourcegroups/{self.resource_group_name}/providers/Microsoft.DataFactory/factories/{self.resource_name}/testConnectivity?api-version=2018-06-01"
+
+            print("Testing linked service connection with the following configuration:")
+            print(json.dumps(body, indent=2))
+
+            result = await self._send_arm_request("POST", api_url, json=body)
+            if result.get("succeeded"):
+                print("Linked service connection test successful")
+            else:
+                print(
+                    f"Linked service connection test failed: {result.get('errors', [{}])[0].get('message', 'Unknown error')}"
+                )
+
+            return result
+        except Exception as e:
+            print(f"Error testing linked service connection: {str(e)}")
+            raise
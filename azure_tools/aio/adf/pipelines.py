@@ -0,0 +1,270 @@
+from typing import AsyncIterator, Dict, Union, List
+from ..base import AzureResourceBase
+from ..auth import AzureAuthentication
+from ...adf.runs import TERMINAL_STATUSES, PipelineRunHandle, activity_query_window
+from ...waiters import Waiter
+
+
+class ADFPipeline(AzureResourceBase):
+    def __init__(
+        self,
+        resource_group_name: str,
+        resource_name: str,
+        subscription_id: str = None,
+        auth: AzureAuthentication = None,
+    ):
+        """
+        Initialize async Azure Data Factory Pipeline operations.
+
+        Args:
+            resource_group_name: Name of the resource group
+            resource_name: Name of the ADF factory
+            subscription_id: Azure subscription ID. If not provided, will be retrieved from Azure CLI
+            auth: Optional async AzureAuthentication instance. If not provided, uses the shared instance
+        """
+        super().__init__(
+            resource_group_name=resource_group_name,
+            resource_name=resource_name,
+            resource_type="adf",
+            subscription_id=subscription_id,
+            auth=auth,
+        )
+        # Most recent run started by this instance, kept for callers that
+        # use check_status()/fetch_activity() without passing a run
+        self.run_id = None
+
+    async def create_run(
+        self, pipeline_name: str, parameters: Dict = None
+    ) -> PipelineRunHandle:
+        """
+        Create a pipeline run and return a handle that tracks it.
+
+        Args:
+            pipeline_name: Name of the pipeline to run
+            parameters: Optional dictionary of parameters to pass to the pipeline
+
+        Returns:
+            PipelineRunHandle for the new run (str() of it is the run ID)
+        """
+        try:
+            print(f"Starting pipeline: {pipeline_name}")
+            run_response = await self.client.pipelines.create_run(
+                resource_group_name=self.resource_group_name,
+                factory_name=self.resource_name,
+                pipeline_name=pipeline_name,
+                parameters=parameters or {},
+            )
+
+            self.run_id = run_response.run_id
+            return PipelineRunHandle(
+                run_id=run_response.run_id,
+                pipeline_name=pipeline_name,
+                resource_group_name=self.resource_group_name,
+                factory_name=self.resource_name,
+                subscription_id=self.subscription_id,
+            )
+
+        except Exception as e:
+            print(f"Error starting pipeline {pipeline_name}: {str(e)}")
+            raise
+
+    def _resolve_run(self, run: Union[PipelineRunHandle, str, None]) -> str:
+        """Get the run ID for a handle, a run ID, or the last run of this instance."""
+        run_id = (
+            run.run_id if isinstance(run, PipelineRunHandle) else run or self.run_id
+        )
+        if not run_id:
+            raise ValueError("No active pipeline run. Call create_run() first.")
+        return run_id
+
+    async def check_status(self, run: Union[PipelineRunHandle, str] = None) -> Dict:
+        """
+        Check the status of a pipeline run.
+
+        Args:
+            run: Run handle or run ID. Defaults to the last run created by this instance.
+                A handle's cached status is updated with the result
+
+        Returns:
+            Dictionary containing pipeline run details including status
+        """
+        run_id = None
+        try:
+            run_id = self._resolve_run(run)
+
+            run_details = (
+                await self.client.pipeline_runs.get(
+                    resource_group_name=self.resource_group_name,
+                    factory_name=self.resource_name,
+                    run_id=run_id,
+                )
+            ).as_dict()
+            if isinstance(run, PipelineRunHandle):
+                run.update(run_details)
+            return run_details
+
+        except Exception as e:
+            print(f"Error getting pipeline run status for {run_id}: {str(e)}")
+            raise
+
+    async def iter_activity_runs(
+        self,
+        run: Union[PipelineRunHandle, str] = None,
+        activity_name: str = None,
+        status: Union[str, List[str]] = None,
+    ) -> AsyncIterator[Dict]:
+        """
+        Stream the activity runs of a pipeline run, following continuation tokens.
+        Filters are applied server-side, and runs are yielded as each page arrives.
+
+        Args:
+            run: Run handle or run ID. Defaults to the last run created by this instance
+            activity_name: Optional activity name to filter on
+            status: Optional activity status or list of statuses to filter on
+
+        Yields:
+            Dictionaries of activity run details
+        """
+        run_details = await self.check_status(run)
+        async for activity in self._iter_activity_runs(
+            self._resolve_run(run), run_details, activity_name, status
+        ):
+            yield activity
+
+    async def _iter_activity_runs(
+        self,
+        run_id: str,
+        run_details: Dict,
+        activity_name: str = None,
+        status: Union[str, List[str]] = None,
+    ) -> AsyncIterator[Dict]:
+        from azure.mgmt.datafactory.models import RunFilterParameters, RunQueryFilter
+
+        last_updated_after, last_updated_before = activity_query_window(run_details)
+        filters = []
+        if activity_name:
+            filters.append(
+                RunQueryFilter(
+                    operand="ActivityName", operator="Equals", values=[activity_name]
+                )
+            )
+        if status:
+            filters.append(
+                RunQueryFilter(
+                    operand="Status",
+                    operator="In",
+                    values=[status] if isinstance(status, str) else list(status),
+                )
+            )
+        filter_parameters = RunFilterParameters(
+            last_updated_after=last_updated_after,
+            last_updated_before=last_updated_before,
+            filters=filters or None,
+        )
+        while True:
+            response = await self.client.activity_runs.query_by_pipeline_run(
+                resource_group_name=self.resource_group_name,
+                factory_name=self.resource_name,
+                run_id=run_id,
+                filter_parameters=filter_parameters,
+            )
+            for activity_run in response.value:
+                yield activity_run.as_dict()
+            if not response.continuation_token:
+                return
+            filter_parameters.continuation_token = response.continuation_token
+
+    async def fetch_activity(
+        self, activity_name: str = None, run: Union[PipelineRunHandle, str] = None
+    ) -> Union[Dict, List[Dict]]:
+        """
+        Fetch activity results after pipeline run is successful.
+        All pages of activity runs are read; use iter_activity_runs to stream them instead.
+
+        Args:
+            activity_name: Optional specific activity name. If None, returns all activities.
+            run: Run handle or run ID. Defaults to the last run created by this instance
+
+        Returns:
+            Dictionary for specific activity or List of dictionaries for all activities
+        """
+        try:
+            run_id = self._resolve_run(run)
+
+            status_result = await self.check_status(run)
+            if status_result.get("status") != "Succeeded":
+                print(
+                    f"Warning: Pipeline status is {status_result.get('status')}, not 'Succeeded'"
+                )
+
+            activities = self._iter_activity_runs(
+                run_id, status_result, activity_name=activity_name
+            )
+
+            if activity_name is None:
+                activities_list = [activity async for activity in activities]
+                print(f"Retrieved {len(activities_list)} activities")
+                return activities_list
+
+            async for activity in activities:
+                print(
+                    f"Found activity {activity_name} with status: {activity.get('status')}"
+                )
+                return activity
+
+        except Exception as e:
+            print(f"Error fetching activity results: {str(e)}")
+            raise
+
+    async def run_and_fetch(
+        self,
+        pipeline_name: str,
+        activity_name: str = None,
+        parameters: Dict = None,
+        timeout: float = None,
+        waiter: Waiter = None,
+    ):
+        """
+        Wrapper to run pipeline and fetch activity results.
+
+        Args:
+            pipeline_name: Name of the pipeline to run
+            activity_name: Optional specific activity name. If None, returns all activities.
+            parameters: Optional dictionary of parameters to pass to the pipeline
+            timeout: Optional overall timeout in seconds for the run to finish
+            waiter: Optional Waiter controlling the polling schedule. Defaults to
+                1s initial delay doubling up to 30s
+
+        Returns:
+            Dictionary for specific activity or List of dictionaries for all activities
+        """
+        try:
+            run = await self.create_run(pipeline_name, parameters)
+
+            print("Waiting for pipeline to complete...")
+            waiter = waiter or Waiter(
+                timeout=timeout,
+                on_progress=lambda attempt, elapsed, _: print(
+                    f"Pipeline status: {run.status} ({elapsed:.0f}s elapsed)"
+                ),
+            )
+
+            async def is_finished():
+                return (await self.check_status(run)).get("status") in TERMINAL_STATUSES
+
+            await waiter.async_wait_until(
+                is_finished, description=f"pipeline run {run.run_id}"
+            )
+            status = run.status
+            print(f"Pipeline status: {status}")
+
+            if status == "Succeeded":
+                return (await self.fetch_activity(activity_name, run=run))["output"][
+                    "resultSets"
+                ]
+            else:
+                raise Exception(f"Pipeline failed with status: {status}")
+
+        except Exception as e:
+            print(f"Error in run_and_fetch: {str(e)}")
+            raise
@@ -0,0 +1,291 @@
+import asyncio
+import time
+from typing import Dict, List, Optional, Union
+from datetime import datetime
+from ..base import AzureResourceBase
+from ..auth import AzureAuthentication
+
+
+class ADFTrigger(AzureResourceBase):
+    def __init__(
+        self,
+        resource_group_name: str,
+        resource_name: str,
+        subscription_id: str = None,
+        auth: AzureAuthentication = None,
+    ):
+        """
+        Initialize async ADF Trigger resource.
+
+        Args:
+            resource_group_name: Name of the resource group
+            resource_name: Name of the Azure Data Factory
+            subscription_id: Azure subscription ID. If not provided, will be retrieved from Azure CLI
+            auth: Optional async AzureAuthentication instance. If not provided, uses the shared instance
+        """
+        super().__init__(
+            resource_group_name=resource_group_name,
+            resource_name=resource_name,
+            resource_type="adf",
+            subscription_id=subscription_id,
+            auth=auth,
+        )
+
+    # Valid trigger types in Azure Data Factory
+    VALID_TRIGGER_TYPES = {
+        "TumblingWindowTrigger",
+        "ScheduleTrigger",
+    }
+
+    async def list_triggers(self, trigger_type: str = None) -> List:
+        """
+        List all triggers in the Data Factory, optionally filtered by type.
+        By default, only shows Schedule and TumblingWindow triggers.
+
+        Args:
+            trigger_type: Optional trigger type to filter by. Must be one of:
+                - TumblingWindowTrigger
+                - ScheduleTrigger
+
+        Returns:
+            List of trigger objects, filtered by type if specified
+
+        Raises:
+            ValueError: If an invalid trigger type is specified
+        """
+        try:
+            if trigger_type and trigger_type not in self.VALID_TRIGGER_TYPES:
+                raise ValueError(
+                    f"Invalid trigger type: {trigger_type}. "
+                    f"Must be one of: {', '.join(sorted(self.VALID_TRIGGER_TYPES))}"
+                )
+
+            print(f"Listing all triggers in the Data Factory: {self.resource_name}")
+            wanted_types = {trigger_type} if trigger_type else self.VALID_TRIGGER_TYPES
+            filtered_triggers = [
+                trigger
+                async for trigger in self.client.triggers.list_by_factory(
+                    self.resource_group_name, self.resource_name
+                )
+                if trigger.properties.type in wanted_types
+            ]
+            print(
+                f"Found {len(filtered_triggers)} {trigger_type or 'schedule/tumbling'} triggers"
+            )
+            return filtered_triggers
+
+        except Exception as e:
+            print(f"Error listing triggers: {str(e)}")
+            raise
+
+    async def manage_trigger(self, trigger_name: str, action: str) -> None:
+        """
+        Manage a specific trigger (start/stop).
+
+        Args:
+            trigger_name: Name of the trigger to manage
+            action: Action to perform ('start' or 'stop')
+        """
+        try:
+            trigger_obj = await self.client.triggers.get(
+                self.resource_group_name, self.resource_name, trigger_name
+            )
+            print(f"Current trigger state: {trigger_obj.properties.runtime_state}")
+
+            if action == "stop" and trigger_obj.properties.runtime_state == "Started":
+                print(f"Stopping trigger: {trigger_name}")
+                operation = await self.client.triggers.begin_stop(
+                    self.resource_group_name, self.resource_name, trigger_name
+                )
+                await operation.wait()
+                print(f"Trigger {trigger_name} stopped")
+            elif (
+                action == "start" and trigger_obj.properties.runtime_state == "Stopped"
+            ):
+                print(f"Starting trigger: {trigger_name}")
+                operation = await self.client.triggers.begin_start(
+                    self.resource_group_name, self.resource_name, trigger_name
+                )
+                await operation.wait()
+                print(f"Trigger {trigger_name} started")
+            else:
+                print(
+                    f"Trigger {trigger_name} is already in the desired state, skipping {action}"
+                )
+
+        except Exception as e:
+            print(f"Error managing trigger {trigger_name}: {str(e)}")
+            raise
+
+    async def manage_all_triggers(
+        self, action: str, concurrent: bool = False, max_workers: int = 16
+    ) -> Optional[Dict]:
+        """
+        Manage all triggers in the Data Factory (start/stop).
+
+        Args:
+            action: Action to perform ('start' or 'stop')
+            concurrent: If True, reuse the runtime state returned by list_triggers and
+                run all start/stop operations in parallel instead of one by one
+            max_workers: Maximum number of start/stop operations in flight when concurrent
+
+        Returns:
+            None in sequential mode. In concurrent mode, a dict with per-trigger
+            results and the total wall-clock time in seconds
+        """
+        try:
+            print(
+                f"Managing all triggers in Data Factory: {self.resource_name} with action: {action}"
+            )
+            triggers = await self.list_triggers()
+
+            if concurrent:
+                return await self._manage_triggers_concurrently(
+                    triggers, action, max_workers
+                )
+
+            for trigger in triggers:
+                print(
+                    f"Working on {trigger.name} under {self.resource_group_name}/{self.resource_name}..."
+                )
+                await self.manage_trigger(trigger.name, action)
+
+        except Exception as e:
+            print(f"Error managing all triggers: {str(e)}")
+            raise
+
+    async def _manage_triggers_concurrently(
+        self, triggers: List, action: str, max_workers: int
+    ) -> Dict:
+        """
+        Start or stop the given triggers in parallel with a bounded window.
+        Triggers already in the desired state are skipped without a call.
+        """
+        if action not in ("start", "stop"):
+            raise ValueError(f"Invalid action: {action}. Must be 'start' or 'stop'")
+
+        started = time.perf_counter()
+        from_state = "Stopped" if action == "start" else "Started"
+        pending = [t for t in triggers if t.properties.runtime_state == from_state]
+        results = [
+            {"trigger": t.name, "status": "skipped", "seconds": 0.0, "error": None}
+            for t in triggers
+            if t.properties.runtime_state != from_state
+        ]
+
+        print(
+            f"{len(pending)} triggers to {action}, {len(results)} already in the desired state"
+        )
+        window = asyncio.Semaphore(max_workers)
+
+        async def run(trigger):
+            async with window:
+                return await self._run_trigger_action(trigger.name, action)
+
+        results.extend(await asyncio.gather(*(run(t) for t in pending)))
+
+        elapsed = time.perf_counter() - started
+        failed = [r for r in results if r["status"] == "failed"]
+        print(
+            f"Finished {action} for {len(pending)} triggers in {elapsed:.1f}s "
+            f"({len(failed)} failed)"
+        )
+        return {"action": action, "results": results, "elapsed_seconds": elapsed}
+
+    async def _run_trigger_action(self, trigger_name: str, action: str) -> Dict:
+        """
+        Run one start/stop long-running operation and time it.
+        Errors are captured in the result instead of raised.
+        """
+        started = time.perf_counter()
+        begin = (
+            self.client.triggers.begin_start
+            if action == "start"
+            else self.client.triggers.begin_stop
+        )
+        try:
+            poller = await begin(
+                self.resource_group_name, self.resource_name, trigger_name
+            )
+            await poller.result()
+            status, error = "succeeded", None
+        except Exception as e:
+            print(f"Error managing trigger {trigger_name}: {str(e)}")
+            status, error = "failed", str(e)
+        return {
+            "trigger": trigger_name,
+            "status": status,
+            "seconds": time.perf_counter() - started,
+            "error": error,
+        }
+
+    async def reset_tumbling_with_start_time(
+        self, trigger_name: str, new_start_time: Union[str, datetime]
+    ) -> None:
+        """
+        Reset the start time of a tumbling window trigger by recreating it.
+        This is necessary because start time cannot be updated directly.
+
+        Args:
+            trigger_name: Name of the trigger to reset
+            new_start_time: New start time as either:
+                - ISO 8601 format string (e.g., '2024-03-20T00:00:00Z')
+                - datetime object
+
+        Raises:
+            ValueError: If the trigger is not a tumbling window trigger
+            ValueError: If the start time string is not in valid ISO 8601 format
+        """
+        try:
+            if isinstance(new_start_time, str):
+                try:
+                    new_start_time = datetime.fromisoformat(
+                        new_start_time.replace("Z", "+00:00")
+                    )
+                except ValueError as e:
+                    raise ValueError(
+                        f"Invalid start time format. Must be ISO 8601 format (e.g., '2024-03-20T00:00:00Z'). Error: {str(e)}"
+                    )
+
+            trigger_obj = await self.client.triggers.get(
+                self.resource_group_name, self.resource_name, trigger_name
+            )
+
+            if trigger_obj.properties.type != "TumblingWindowTrigger":
+                raise ValueError(
+                    f"Trigger {trigger_name} is not a tumbling window trigger. "
+                    f"Found type: {trigger_obj.properties.type}"
+                )
+
+            original_state = trigger_obj.properties.runtime_state
+
+            if original_state == "Started":
+                print(f"Stopping trigger {trigger_name} before recreation...")
+                await self.manage_trigger(trigger_name, "stop")
+
+            print(f"Deleting trigger {trigger_name}... temporarily")
+            await self.client.triggers.delete(
+                self.resource_group_name, self.resource_name, trigger_name
+            )
+
+            trigger_obj.properties.start_time = new_start_time
+
+            print(f"Recreating trigger {trigger_name} with new start time...")
+            await self.client.triggers.create_or_update(
+                self.resource_group_name,
+                self.resource_name,
+                trigger_name,
+                trigger_obj,
+            )
+
+            if original_state == "Started":
+                print(f"Restoring trigger {trigger_name} to running state...")
+                await self.manage_trigger(trigger_name, "start")
+
+            print(
+                f"Successfully reset start time for trigger {trigger_name} to {new_start_time}"
+            )
+
+        except Exception as e:
+            print(f"Error resetting trigger start time: {str(e)}")
+            raise
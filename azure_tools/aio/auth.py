@@ -0,0 +1,173 @@
+from datetime import datetime
+from typing import TYPE_CHECKING, Dict, Tuple
+import asyncio
+import threading
+import time
+from ..auth import MANAGEMENT_SCOPE
+from ..token_cache import (
+    EXPIRY_MARGIN,
+    AsyncCachedTokenCredential,
+    KeyedLocks,
+    PersistentTokenCache,
+    _request_options,
+    token_cache_enabled,
+)
+
+if TYPE_CHECKING:
+    from azure.core.credentials import AccessToken
+
+
+def _is_valid(token: "AccessToken") -> bool:
+    return token is not None and token.expires_on - time.time() > EXPIRY_MARGIN
+
+
+class _SharedTokenCredential:
+    """
+    Async credential handed to SDK clients, served from the owning
+    AzureAuthentication's keyed token set.
+    """
+
+    def __init__(self, auth: "AzureAuthentication"):
+        self._auth = auth
+
+    async def get_token(
+        self, *scopes: str, claims: str = None, tenant_id: str = None, **kwargs
+    ) -> "AccessToken":
+        if claims:
+            # Claims challenges must reach the identity provider
+            return await self._auth._credential.get_token(
+                *scopes, claims=claims, tenant_id=tenant_id, **kwargs
+            )
+        return await self._auth.get_access_token(
+            *scopes, tenant_id=tenant_id, enable_cae=kwargs.get("enable_cae", False)
+        )
+
+    async def close(self) -> None:
+        await self._auth._credential.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+
+class AzureAuthentication:
+    """
+    Shared asynchronous authentication class for Azure resources.
+    Async counterpart of azure_tools.auth.AzureAuthentication built on azure.identity.aio.
+    Tokens are kept per scope and tenant with single-flight acquisition.
+    """
+
+    # Shared instances per event loop: the aio credential and token locks are
+    # bound to the loop they first run on. Instances of closed loops are dropped
+    _shared: Dict[asyncio.AbstractEventLoop, "AzureAuthentication"] = {}
+    _shared_unbound = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, token_cache: PersistentTokenCache = None):
+        """
+        Initialize Azure authentication.
+
+        Args:
+            token_cache: Optional on-disk token cache shared with other processes.
+                If not provided, one is used when AZURE_TOOLS_TOKEN_CACHE is set
+        """
+        if token_cache is None and token_cache_enabled():
+            token_cache = PersistentTokenCache()
+        self.token_cache = token_cache
+        from azure.identity.aio import DefaultAzureCredential
+
+        self._credential = DefaultAzureCredential()
+        if token_cache is not None:
+            self._credential = AsyncCachedTokenCredential(self._credential, token_cache)
+        self.credential = _SharedTokenCredential(self)
+        self._tokens: Dict[Tuple[Tuple[str, ...], str, bool], "AccessToken"] = {}
+        self._token_locks = KeyedLocks(asyncio.Lock)
+        # Management token, kept for callers that read these attributes directly
+        self.token = None
+        self.token_expiry = None
+
+    @classmethod
+    def shared(cls) -> "AzureAuthentication":
+        """
+        Get the async authentication instance shared on the running event loop.
+        Each asyncio.run() (e.g. each Streamlit rerun) gets its own instance, so
+        no credential or lock outlives the loop it was bound to.
+
+        Returns:
+            The shared AzureAuthentication instance of the running loop, or a
+            process-wide one when called outside an event loop
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        with cls._shared_lock:
+            if loop is None:
+                if cls._shared_unbound is None:
+                    cls._shared_unbound = cls()
+                return cls._shared_unbound
+            shared = cls._shared.get(loop)
+            if shared is None:
+                for closed in [loop_ for loop_ in cls._shared if loop_.is_closed()]:
+                    del cls._shared[closed]
+                shared = cls._shared[loop] = cls()
+            return shared
+
+    async def get_access_token(
+        self, *scopes: str, tenant_id: str = None, enable_cae: bool = False
+    ) -> "AccessToken":
+        """
+        Get a token for the given scopes and tenant, acquiring it if the cached
+        one is missing or expires within five minutes. Concurrent coroutines
+        asking for the same token wait for a single acquisition.
+
+        Args:
+            *scopes: Token scopes. Defaults to Azure Resource Manager
+            tenant_id: Optional tenant to request the token from
+            enable_cae: Request a Continuous Access Evaluation token (as Key Vault does)
+
+        Returns:
+            AccessToken with the token and its expiry
+        """
+        scopes = scopes or (MANAGEMENT_SCOPE,)
+        key = (tuple(sorted(scopes)), tenant_id, enable_cae)
+        token = self._tokens.get(key)
+        if _is_valid(token):
+            return token
+        async with self._token_locks(key):
+            token = self._tokens.get(key)
+            if _is_valid(token):
+                return token
+            print(f"Generating new token for {' '.join(scopes)}...")
+            token = await self._credential.get_token(
+                *scopes, **_request_options(tenant_id, enable_cae)
+            )
+            self._tokens[key] = token
+            if key == ((MANAGEMENT_SCOPE,), None, False):
+                self.token = token.token
+                self.token_expiry = datetime.fromtimestamp(
+                    token.expires_on - EXPIRY_MARGIN
+                )
+            return token
+
+    async def get_token(
+        self, scope: str = MANAGEMENT_SCOPE, tenant_id: str = None
+    ) -> str:
+        """
+        Get a new token if current one is expired or doesn't exist.
+        Returns cached token if still valid.
+
+        Args:
+            scope: Token scope. Defaults to Azure Resource Manager
+            tenant_id: Optional tenant to request the token from
+
+        Returns:
+            The bearer token string
+        """
+        return (await self.get_access_token(scope, tenant_id=tenant_id)).token
+
+    async def close(self) -> None:
+        """Close the underlying async credential."""
+        await self._credential.close()
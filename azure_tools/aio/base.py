@@ -0,0 +1,142 @@
+import threading
+import weakref
+from typing import Literal
+from .auth import AzureAuthentication
+from .client_registry import get_async_client_registry
+from ..subscription_resource import SubscriptionResourceManager
+
+
+class AzureResourceBase:
+    def __init__(
+        self,
+        resource_group_name: str,
+        resource_name: str,
+        resource_type: Literal["adf", "batch", "keyvault", "locks"],
+        subscription_id: str = None,
+        auth: AzureAuthentication = None,
+    ):
+        """
+        Base class for async Azure resource operations.
+
+        Args:
+            resource_group_name: Name of the resource group
+            resource_name: Name of the resource (ADF factory, Batch account, or Key Vault)
+            resource_type: Type of resource ('adf', 'batch', 'keyvault', or 'locks')
+            subscription_id: Azure subscription ID. If not provided, will be retrieved from environment or CLI
+            auth: Optional async AzureAuthentication instance. If not provided, uses the shared instance
+        """
+        self.resource_group_name = resource_group_name
+        self.resource_name = resource_name
+        self.resource_type = resource_type.lower()
+
+        # Use provided auth instance or the process-wide shared one
+        self.auth = auth if auth is not None else AzureAuthentication.shared()
+
+        # Handle subscription_id independently (memoized for the process after first lookup)
+        self.subscription_id = SubscriptionResourceManager.get_subscription_id(
+            subscription_id
+        )
+
+        self.credential = self.auth.credential
+
+        # The SDK client is drawn from the shared registry on first use, so helpers
+        # that never make a call never import or build an SDK client
+        if self.resource_type in ("adf", "batch", "locks"):
+            self._client_scope = self.subscription_id
+        elif self.resource_type == "keyvault":
+            self._client_scope = f"https://{resource_name}.vault.azure.net"
+        else:
+            raise ValueError(
+                f"Unsupported resource type: {resource_type}. Must be 'adf', 'batch', 'keyvault', or 'locks'"
+            )
+        self._client = None
+        self._client_lock = threading.Lock()
+
+    @property
+    def client(self):
+        """SDK client for this helper's resource type, acquired on first access."""
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = self._acquire_client(
+                        self.resource_type, self._client_scope
+                    )
+        return self._client
+
+    @client.setter
+    def client(self, value):
+        self._client = value
+
+    # Resource-specific names kept for the Key Vault and lock helpers
+    secret_client = client
+    lock_client = client
+
+    def _acquire_client(self, client_type: str, scope: str):
+        """
+        Take a reference on a shared async SDK client from the running loop's registry.
+        The reference is also given back when the helper is garbage collected
+        without close(), so dropped helpers don't pin clients in the registry.
+        """
+        registry = get_async_client_registry()
+        client = registry.acquire(client_type, scope, self.credential)
+        self._release_client = weakref.finalize(
+            self, registry.release, client_type, scope, self.credential
+        )
+        return client
+
+    async def close(self) -> None:
+        """
+        Release this helper's reference on its shared async SDK client.
+        """
+        release = getattr(self, "_release_client", None)
+        if release is None:
+            return
+        self._release_client = None
+        self._client = None
+        release()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def _get_token(self):
+        """
+        Get a token using the shared authentication instance.
+        """
+        return await self.auth.get_token()
+
+    async def _send_arm_request(self, method: str, api_url: str, json: dict = None):
+        """
+        Send a raw ARM request through the SDK client's async pipeline.
+        The pipeline handles authentication, retries and connection pooling.
+
+        Returns:
+            The parsed JSON response body, or None for empty responses
+        """
+        from azure.core.rest import HttpRequest
+
+        request = HttpRequest(method, api_url, json=json)
+        response = await self.client.send_request(request)
+        response.raise_for_status()
+        return response.json() if response.content else None
+
+    async def get_resource_details(self):
+        """
+        Get details of the resource based on its type
+        """
+        try:
+            if self.resource_type == "adf":
+                return await self.client.factories.get(
+                    resource_group_name=self.resource_group_name,
+                    factory_name=self.resource_name,
+                )
+            elif self.resource_type == "batch":
+                return await self.client.batch_account.get(
+                    resource_group_name=self.resource_group_name,
+                    account_name=self.resource_name,
+                )
+        except Exception as e:
+            print(f"Error getting {self.resource_type} details: {str(e)}")
+            raise
@@ -0,0 +1,234 @@
+import json
+from typing import Dict, Optional
+from .base import AzureResourceBase
+from .auth import AzureAuthentication
+from ..batch import fixed_scale_patch, has_targets, is_steady, pool_state
+from ..waiters import Waiter
+
+
+class AzureBatchPool(AzureResourceBase):
+    def __init__(
+        self,
+        resource_group_name: str,
+        resource_name: str,
+        pool_name: str,
+        subscription_id: str = None,
+        auth: AzureAuthentication = None,
+    ):
+        """
+        Initialize async Azure Batch Pool operations.
+
+        Args:
+            resource_group_name: Name of the resource group
+            resource_name: Name of the batch account
+            pool_name: Name of the pool
+            subscription_id: Optional subscription ID
+            auth: Optional async AzureAuthentication instance. If not provided, uses the shared instance
+        """
+        super().__init__(
+            resource_group_name=resource_group_name,
+            resource_name=resource_name,
+            resource_type="batch",
+            subscription_id=subscription_id,
+            auth=auth,
+        )
+        self.pool_name = pool_name
+
+    async def get_pool_config(self) -> Dict:
+        """
+        Get the current configuration of the batch pool.
+
+        Returns:
+            Dict containing the pool configuration
+        """
+        try:
+            response = await self.client.pool.get(
+                resource_group_name=self.resource_group_name,
+                account_name=self.resource_name,
+                pool_name=self.pool_name,
+            )
+            return response.as_dict()
+        except Exception as e:
+            print(f"Error getting pool configuration: {str(e)}")
+            raise
+
+    async def get_pool_state(self) -> Dict:
+        """
+        Get the scaling state of the batch pool.
+
+        Returns:
+            Dict with 'etag', 'allocation_state', current and target node counts,
+            'auto_scale' and 'resize_errors'
+        """
+        try:
+            return pool_state(
+                await self.client.pool.get(
+                    resource_group_name=self.resource_group_name,
+                    account_name=self.resource_name,
+                    pool_name=self.pool_name,
+                )
+            )
+        except Exception as e:
+            print(f"Error getting pool state: {str(e)}")
+            raise
+
+    async def resize_pool(
+        self,
+        target_dedicated_nodes: int,
+        target_low_priority_nodes: int = None,
+        resize_timeout: str = None,
+        node_deallocation_option: str = None,
+        etag: str = None,
+        wait: bool = False,
+        timeout: float = 1800,
+        waiter: Waiter = None,
+        dry_run: bool = False,
+    ) -> Dict:
+        """
+        Resize the pool with a PATCH carrying only its fixed scale settings,
+        conditional on the pool's ETag so a concurrent edit fails the call
+        instead of being overwritten.
+
+        Args:
+            target_dedicated_nodes: Target number of dedicated nodes
+            target_low_priority_nodes: Target number of Spot/low-priority nodes.
+                Defaults to the pool's current target
+            resize_timeout: Optional ISO 8601 duration for the resize, e.g. "PT15M"
+            node_deallocation_option: Optional "Requeue", "Terminate", "TaskCompletion" or "RetainedData"
+            etag: ETag the pool is expected to have. If not provided, the pool is read first
+                (and an unchanged target is skipped); with it, no read is made
+            wait: If True, wait until the pool's allocation state is Steady again
+            timeout: Seconds to wait for the pool to become steady
+            waiter: Optional Waiter controlling the polling schedule
+            dry_run: If True, only show the PATCH body that would be sent
+
+        Returns:
+            Pool scaling state: as accepted by the service, or once steady when wait is True
+        """
+        try:
+            if target_dedicated_nodes < 0 or (target_low_priority_nodes or 0) < 0:
+                raise ValueError("Target nodes must be 0 or a positive integer")
+
+            state = None
+            if etag is None:
+                state = await self.get_pool_state()
+                etag = state["etag"]
+                if target_low_priority_nodes is None:
+                    target_low_priority_nodes = state["target_low_priority_nodes"]
+                if (
+                    not state["auto_scale"]
+                    and state["target_dedicated_nodes"] == target_dedicated_nodes
+                    and state["target_low_priority_nodes"] == target_low_priority_nodes
+                ):
+                    print(
+                        f"Pool {self.pool_name} already targets {target_dedicated_nodes} nodes. No changes needed."
+                    )
+                    return (
+                        await self.wait_for_steady(timeout, waiter) if wait else state
+                    )
+
+            body = fixed_scale_patch(
+                target_dedicated_nodes,
+                target_low_priority_nodes,
+                resize_timeout,
+                node_deallocation_option,
+            )
+            if dry_run:
+                print(
+                    f"What if: Would scale pool {self.pool_name} to {target_dedicated_nodes} nodes"
+                )
+                print(f"PATCH (If-Match: {etag}):")
+                print(json.dumps(body, indent=2))
+                return state or {"etag": etag}
+
+            response = await self.client.pool.update(
+                resource_group_name=self.resource_group_name,
+                account_name=self.resource_name,
+                pool_name=self.pool_name,
+                parameters=json.dumps(body).encode("utf-8"),
+                if_match=etag,
+            )
+            print(
+                f"Resize of pool {self.pool_name} to {target_dedicated_nodes} nodes accepted"
+            )
+            if wait:
+                return await self.wait_for_steady(
+                    timeout,
+                    waiter,
+                    target_dedicated_nodes=target_dedicated_nodes,
+                    target_low_priority_nodes=target_low_priority_nodes,
+                )
+            return pool_state(response)
+
+        except Exception as e:
+            print(f"Error resizing pool: {str(e)}")
+            raise
+
+    async def wait_for_steady(
+        self,
+        timeout: float = 1800,
+        waiter: Waiter = None,
+        target_dedicated_nodes: int = None,
+        target_low_priority_nodes: int = None,
+    ) -> Dict:
+        """
+        Wait until the pool's allocation state is Steady.
+        A resize is applied asynchronously, so a read right after it may still
+        show the old, steady pool; with target counts given, only a steady
+        state that already carries those targets is accepted.
+
+        Args:
+            timeout: Seconds to wait
+            waiter: Optional Waiter controlling the polling schedule
+            target_dedicated_nodes: Dedicated target the pool must show, if any
+            target_low_priority_nodes: Low-priority target the pool must show, if any
+
+        Returns:
+            Pool scaling state once steady
+        """
+        waiter = waiter or Waiter(
+            initial_delay=5,
+            max_delay=30,
+            timeout=timeout,
+            on_progress=lambda attempt, elapsed, _: print(
+                f"Waiting for pool {self.pool_name} to become steady ({elapsed:.0f}s)..."
+            ),
+        )
+
+        async def check() -> Optional[Dict]:
+            state = await self.get_pool_state()
+            return (
+                state
+                if is_steady(state)
+                and has_targets(
+                    state, target_dedicated_nodes, target_low_priority_nodes
+                )
+                else None
+            )
+
+        state = await waiter.async_wait_until(
+            check, description=f"pool {self.pool_name} to become steady"
+        )
+        for error in state["resize_errors"]:
+            print(f"Resize error: {error}")
+        print(
+            f"Pool {self.pool_name} is steady with {state['current_dedicated_nodes']} dedicated "
+            f"and {state['current_low_priority_nodes']} low-priority nodes"
+        )
+        return state
+
+    async def scale_pool_nodes(self, target_nodes: int, dry_run: bool = True) -> Dict:
+        """
+        Scale the number of nodes in the batch pool.
+        Sends only the new scale settings, conditional on the pool's ETag.
+
+        Args:
+            target_nodes: Target number of nodes (0 or positive integer)
+            dry_run: If True, only show what would be changed without making changes
+
+        Returns:
+            Pool scaling state as returned by resize_pool(): 'etag', 'allocation_state',
+            current and target node counts, 'auto_scale' and 'resize_errors'.
+            This used to be the full pool configuration; use get_pool_config() for that
+        """
+        return await self.resize_pool(target_nodes, dry_run=dry_run)
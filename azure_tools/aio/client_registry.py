@@ -0,0 +1,128 @@
+import asyncio
+import threading
+from typing import Any, Dict, Optional
+from ..client_registry import ClientRegistry
+from ..throttling import sdk_throttling_kwargs
+
+
+class AsyncClientRegistry(ClientRegistry):
+    """
+    Registry of async Azure SDK clients for one event loop.
+    Same keying and eviction rules as ClientRegistry, but builds the azure.mgmt.*.aio
+    clients. Async clients are bound to the event loop that first uses them, so
+    there is one registry per event loop (see get_async_client_registry).
+    """
+
+    def __init__(self, max_size: int = 64, loop: asyncio.AbstractEventLoop = None):
+        """
+        Initialize the async client registry.
+
+        Args:
+            max_size: Maximum number of clients kept open (see ClientRegistry)
+            loop: Event loop the registry's clients run on
+        """
+        super().__init__(max_size=max_size)
+        self.loop = loop
+        # Close tasks scheduled from synchronous code, kept until they finish
+        self._closing = set()
+
+    def _build_client(self, client_type: str, scope: str, credential: Any):
+        """Instantiate the async SDK client for a registry entry."""
+        if client_type == "adf":
+            from azure.mgmt.datafactory.aio import DataFactoryManagementClient
+
+            return DataFactoryManagementClient(
+                credential=credential,
+                subscription_id=scope,
+                **sdk_throttling_kwargs(is_async=True),
+            )
+        elif client_type == "batch":
+            from azure.mgmt.batch.aio import BatchManagementClient
+
+            return BatchManagementClient(
+                credential=credential,
+                subscription_id=scope,
+                **sdk_throttling_kwargs(is_async=True),
+            )
+        elif client_type == "keyvault":
+            from azure.keyvault.secrets.aio import SecretClient
+
+            return SecretClient(vault_url=scope, credential=credential)
+        elif client_type == "locks":
+            from azure.mgmt.resource.locks.aio import ManagementLockClient
+
+            return ManagementLockClient(
+                credential=credential,
+                subscription_id=scope,
+                **sdk_throttling_kwargs(is_async=True),
+            )
+        raise ValueError(
+            f"Unsupported client type: {client_type}. "
+            f"Must be one of: {', '.join(sorted(self.SUPPORTED_CLIENT_TYPES))}"
+        )
+
+    def _close_client(self, client) -> None:
+        # Eviction happens from synchronous code, so schedule the close on the client's loop
+        loop = current_loop()
+        if loop is not None and (self.loop is None or loop is self.loop):
+            task = loop.create_task(client.close())
+            self._closing.add(task)
+            task.add_done_callback(self._closing.discard)
+        elif self.loop is not None and not self.loop.is_closed():
+            asyncio.run_coroutine_threadsafe(client.close(), self.loop)
+        else:
+            print(f"No running event loop to close {type(client).__name__}")
+
+    async def aclear(self) -> None:
+        """
+        Close every idle client in the registry. Clients still referenced by a
+        helper stay usable and are closed when their last reference is released.
+        Intended for process shutdown.
+        """
+        for client in self._retire_all():
+            try:
+                await client.close()
+            except Exception as e:
+                print(f"Error closing {type(client).__name__}: {str(e)}")
+        if self._closing:
+            await asyncio.gather(*self._closing, return_exceptions=True)
+
+
+def current_loop() -> Optional[asyncio.AbstractEventLoop]:
+    """The running event loop, or None when called outside one."""
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+# One registry per event loop. Clients keep their loop alive, so registries of
+# closed loops are dropped on the next lookup rather than by weak references
+_registries: Dict[asyncio.AbstractEventLoop, AsyncClientRegistry] = {}
+_unbound_registry = None
+_registries_lock = threading.Lock()
+
+
+def get_async_client_registry() -> AsyncClientRegistry:
+    """
+    Get the async client registry of the running event loop, shared by all
+    azure_tools.aio helpers on that loop. Each asyncio.run() (e.g. each
+    Streamlit rerun) gets fresh clients instead of ones bound to a closed loop.
+
+    Returns:
+        The AsyncClientRegistry of the running loop, or a process-wide one when
+        called outside an event loop
+    """
+    global _unbound_registry
+    loop = current_loop()
+    with _registries_lock:
+        if loop is None:
+            if _unbound_registry is None:
+                _unbound_registry = AsyncClientRegistry()
+            return _unbound_registry
+        registry = _registries.get(loop)
+        if registry is None:
+            for closed in [loop_ for loop_ in _registries if loop_.is_closed()]:
+                del _registries[closed]
+            registry = _registries[loop] = AsyncClientRegistry(loop=loop)
+        return registry
@@ -0,0 +1,197 @@
+import asyncio
+from typing import AsyncIterator, Dict, Iterable, List
+from .base import AzureResourceBase
+from .auth import AzureAuthentication
+from ..secret_cache import SecretCache, get_secret_cache
+from ..throttling import get_vault_bucket
+
+
+class AzureKeyVault(AzureResourceBase):
+    def __init__(
+        self,
+        resource_group_name: str,
+        resource_name: str,
+        subscription_id: str = None,
+        auth: AzureAuthentication = None,
+        cache: SecretCache = None,
+    ):
+        """
+        Initialize async Azure Key Vault resource.
+
+        Args:
+            resource_group_name: Name of the resource group
+            resource_name: Name of the Key Vault
+            subscription_id: Azure subscription ID. If not provided, will be retrieved from Azure CLI
+            auth: Optional async AzureAuthentication instance. If not provided, uses the shared instance
+            cache: Optional SecretCache. If not provided, uses the process-wide cache
+        """
+        super().__init__(
+            resource_group_name=resource_group_name,
+            resource_name=resource_name,
+            resource_type="keyvault",
+            subscription_id=subscription_id,
+            auth=auth,
+        )
+        self.cache = cache if cache is not None else get_secret_cache()
+
+    @property
+    def vault_url(self) -> str:
+        return self._client_scope
+
+    async def get_secret(
+        self, secret_name: str, version: str = None, use_cache: bool = True
+    ) -> str:
+        """
+        Get a secret from the key vault.
+        Values are served from the process-wide secret cache while fresh, and
+        concurrent misses for the same secret share a single vault call.
+
+        Args:
+            secret_name: Name of the secret to retrieve
+            version: Optional version to pin. Defaults to the latest version
+            use_cache: If False, always read the secret from the vault
+
+        Returns:
+            The secret value as a string
+        """
+        try:
+            if not use_cache:
+                return (await self.secret_client.get_secret(secret_name, version)).value
+
+            value = self.cache.get(self.vault_url, secret_name, version)
+            if value is not None:
+                return value
+
+            key = self.cache.key(self.vault_url, secret_name, version)
+            async with self.cache.async_fetch_lock(key):
+                # Another caller may have fetched it while we waited
+                value = self.cache.get(self.vault_url, secret_name, version)
+                if value is not None:
+                    return value
+                secret = await self.secret_client.get_secret(secret_name, version)
+                self.cache.put(
+                    self.vault_url,
+                    secret_name,
+                    secret.value,
+                    version=secret.properties.version,
+                    pinned=version is not None,
+                    expires_on=secret.properties.expires_on,
+                )
+                return secret.value
+        except Exception as e:
+            print(f"Error getting secret {secret_name}: {str(e)}")
+            raise
+
+    async def get_secrets(
+        self, secret_names: Iterable[str], max_workers: int = 32
+    ) -> Dict[str, str]:
+        """
+        Get several secrets concurrently.
+        Cached values are returned without a call; the rest are fetched in
+        parallel under the vault's rate limit.
+
+        Args:
+            secret_names: Names of the secrets to retrieve
+            max_workers: Maximum number of concurrent vault calls
+
+        Returns:
+            Dictionary of secret name to value
+        """
+        names = list(dict.fromkeys(secret_names))
+        values = {}
+        missing = []
+        for name in names:
+            value = self.cache.get(self.vault_url, name)
+            if value is None:
+                missing.append(name)
+            else:
+                values[name] = value
+
+        bucket = get_vault_bucket(self.vault_url)
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def fetch(name: str) -> str:
+            async with semaphore:
+                delay = bucket.reserve()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                return await self.get_secret(name)
+
+        results = await asyncio.gather(
+            *(fetch(name) for name in missing), return_exceptions=True
+        )
+        errors = [r for r in results if isinstance(r, Exception)]
+        if errors:
+            raise errors[0]
+        values.update(zip(missing, results))
+        return {name: values[name] for name in names}
+
+    async def iter_secret_properties(
+        self, prefix: str = None, tags: Dict[str, str] = None
+    ) -> AsyncIterator[Dict]:
+        """
+        Stream secret properties page by page without holding the whole listing.
+        Key Vault cannot filter server-side, so prefix and tags are applied per page.
+
+        Args:
+            prefix: Optional secret name prefix to keep
+            tags: Optional tags every yielded secret must carry with the given values
+
+        Yields:
+            Dictionaries of secret properties (name, created_on, updated_on, enabled, content_type, tags)
+        """
+        try:
+            async for page in self.secret_client.list_properties_of_secrets().by_page():
+                async for secret in page:
+                    if prefix and not secret.name.startswith(prefix):
+                        continue
+                    if tags and any(
+                        (secret.tags or {}).get(k) != v for k, v in tags.items()
+                    ):
+                        continue
+                    yield {
+                        "name": secret.name,
+                        "created_on": secret.created_on,
+                        "updated_on": secret.updated_on,
+                        "enabled": secret.enabled,
+                        "content_type": secret.content_type,
+                        "tags": secret.tags,
+                    }
+        except Exception as e:
+            print(f"Error listing secrets: {str(e)}")
+            raise
+
+    async def list_secrets(self) -> List[Dict]:
+        """
+        List all secrets in the current key vault.
+
+        Returns:
+            List of dictionaries containing secret properties (name, created_on, updated_on, enabled)
+        """
+        return [
+            {
+                key: secret[key]
+                for key in ("name", "created_on", "updated_on", "enabled")
+            }
+            async for secret in self.iter_secret_properties()
+        ]
+
+    async def set_secret(self, secret_name: str, secret_value: str) -> None:
+        """
+        Set a secret in the key vault and drop its cached latest value.
+
+        Args:
+            secret_name: Name of the secret to set
+            secret_value: Value of the secret to set
+        """
+        try:
+            await self.secret_client.set_secret(secret_name, secret_value)
+            print(
+                f"Successfully set secret {secret_name} in {self.resource_name} under {self.resource_group_name}"
+            )
+        except Exception as e:
+            print(f"Error setting secret {secret_name}: {str(e)}")
+            raise
+        finally:
+            # Even a failed set may have created a new version
+            self.cache.invalidate(self.vault_url, secret_name)
@@ -0,0 +1,219 @@
+import asyncio
+import os
+import socket
+import time
+import uuid
+from typing import Awaitable, Callable, Dict, Iterable, List, Tuple, Union
+from .auth import AzureAuthentication
+from .locks import AzureResourceLock
+from ..lock_window import (
+    LockJournal,
+    ResourceGroupRef,
+    _is_orphaned,
+    _lock_label,
+    _record_key,
+    _report_restored,
+    lock_parameters,
+    lock_record,
+    lock_scope,
+    resolve_resource_groups,
+)
+
+
+class UnlockedWindow:
+    """
+    Async context manager that keeps the locks of one or many resource groups
+    released for the duration of an async with block. Behaves like
+    azure_tools.lock_window.UnlockedWindow and shares its journal format, so
+    windows left open by either variant are recovered by both.
+
+    Example:
+        async with UnlockedWindow(["rg-a", "rg-b"]):
+            ...  # delete or move resources
+    """
+
+    def __init__(
+        self,
+        resource_groups: Iterable[ResourceGroupRef],
+        subscription_id: str = None,
+        auth: AzureAuthentication = None,
+        journal: Union[LockJournal, str] = None,
+        max_workers: int = 16,
+    ):
+        """
+        Initialize the window.
+
+        Args:
+            resource_groups: Resource groups to unlock, as names or (subscription_id, name) tuples
+            subscription_id: Subscription for resource groups given by name only. If not provided,
+                resolved the same way as for the resource helpers
+            auth: Optional async AzureAuthentication instance. If not provided, uses the shared instance
+            journal: LockJournal or journal file path. Defaults to LockJournal()
+            max_workers: Maximum number of concurrent list, delete and create calls
+        """
+        self.resource_groups = resolve_resource_groups(resource_groups, subscription_id)
+        self.auth = auth if auth is not None else AzureAuthentication.shared()
+        self.journal = (
+            journal if isinstance(journal, LockJournal) else LockJournal(journal)
+        )
+        self.max_workers = max_workers
+        self.window_id = uuid.uuid4().hex
+        self.released: List[Dict] = []
+        self._helpers: Dict[Tuple[str, str], AzureResourceLock] = {}
+
+    def _helper(
+        self, subscription_id: str, resource_group_name: str
+    ) -> AzureResourceLock:
+        key = (subscription_id, resource_group_name)
+        helper = self._helpers.get(key)
+        if helper is None:
+            helper = AzureResourceLock(
+                resource_group_name=resource_group_name,
+                subscription_id=subscription_id,
+                auth=self.auth,
+            )
+            self._helpers[key] = helper
+        return helper
+
+    async def _map(self, function: Callable[..., Awaitable], items: List) -> List:
+        semaphore = asyncio.Semaphore(self.max_workers)
+
+        async def bounded(item):
+            async with semaphore:
+                return await function(item)
+
+        return await asyncio.gather(*(bounded(item) for item in items))
+
+    async def _list(self, resource_group: Tuple[str, str]) -> List[Dict]:
+        subscription_id, resource_group_name = resource_group
+        helper = self._helper(subscription_id, resource_group_name)
+        return [
+            lock_record(subscription_id, resource_group_name, lock)
+            for lock in await helper.refresh_locks()
+        ]
+
+    async def _delete(self, record: Dict) -> Dict:
+        result = {"lock": _record_key(record), "status": "released", "error": None}
+        try:
+            helper = self._helper(
+                record["subscription_id"], record["resource_group_name"]
+            )
+            await helper.lock_client.management_locks.delete_by_scope(
+                lock_scope(record), record["name"]
+            )
+            await asyncio.to_thread(self.journal.mark, record, "released")
+            print(f"Temporarily released lock: {_lock_label(record)}")
+        except Exception as e:
+            result.update(status="failed", error=str(e))
+        return result
+
+    async def _create(self, record: Dict) -> Dict:
+        result = {"lock": _record_key(record), "status": "restored", "error": None}
+        try:
+            helper = self._helper(
+                record["subscription_id"], record["resource_group_name"]
+            )
+            await helper.lock_client.management_locks.create_or_update_by_scope(
+                scope=lock_scope(record),
+                lock_name=record["name"],
+                parameters=lock_parameters(record),
+            )
+            await asyncio.to_thread(self.journal.remove, record)
+            print(f"Reset lock: {_lock_label(record)}")
+        except Exception as e:
+            result.update(status="failed", error=str(e))
+        return result
+
+    async def release(self) -> List[Dict]:
+        """
+        List, journal and delete the locks of every resource group concurrently.
+        If any lock cannot be deleted, the locks already deleted are recreated
+        before the error is raised.
+
+        Returns:
+            Journal records of the released locks
+        """
+        started = time.monotonic()
+        records = [
+            record
+            for listed in await self._map(self._list, self.resource_groups)
+            for record in listed
+        ]
+        for record in records:
+            record.update(
+                state="releasing",
+                window=self.window_id,
+                pid=os.getpid(),
+                host=socket.gethostname(),
+            )
+        # Journal writes take a file lock and fsync, so they run off the event loop
+        await asyncio.to_thread(self.journal.add, records)
+        self.released = records
+
+        results = await self._map(self._delete, records)
+        failed = [r for r in results if r["status"] == "failed"]
+        if failed:
+            await self.restore()
+            raise RuntimeError(
+                f"Failed to release {len(failed)} locks: "
+                + "; ".join(f"{r['lock']}: {r['error']}" for r in failed)
+            )
+        print(
+            f"Released {len(records)} locks in {len(self.resource_groups)} resource groups "
+            f"in {time.monotonic() - started:.1f}s"
+        )
+        return records
+
+    async def restore(self) -> List[Dict]:
+        """
+        Recreate every lock this window journaled, concurrently.
+
+        Returns:
+            One result per lock with 'lock', 'status' ('restored' or 'failed') and 'error'
+        """
+        started = time.monotonic()
+        entries = await asyncio.to_thread(self.journal.entries)
+        pending = [r for r in entries if r.get("window") == self.window_id]
+        results = await self._map(self._create, pending)
+        _report_restored(results, started)
+        self.released = []
+        return results
+
+    async def recover(self) -> List[Dict]:
+        """
+        Recreate locks left in the journal by windows whose process is gone.
+
+        Returns:
+            One result per lock with 'lock', 'status' ('restored' or 'failed') and 'error'
+        """
+        entries = await asyncio.to_thread(self.journal.entries)
+        orphaned = [r for r in entries if _is_orphaned(r)]
+        if not orphaned:
+            return []
+        print(f"Recovering {len(orphaned)} locks left released by an earlier run")
+        started = time.monotonic()
+        results = await self._map(self._create, orphaned)
+        _report_restored(results, started)
+        return results
+
+    async def close(self) -> None:
+        """Release the helpers' references on their shared async SDK clients."""
+        for helper in self._helpers.values():
+            await helper.close()
+
+    async def __aenter__(self):
+        await self.recover()
+        await self.release()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        try:
+            results = await self.restore()
+        finally:
+            await self.close()
+        failed = [r for r in results if r["status"] == "failed"]
+        if failed and exc_type is None:
+            raise RuntimeError(
+                f"Failed to recreate {len(failed)} locks; they remain in {self.journal.path}"
+            )
+        return False
@@ -0,0 +1,203 @@
+import asyncio
+from typing import List
+from .base import AzureResourceBase
+from .auth import AzureAuthentication
+
+
+class AzureResourceLock(AzureResourceBase):
+    def __init__(
+        self,
+        resource_group_name: str,
+        subscription_id: str = None,
+        auth: AzureAuthentication = None,
+    ):
+        """
+        Initialize async Azure Resource Locker operations.
+        Locks are not listed at construction time; they are loaded by the
+        first operation that needs them and kept until refresh_locks().
+
+        Args:
+            resource_group_name: Name of the resource group
+            subscription_id: Azure subscription ID. If not provided, will be retrieved from Azure CLI
+            auth: Optional async AzureAuthentication instance. If not provided, uses the shared instance
+        """
+        super().__init__(
+            resource_group_name=resource_group_name,
+            resource_name=None,  # Not needed for lock operations
+            resource_type="locks",  # Custom type for lock operations
+            subscription_id=subscription_id,
+            auth=auth,
+        )
+        self.lock_objs = None
+        self.deleted = False
+
+    async def load_locks(self) -> List:
+        """
+        Get the local lock snapshot, listing locks from ARM on first use.
+
+        Returns:
+            List of lock objects
+        """
+        if self.lock_objs is None:
+            self.lock_objs = await self.get_locks()
+        return self.lock_objs
+
+    async def refresh_locks(self) -> List:
+        """
+        Re-list the resource group's locks and replace the local snapshot.
+
+        Returns:
+            List of lock objects
+        """
+        self.lock_objs = await self.get_locks()
+        return self.lock_objs
+
+    async def get_locks(self) -> List:
+        """
+        Get all locks in the resource group.
+
+        Returns:
+            List of lock objects, empty list if no locks exist
+        """
+        try:
+            lock_list = [
+                lock
+                async for lock in self.lock_client.management_locks.list_at_resource_group_level(
+                    resource_group_name=self.resource_group_name
+                )
+            ]
+
+            if not lock_list:
+                print(f"No locks found in resource group {self.resource_group_name}")
+            else:
+                print(
+                    f"Found {len(lock_list)} locks in resource group {self.resource_group_name}"
+                )
+
+            return lock_list
+
+        except Exception as e:
+            print(f"Error getting resource locks: {str(e)}")
+            raise
+
+    async def release_locks(self) -> None:
+        """
+        Delete all locks in the resource group, concurrently.
+        Nothing is persisted, so locks stay released if the process dies before
+        recreate_locks(); use unlocked_window() when that matters.
+        """
+        try:
+            await self.load_locks()
+
+            if not self.lock_objs:
+                print("No locks to delete")
+                return
+
+            window = asyncio.Semaphore(16)
+
+            async def release(lock) -> None:
+                async with window:
+                    await self.lock_client.management_locks.delete_at_resource_group_level(
+                        self.resource_group_name, lock.name
+                    )
+                print(f"Temporarily released lock: {lock.name}")
+
+            await asyncio.gather(*(release(lock) for lock in self.lock_objs))
+
+            self.deleted = True
+        except Exception as e:
+            print(f"Error managing resource locks: {str(e)}")
+            raise
+
+    async def recreate_locks(self) -> None:
+        """
+        Recreate locks in the resource group, concurrently.
+        Only works if locks were previously deleted.
+        """
+        try:
+            if not self.lock_objs:
+                print("No locks to recreate")
+                return
+
+            if not self.deleted:
+                print("Locks were not deleted, skipping recreation")
+                return
+
+            window = asyncio.Semaphore(16)
+
+            async def recreate(lock) -> None:
+                async with window:
+                    await self.lock_client.management_locks.create_or_update_at_resource_group_level(
+                        resource_group_name=self.resource_group_name,
+                        lock_name=lock.name,
+                        parameters={"level": lock.level, "notes": lock.notes},
+                    )
+                print(f"Reset lock: {lock.name}")
+
+            await asyncio.gather(*(recreate(lock) for lock in self.lock_objs))
+
+            self.deleted = False
+        except Exception as e:
+            print(f"Error recreating resource locks: {str(e)}")
+            raise
+
+    def unlocked_window(self, journal=None):
+        """
+        Async context manager that releases the resource group's locks and
+        recreates them on exit, journaling them on disk so a crashed run is recovered.
+
+        Args:
+            journal: Optional LockJournal or journal file path
+
+        Returns:
+            UnlockedWindow for this resource group
+        """
+        from .lock_window import UnlockedWindow
+
+        return UnlockedWindow(
+            [(self.subscription_id, self.resource_group_name)],
+            auth=self.auth,
+            journal=journal,
+        )
+
+    async def create_lock(
+        self, lock_name: str, level: str = "CanNotDelete", notes: str = None
+    ) -> None:
+        """
+        Create a new resource lock at the resource group level.
+
+        Args:
+            lock_name: Name of the lock to create
+            level: Lock level, either "CanNotDelete" or "ReadOnly". Defaults to "CanNotDelete"
+            notes: Optional notes about the lock
+        """
+        try:
+            if level not in ["CanNotDelete", "ReadOnly"]:
+                raise ValueError(
+                    "Lock level must be either 'CanNotDelete' or 'ReadOnly'"
+                )
+
+            snapshot = await self.load_locks()
+            # While the locks are released the snapshot lists locks that no longer exist
+            live = await self.get_locks() if self.deleted else snapshot
+            for lock in live:
+                if lock.name == lock_name:
+                    print(f"Lock {lock_name} already exists")
+                    return
+
+            created = await self.lock_client.management_locks.create_or_update_at_resource_group_level(
+                resource_group_name=self.resource_group_name,
+                lock_name=lock_name,
+                parameters={"level": level, "notes": notes},
+            )
+            print(f"Created lock: {lock_name} with level {level}")
+
+            # Update the local snapshot from the response instead of re-listing,
+            # replacing a released lock of the same name so it is not recreated twice
+            self.lock_objs[:] = [
+                lock for lock in self.lock_objs if lock.name != lock_name
+            ] + [created]
+
+        except Exception as e:
+            print(f"Error creating resource lock: {str(e)}")
+            raise
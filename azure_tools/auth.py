@@ -1,40 +1,175 @@
-from azure.identity import DefaultAzureCredential
-from datetime import datetime, timedelta
+from datetime import datetime
 from subprocess import PIPE, run
+from typing import TYPE_CHECKING, Dict, Tuple
+import asyncio
+import threading
+import time
+from .token_cache import (
+    EXPIRY_MARGIN,
+    CachedTokenCredential,
+    KeyedLocks,
+    PersistentTokenCache,
+    _request_options,
+    token_cache_enabled,
+)
+
+if TYPE_CHECKING:
+    from azure.core.credentials import AccessToken
+
+
+# Scope of Azure Resource Manager, used when no scope is given
+MANAGEMENT_SCOPE = "https://management.azure.com/.default"
+
+
+def _is_valid(token: "AccessToken") -> bool:
+    return token is not None and token.expires_on - time.time() > EXPIRY_MARGIN
+
+
+class _SharedTokenCredential:
+    """
+    Credential handed to SDK clients. Token requests are served from the owning
+    AzureAuthentication's keyed token set, so SDK clients, raw REST calls and
+    Key Vault share one token per scope and tenant.
+    """
+
+    def __init__(self, auth: "AzureAuthentication"):
+        self._auth = auth
+
+    def get_token(
+        self, *scopes: str, claims: str = None, tenant_id: str = None, **kwargs
+    ) -> "AccessToken":
+        if claims:
+            # Claims challenges must reach the identity provider
+            return self._auth._credential.get_token(
+                *scopes, claims=claims, tenant_id=tenant_id, **kwargs
+            )
+        return self._auth.get_access_token(
+            *scopes, tenant_id=tenant_id, enable_cae=kwargs.get("enable_cae", False)
+        )
+
+    def close(self) -> None:
+        self._auth._credential.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
 
 
 class AzureAuthentication:
     """
     Shared authentication class for Azure resources.
     Manages credentials and tokens only - no subscription management.
+    Tokens are kept per scope and tenant, and each one is refreshed by a
+    single caller at a time while concurrent callers wait for its result.
     """
-    
-    def __init__(self):
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, token_cache: PersistentTokenCache = None):
         """
         Initialize Azure authentication.
+
+        Args:
+            token_cache: Optional on-disk token cache shared with other processes.
+                If not provided, one is used when AZURE_TOOLS_TOKEN_CACHE is set
         """
-        self.credential = DefaultAzureCredential()
+        if token_cache is None and token_cache_enabled():
+            token_cache = PersistentTokenCache()
+        self.token_cache = token_cache
+        # azure.identity is a heavy import, so it is deferred until a helper needs credentials
+        from azure.identity import DefaultAzureCredential
+
+        self._credential = DefaultAzureCredential()
+        if token_cache is not None:
+            self._credential = CachedTokenCredential(self._credential, token_cache)
+        self.credential = _SharedTokenCredential(self)
+        self._tokens: Dict[Tuple[Tuple[str, ...], str, bool], "AccessToken"] = {}
+        self._token_locks = KeyedLocks()
+        # Management token, kept for callers that read these attributes directly
         self.token = None
         self.token_expiry = None
-    
-    def get_token(self):
+
+    @classmethod
+    def shared(cls) -> "AzureAuthentication":
+        """
+        Get the process-wide authentication instance.
+        Helpers created without an explicit auth use this instance so they share
+        one credential, one token cache and the same pooled SDK clients.
+
+        Returns:
+            The shared AzureAuthentication instance
+        """
+        if cls._shared is None:
+            with cls._shared_lock:
+                if cls._shared is None:
+                    cls._shared = cls()
+        return cls._shared
+
+    def get_access_token(
+        self, *scopes: str, tenant_id: str = None, enable_cae: bool = False
+    ) -> "AccessToken":
+        """
+        Get a token for the given scopes and tenant, acquiring it if the cached
+        one is missing or expires within five minutes. Only one caller acquires
+        a given token at a time; others wait for it instead of calling Entra ID.
+
+        Args:
+            *scopes: Token scopes. Defaults to Azure Resource Manager
+            tenant_id: Optional tenant to request the token from
+            enable_cae: Request a Continuous Access Evaluation token (as Key Vault does)
+
+        Returns:
+            AccessToken with the token and its expiry
+        """
+        scopes = scopes or (MANAGEMENT_SCOPE,)
+        key = (tuple(sorted(scopes)), tenant_id, enable_cae)
+        token = self._tokens.get(key)
+        if _is_valid(token):
+            return token
+        with self._token_locks(key):
+            token = self._tokens.get(key)
+            if _is_valid(token):
+                return token
+            print(f"Generating new token for {' '.join(scopes)}...")
+            token = self._credential.get_token(
+                *scopes, **_request_options(tenant_id, enable_cae)
+            )
+            self._tokens[key] = token
+            if key == ((MANAGEMENT_SCOPE,), None, False):
+                self.token = token.token
+                self.token_expiry = datetime.fromtimestamp(
+                    token.expires_on - EXPIRY_MARGIN
+                )
+            return token
+
+    def get_token(self, scope: str = MANAGEMENT_SCOPE, tenant_id: str = None) -> str:
         """
         Get a new token if current one is expired or doesn't exist.
         Returns cached token if still valid.
+
+        Args:
+            scope: Token scope. Defaults to Azure Resource Manager
+            tenant_id: Optional tenant to request the token from
+
+        Returns:
+            The bearer token string
         """
-        now = datetime.now()
-        if (
-            self.token is None
-            or self.token_expiry is None
-            or (self.token_expiry is not None and now >= self.token_expiry)
-        ):
-            print("Generating new token...")
-            token_response = self.credential.get_token(
-                "https://management.azure.com/.default"
-            )
-            self.token = token_response.token
-            # Convert expires_on (Unix timestamp) to datetime
-            self.token_expiry = datetime.fromtimestamp(
-                token_response.expires_on
-            ) - timedelta(minutes=5)
-        return self.token
+        return self.get_access_token(scope, tenant_id=tenant_id).token
+
+    async def get_token_async(
+        self, scope: str = MANAGEMENT_SCOPE, tenant_id: str = None
+    ) -> str:
+        """
+        Async variant of get_token for use from event loops. Cached tokens are
+        returned without leaving the loop; acquisition runs in a worker thread
+        so it does not block other coroutines.
+        """
+        token = self._tokens.get(((scope,), tenant_id, False))
+        if _is_valid(token):
+            return token.token
+        return (
+            await asyncio.to_thread(self.get_access_token, scope, tenant_id=tenant_id)
+        ).token
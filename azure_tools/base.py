@@ -1,11 +1,12 @@
-from azure.mgmt.datafactory import DataFactoryManagementClient
-from azure.mgmt.batch import BatchManagementClient
-from azure.keyvault.secrets import SecretClient
-from azure.mgmt.resource.locks import ManagementLockClient
+import threading
+import time
+import weakref
 from typing import Literal
 from .auth import AzureAuthentication
+from .client_registry import get_client_registry
+from .http_session import get_http_session
+from .throttling import principal_from_token, send_with_retry
 from .subscription_resource import SubscriptionResourceManager
-from subprocess import PIPE, run
 
 
 class AzureResourceBase:
@@ -25,48 +26,85 @@ class AzureResourceBase:
             resource_name: Name of the resource (ADF factory, Batch account, or Key Vault)
             resource_type: Type of resource ('adf', 'batch', 'keyvault', or 'locks')
             subscription_id: Azure subscription ID. If not provided, will be retrieved from environment or CLI
-            auth: Optional AzureAuthentication instance. If not provided, creates a new one
+            auth: Optional AzureAuthentication instance. If not provided, uses the shared instance
         """
         self.resource_group_name = resource_group_name
         self.resource_name = resource_name
         self.resource_type = resource_type.lower()
-        
-        # Use provided auth instance or create a new one
-        self.auth = auth if auth is not None else AzureAuthentication()
-        
-        # Handle subscription_id independently
-        if subscription_id is None:
-            subscription_id = SubscriptionResourceManager.get_subscription_id()
-        
-        self.subscription_id = subscription_id
-        
+
+        # Use provided auth instance or the process-wide shared one
+        self.auth = auth if auth is not None else AzureAuthentication.shared()
+
+        # Handle subscription_id independently (memoized for the process after first lookup)
+        self.subscription_id = SubscriptionResourceManager.get_subscription_id(
+            subscription_id
+        )
+
         # For backward compatibility, expose credential and token methods
         self.credential = self.auth.credential
-        
-        # Initialize appropriate client based on resource type
-        if self.resource_type == "adf":
-            self.client = DataFactoryManagementClient(
-                credential=self.credential, subscription_id=self.subscription_id,
-            )
-        elif self.resource_type == "batch":
-            self.client = BatchManagementClient(
-                credential=self.credential, subscription_id=self.subscription_id,
-            )
+
+        # The SDK client is drawn from the shared registry on first use, so helpers
+        # that never make a call never import or build an SDK client
+        if self.resource_type in ("adf", "batch", "locks"):
+            self._client_scope = self.subscription_id
         elif self.resource_type == "keyvault":
-            self.secret_client = SecretClient(
-                vault_url=f"https://{resource_name}.vault.azure.net",
-                credential=self.credential,
-            )
-        elif self.resource_type == "locks":
-            self.lock_client = ManagementLockClient(
-                credential=self.credential, subscription_id=self.subscription_id,
-            )
+            self._client_scope = f"https://{resource_name}.vault.azure.net"
         else:
             raise ValueError(
                 f"Unsupported resource type: {resource_type}. Must be 'adf', 'batch', 'keyvault', or 'locks'"
             )
+        self._client = None
+        self._client_lock = threading.Lock()
+
+    @property
+    def client(self):
+        """SDK client for this helper's resource type, acquired on first access."""
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = self._acquire_client(
+                        self.resource_type, self._client_scope
+                    )
+        return self._client
+
+    @client.setter
+    def client(self, value):
+        self._client = value
+
+    # Resource-specific names kept for the Key Vault and lock helpers
+    secret_client = client
+    lock_client = client
+
+    def _acquire_client(self, client_type: str, scope: str):
+        """
+        Take a reference on a shared SDK client from the process-wide registry.
+        The reference is also given back when the helper is garbage collected
+        without close(), so dropped helpers don't pin clients in the registry.
+        """
+        registry = get_client_registry()
+        client = registry.acquire(client_type, scope, self.credential)
+        self._release_client = weakref.finalize(
+            self, registry.release, client_type, scope, self.credential
+        )
+        return client
 
+    def close(self) -> None:
+        """
+        Release this helper's reference on its shared SDK client.
+        The client itself stays open for other helpers until the registry evicts it.
+        """
+        release = getattr(self, "_release_client", None)
+        if release is None:
+            return
+        self._release_client = None
+        self._client = None
+        release()
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def _get_token(self):
         """
@@ -75,6 +113,58 @@ class AzureResourceBase:
         """
         return self.auth.get_token()
 
+    def _arm_request(
+        self,
+        method: str,
+        api_url: str,
+        retry_transient: bool = None,
+        deadline: float = None,
+        **kwargs,
+    ):
+        """
+        Send a raw REST request to Azure Resource Manager through the shared
+        keep-alive HTTP session, under the shared ARM rate limiter and with
+        Retry-After aware retries on throttling and transient errors.
+
+        Args:
+            method: HTTP method
+            api_url: Absolute request URL
+            retry_transient: Retry 5xx responses. Defaults to True for idempotent methods only
+            deadline: Optional time.monotonic() deadline for the request and its retries.
+                Each attempt's timeout is cut to the time remaining
+            **kwargs: json, params, timeout or extra headers for the request
+
+        Returns:
+            The HTTP response
+        """
+        token = self._get_token()
+        headers = {
+            "Authorization": f"Bearer {token}",
+            "Content-Type": "application/json",
+            **kwargs.pop("headers", {}),
+        }
+
+        def send():
+            request_kwargs = kwargs
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                request_kwargs = {
+                    **kwargs,
+                    "timeout": min(remaining, kwargs.get("timeout") or remaining),
+                }
+            return get_http_session().request(
+                method, api_url, headers=headers, **request_kwargs
+            )
+
+        return send_with_retry(
+            send,
+            url=api_url,
+            method=method,
+            principal=principal_from_token(token),
+            retry_transient=retry_transient,
+            deadline=deadline,
+        )
+
     def get_resource_details(self):
         """
         Get details of the resource based on its type
@@ -92,4 +182,4 @@ class AzureResourceBase:
                 )
         except Exception as e:
             print(f"Error getting {self.resource_type} details: {str(e)}")
-            raise
\ No newline at end of file
+            raise
@@ -1,7 +1,72 @@
 import json
-from typing import Dict
+from typing import Dict, Optional
 from .base import AzureResourceBase
 from .auth import AzureAuthentication
+from .waiters import Waiter
+
+
+def fixed_scale_patch(
+    target_dedicated_nodes: int,
+    target_low_priority_nodes: int = None,
+    resize_timeout: str = None,
+    node_deallocation_option: str = None,
+) -> Dict:
+    """
+    PATCH body that changes only a pool's fixed scale settings.
+    Sent as raw JSON, since serializing a Pool model would also send its
+    defaults (e.g. taskSlotsPerNode) and overwrite the pool's own values.
+    """
+    fixed_scale = {"targetDedicatedNodes": target_dedicated_nodes}
+    if target_low_priority_nodes is not None:
+        fixed_scale["targetLowPriorityNodes"] = target_low_priority_nodes
+    if resize_timeout is not None:
+        fixed_scale["resizeTimeout"] = resize_timeout
+    if node_deallocation_option is not None:
+        fixed_scale["nodeDeallocationOption"] = node_deallocation_option
+    return {"properties": {"scaleSettings": {"fixedScale": fixed_scale}}}
+
+
+def pool_state(pool) -> Dict:
+    """Compact scaling state of a Pool model."""
+    fixed_scale = pool.scale_settings.fixed_scale if pool.scale_settings else None
+    resize_status = pool.resize_operation_status
+    return {
+        "etag": pool.etag,
+        "allocation_state": pool.allocation_state,
+        "current_dedicated_nodes": pool.current_dedicated_nodes,
+        "current_low_priority_nodes": pool.current_low_priority_nodes,
+        "target_dedicated_nodes": (
+            fixed_scale.target_dedicated_nodes if fixed_scale else None
+        ),
+        "target_low_priority_nodes": (
+            fixed_scale.target_low_priority_nodes if fixed_scale else None
+        ),
+        "auto_scale": bool(pool.scale_settings and pool.scale_settings.auto_scale),
+        "resize_errors": (
+            [error.message for error in (resize_status.errors or [])]
+            if resize_status
+            else []
+        ),
+    }
+
+
+def is_steady(state: Dict) -> bool:
+    return (state["allocation_state"] or "").lower() == "steady"
+
+
+def has_targets(
+    state: Dict,
+    target_dedicated_nodes: int = None,
+    target_low_priority_nodes: int = None,
+) -> bool:
+    """Whether a pool state carries the given targets; None matches any target."""
+    return (
+        target_dedicated_nodes is None
+        or state["target_dedicated_nodes"] == target_dedicated_nodes
+    ) and (
+        target_low_priority_nodes is None
+        or (state["target_low_priority_nodes"] or 0) == target_low_priority_nodes
+    )
 
 
 class AzureBatchPool(AzureResourceBase):
@@ -21,7 +86,7 @@ class AzureBatchPool(AzureResourceBase):
             resource_name: Name of the batch account
             pool_name: Name of the pool
             subscription_id: Optional subscription ID
-            auth: Optional AzureAuthentication instance. If not provided, creates a new one
+            auth: Optional AzureAuthentication instance. If not provided, uses the shared instance
         """
         super().__init__(
             resource_group_name=resource_group_name,
@@ -50,62 +115,181 @@ class AzureBatchPool(AzureResourceBase):
             print(f"Error getting pool configuration: {str(e)}")
             raise
 
-    def scale_pool_nodes(self, target_nodes: int, dry_run: bool = True) -> Dict:
+    def get_pool_state(self) -> Dict:
         """
-        Scale the number of nodes in the batch pool.
-
-        Args:
-            target_nodes: Target number of nodes (0 or positive integer)
-            dry_run: If True, only show what would be changed without making changes
+        Get the scaling state of the batch pool.
 
         Returns:
-            Dict containing the updated pool configuration
+            Dict with 'etag', 'allocation_state', current and target node counts,
+            'auto_scale' and 'resize_errors'
         """
         try:
-            if target_nodes < 0:
-                raise ValueError("Target nodes must be 0 or a positive integer")
-
-            # Get current pool configuration
-            pool_config = self.get_pool_config()
-            current_nodes = (
-                pool_config.get("scaleSettings", {})
-                .get("fixedScale", {})
-                .get("targetDedicatedNodes", 0)
+            return pool_state(
+                self.client.pool.get(
+                    resource_group_name=self.resource_group_name,
+                    account_name=self.resource_name,
+                    pool_name=self.pool_name,
+                )
             )
+        except Exception as e:
+            print(f"Error getting pool state: {str(e)}")
+            raise
 
-            print(f"Current node count: {current_nodes}")
-            print(f"Target node count: {target_nodes}")
+    def resize_pool(
+        self,
+        target_dedicated_nodes: int,
+        target_low_priority_nodes: int = None,
+        resize_timeout: str = None,
+        node_deallocation_option: str = None,
+        etag: str = None,
+        wait: bool = False,
+        timeout: float = 1800,
+        waiter: Waiter = None,
+        dry_run: bool = False,
+    ) -> Dict:
+        """
+        Resize the pool with a PATCH carrying only its fixed scale settings,
+        conditional on the pool's ETag so a concurrent edit fails the call
+        instead of being overwritten.
 
-            if current_nodes == target_nodes:
-                print(
-                    f"Pool {self.pool_name} already has {target_nodes} nodes. No changes needed."
-                )
-                return pool_config
+        Args:
+            target_dedicated_nodes: Target number of dedicated nodes
+            target_low_priority_nodes: Target number of Spot/low-priority nodes.
+                Defaults to the pool's current target
+            resize_timeout: Optional ISO 8601 duration for the resize, e.g. "PT15M"
+            node_deallocation_option: Optional "Requeue", "Terminate", "TaskCompletion" or "RetainedData"
+            etag: ETag the pool is expected to have. If not provided, the pool is read first
+                (and an unchanged target is skipped); with it, no read is made
+            wait: If True, wait until the pool's allocation state is Steady again
+            timeout: Seconds to wait for the pool to become steady
+            waiter: Optional Waiter controlling the polling schedule
+            dry_run: If True, only show the PATCH body that would be sent
 
-            # Update the scale settings
-            pool_config["scaleSettings"] = {
-                "fixedScale": {"targetDedicatedNodes": target_nodes}
-            }
+        Returns:
+            Pool scaling state: as accepted by the service, or once steady when wait is True
+        """
+        try:
+            if target_dedicated_nodes < 0 or (target_low_priority_nodes or 0) < 0:
+                raise ValueError("Target nodes must be 0 or a positive integer")
 
+            state = None
+            if etag is None:
+                state = self.get_pool_state()
+                etag = state["etag"]
+                if target_low_priority_nodes is None:
+                    target_low_priority_nodes = state["target_low_priority_nodes"]
+                if (
+                    not state["auto_scale"]
+                    and state["target_dedicated_nodes"] == target_dedicated_nodes
+                    and state["target_low_priority_nodes"] == target_low_priority_nodes
+                ):
+                    print(
+                        f"Pool {self.pool_name} already targets {target_dedicated_nodes} nodes. No changes needed."
+                    )
+                    return self.wait_for_steady(timeout, waiter) if wait else state
+
+            body = fixed_scale_patch(
+                target_dedicated_nodes,
+                target_low_priority_nodes,
+                resize_timeout,
+                node_deallocation_option,
+            )
             if dry_run:
                 print(
-                    f"What if: Would scale pool {self.pool_name} to {target_nodes} nodes"
+                    f"What if: Would scale pool {self.pool_name} to {target_dedicated_nodes} nodes"
                 )
-                print("New configuration:")
-                print(json.dumps(pool_config, indent=2))
-                return pool_config
+                print(f"PATCH (If-Match: {etag}):")
+                print(json.dumps(body, indent=2))
+                return state or {"etag": etag}
 
-            # Update the pool
             response = self.client.pool.update(
                 resource_group_name=self.resource_group_name,
                 account_name=self.resource_name,
                 pool_name=self.pool_name,
-                parameters=pool_config,
+                parameters=json.dumps(body).encode("utf-8"),
+                if_match=etag,
             )
-
-            print(f"Successfully scaled pool {self.pool_name} to {target_nodes} nodes")
-            return response.as_dict()
+            print(
+                f"Resize of pool {self.pool_name} to {target_dedicated_nodes} nodes accepted"
+            )
+            if wait:
+                return self.wait_for_steady(
+                    timeout,
+                    waiter,
+                    target_dedicated_nodes=target_dedicated_nodes,
+                    target_low_priority_nodes=target_low_priority_nodes,
+                )
+            return pool_state(response)
 
         except Exception as e:
-            print(f"Error scaling pool nodes: {str(e)}")
-            raise 
\ No newline at end of file
+            print(f"Error resizing pool: {str(e)}")
+            raise
+
+    def wait_for_steady(
+        self,
+        timeout: float = 1800,
+        waiter: Waiter = None,
+        target_dedicated_nodes: int = None,
+        target_low_priority_nodes: int = None,
+    ) -> Dict:
+        """
+        Wait until the pool's allocation state is Steady.
+        A resize is applied asynchronously, so a read right after it may still
+        show the old, steady pool; with target counts given, only a steady
+        state that already carries those targets is accepted.
+
+        Args:
+            timeout: Seconds to wait
+            waiter: Optional Waiter controlling the polling schedule
+            target_dedicated_nodes: Dedicated target the pool must show, if any
+            target_low_priority_nodes: Low-priority target the pool must show, if any
+
+        Returns:
+            Pool scaling state once steady
+        """
+        waiter = waiter or Waiter(
+            initial_delay=5,
+            max_delay=30,
+            timeout=timeout,
+            on_progress=lambda attempt, elapsed, _: print(
+                f"Waiting for pool {self.pool_name} to become steady ({elapsed:.0f}s)..."
+            ),
+        )
+
+        def check() -> Optional[Dict]:
+            state = self.get_pool_state()
+            return (
+                state
+                if is_steady(state)
+                and has_targets(
+                    state, target_dedicated_nodes, target_low_priority_nodes
+                )
+                else None
+            )
+
+        state = waiter.wait_until(
+            check, description=f"pool {self.pool_name} to become steady"
+        )
+        for error in state["resize_errors"]:
+            print(f"Resize error: {error}")
+        print(
+            f"Pool {self.pool_name} is steady with {state['current_dedicated_nodes']} dedicated "
+            f"and {state['current_low_priority_nodes']} low-priority nodes"
+        )
+        return state
+
+    def scale_pool_nodes(self, target_nodes: int, dry_run: bool = True) -> Dict:
+        """
+        Scale the number of nodes in the batch pool.
+        Sends only the new scale settings, conditional on the pool's ETag.
+
+        Args:
+            target_nodes: Target number of nodes (0 or positive integer)
+            dry_run: If True, only show what would be changed without making changes
+
+        Returns:
+            Pool scaling state as returned by resize_pool(): 'etag', 'allocation_state',
+            current and target node counts, 'auto_scale' and 'resize_errors'.
+            This used to be the full pool configuration; use get_pool_config() for that
+        """
+        return self.resize_pool(target_nodes, dry_run=dry_run)
@@ -0,0 +1,360 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Optional, Tuple, Union
+from .auth import AzureAuthentication
+from .batch import AzureBatchPool
+from .subscription_resource import SubscriptionResourceManager
+from .throttling import TokenBucket
+from .waiters import Waiter
+
+# (resource_group, account, pool) or (subscription_id, resource_group, account, pool)
+PoolRef = Union[Tuple[str, str, str], Tuple[str, str, str, str]]
+
+# Dedicated node count, or (dedicated, low-priority). A low-priority count of
+# None keeps the pool's current low-priority target
+PoolTarget = Union[int, Tuple[int, Optional[int]]]
+
+# Resize calls per Batch account: (burst, calls per second)
+ACCOUNT_RATE_LIMIT = (5, 2.0)
+
+
+def _is_node_count(value) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+@dataclass
+class BatchScalingItem:
+    """Current and requested scale targets of one pool."""
+
+    subscription_id: str
+    resource_group_name: str
+    account_name: str
+    pool_name: str
+    current_dedicated: Optional[int]
+    current_low_priority: Optional[int]
+    target_dedicated: int
+    target_low_priority: Optional[int]
+    allocation_state: Optional[str] = None
+    etag: Optional[str] = None
+
+    @property
+    def key(self) -> str:
+        return "/".join(
+            (
+                self.subscription_id,
+                self.resource_group_name,
+                self.account_name,
+                self.pool_name,
+            )
+        )
+
+    @property
+    def changed(self) -> bool:
+        return (self.current_dedicated, self.current_low_priority) != (
+            self.target_dedicated,
+            self.target_low_priority,
+        )
+
+
+class BatchScalingOrchestrator:
+    """
+    Scales many pools across many Batch accounts to a target map.
+    The plan reads every pool's scaling state concurrently. Apply sends the
+    ETag-conditional resize PATCHes concurrently, each account under its own
+    rate limit, then waits for every resized pool to become steady in parallel
+    and reports the time each pool took.
+    """
+
+    def __init__(
+        self,
+        targets: Dict[PoolRef, PoolTarget],
+        subscription_id: str = None,
+        auth: AzureAuthentication = None,
+        max_workers: int = 32,
+        account_rate_limit: Tuple[float, float] = ACCOUNT_RATE_LIMIT,
+        timeout: float = 1800,
+    ):
+        """
+        Initialize the orchestrator.
+
+        Args:
+            targets: Mapping of pool to target, as (resource_group, account, pool) or
+                (subscription_id, resource_group, account, pool) keys and a dedicated node
+                count or (dedicated, low-priority) values
+            subscription_id: Subscription for pools given without one. If not provided,
+                resolved the same way as for the resource helpers
+            auth: Optional AzureAuthentication instance. If not provided, uses the shared instance
+            max_workers: Maximum number of concurrent read and resize calls
+            account_rate_limit: (burst, calls per second) of resize calls per Batch account
+            timeout: Seconds to wait for each pool to become steady
+        """
+        self.targets = self._resolve_targets(targets, subscription_id)
+        self.auth = auth if auth is not None else AzureAuthentication.shared()
+        self.max_workers = max_workers
+        self.account_rate_limit = account_rate_limit
+        self.timeout = timeout
+        self.items: List[BatchScalingItem] = []
+        self._buckets: Dict[Tuple[str, str], TokenBucket] = {}
+        self._buckets_lock = threading.Lock()
+
+    @staticmethod
+    def _resolve_targets(
+        targets: Dict[PoolRef, PoolTarget], subscription_id: str = None
+    ) -> Dict[Tuple[str, str, str, str], Tuple[int, Optional[int]]]:
+        default_subscription = None
+        resolved = {}
+        for pool, target in targets.items():
+            if len(pool) == 3:
+                if default_subscription is None:
+                    default_subscription = (
+                        SubscriptionResourceManager.get_subscription_id(subscription_id)
+                    )
+                pool = (default_subscription,) + tuple(pool)
+            if _is_node_count(target):
+                target = (target, None)
+            if not (
+                isinstance(target, tuple)
+                and len(target) == 2
+                and _is_node_count(target[0])
+                and (target[1] is None or _is_node_count(target[1]))
+            ):
+                raise ValueError(
+                    f"Target for {'/'.join(pool)} must be a node count or a "
+                    f"(dedicated, low-priority) tuple, got {target!r}"
+                )
+            dedicated, low_priority = target
+            if dedicated < 0 or (low_priority or 0) < 0:
+                raise ValueError(
+                    f"Target nodes for {'/'.join(pool)} must be 0 or positive integers"
+                )
+            resolved[tuple(pool)] = (dedicated, low_priority)
+        return resolved
+
+    def _helper(self, pool: Tuple[str, str, str, str]) -> AzureBatchPool:
+        subscription_id, resource_group_name, account_name, pool_name = pool
+        return AzureBatchPool(
+            resource_group_name=resource_group_name,
+            resource_name=account_name,
+            pool_name=pool_name,
+            subscription_id=subscription_id,
+            auth=self.auth,
+        )
+
+    def _bucket(self, item: BatchScalingItem) -> TokenBucket:
+        key = (item.subscription_id, item.account_name.lower())
+        with self._buckets_lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = TokenBucket(*self.account_rate_limit)
+        return bucket
+
+    def _read_item(self, pool: Tuple[str, str, str, str]) -> Optional[BatchScalingItem]:
+        target_dedicated, target_low_priority = self.targets[pool]
+        try:
+            with self._helper(pool) as helper:
+                state = helper.get_pool_state()
+        except Exception as e:
+            print(f"Error reading pool {'/'.join(pool[2:])}: {str(e)}")
+            return None
+        return BatchScalingItem(
+            *pool,
+            current_dedicated=state["target_dedicated_nodes"],
+            current_low_priority=state["target_low_priority_nodes"],
+            target_dedicated=target_dedicated,
+            target_low_priority=(
+                target_low_priority
+                if target_low_priority is not None
+                else state["target_low_priority_nodes"]
+            ),
+            allocation_state=state["allocation_state"],
+            etag=state["etag"],
+        )
+
+    def plan(self) -> Dict:
+        """
+        Read every pool's current targets concurrently and compare them with the target map.
+        Pools that cannot be read are reported and left out.
+
+        Returns:
+            Dictionary with 'changes', 'unchanged' and per-account change counts
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            items = [
+                i for i in executor.map(self._read_item, self.targets) if i is not None
+            ]
+        items.sort(key=lambda item: item.key)
+        self.items = items
+        by_account: Dict[str, int] = {}
+        for item in items:
+            if item.changed:
+                by_account[item.account_name] = by_account.get(item.account_name, 0) + 1
+        return {
+            "changes": [asdict(item) for item in items if item.changed],
+            "unchanged": [item.key for item in items if not item.changed],
+            "by_account": by_account,
+        }
+
+    def print_plan(self, plan: Dict = None) -> None:
+        plan = plan or self.plan()
+        print(
+            f"What if: Would resize {len(plan['changes'])} pools "
+            f"in {len(plan['by_account'])} accounts "
+            f"({len(plan['unchanged'])} already at target)"
+        )
+        for item in plan["changes"]:
+            print(
+                f"  {item['account_name']}/{item['pool_name']}: "
+                f"dedicated {item['current_dedicated']} -> {item['target_dedicated']}, "
+                f"low-priority {item['current_low_priority']} -> {item['target_low_priority']}"
+            )
+
+    def _resize(self, item: BatchScalingItem) -> Dict:
+        result = {
+            "key": item.key,
+            "pool": f"{item.account_name}/{item.pool_name}",
+            "status": "accepted",
+            "accept_seconds": None,
+            "steady_seconds": None,
+            "dedicated": None,
+            "low_priority": None,
+            "error": None,
+        }
+        delay = self._bucket(item).reserve()
+        if delay > 0:
+            time.sleep(delay)
+        started = time.monotonic()
+        try:
+            with self._helper(
+                (
+                    item.subscription_id,
+                    item.resource_group_name,
+                    item.account_name,
+                    item.pool_name,
+                )
+            ) as helper:
+                helper.resize_pool(
+                    item.target_dedicated,
+                    item.target_low_priority,
+                    etag=item.etag,
+                )
+        except Exception as e:
+            result.update(status="failed", error=str(e))
+        result["accept_seconds"] = round(time.monotonic() - started, 2)
+        result["_accepted_at"] = time.monotonic()
+        return result
+
+    def _wait(self, item: BatchScalingItem, result: Dict) -> Dict:
+        waiter = Waiter(initial_delay=5, max_delay=30, timeout=self.timeout)
+        try:
+            with self._helper(
+                (
+                    item.subscription_id,
+                    item.resource_group_name,
+                    item.account_name,
+                    item.pool_name,
+                )
+            ) as helper:
+                state = helper.wait_for_steady(
+                    waiter=waiter,
+                    target_dedicated_nodes=item.target_dedicated,
+                    target_low_priority_nodes=item.target_low_priority,
+                )
+            result.update(
+                status="steady",
+                dedicated=state["current_dedicated_nodes"],
+                low_priority=state["current_low_priority_nodes"],
+            )
+            if state["resize_errors"]:
+                result.update(status="failed", error="; ".join(state["resize_errors"]))
+        except TimeoutError as e:
+            result.update(status="timeout", error=str(e))
+        except Exception as e:
+            result.update(status="failed", error=str(e))
+        result["steady_seconds"] = round(time.monotonic() - result["_accepted_at"], 1)
+        return result
+
+    def apply(self, dry_run: bool = True, wait: bool = True) -> Union[Dict, List[Dict]]:
+        """
+        Apply the plan.
+
+        Args:
+            dry_run: If True, only print the plan
+            wait: If True, wait for every resized pool to become steady
+
+        Returns:
+            The plan when dry_run is True, otherwise one result per resized pool with
+            'key', 'pool', 'status' ('accepted', 'steady', 'timeout' or 'failed'),
+            'accept_seconds', 'steady_seconds' (time to steady after acceptance),
+            'dedicated', 'low_priority' and 'error'
+        """
+        plan = self.plan()
+        if dry_run:
+            self.print_plan(plan)
+            return plan
+
+        changes = [item for item in self.items if item.changed]
+        print(f"Resizing {len(changes)} pools with {self.max_workers} workers")
+        started = time.monotonic()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = list(executor.map(self._resize, changes))
+
+        accepted = [
+            (i, r) for i, r in zip(changes, results) if r["status"] == "accepted"
+        ]
+        if wait and accepted:
+            # Waits mostly sleep, so they get more threads than the resize calls
+            with ThreadPoolExecutor(
+                max_workers=min(len(accepted), self.max_workers * 4)
+            ) as executor:
+                list(executor.map(lambda pair: self._wait(*pair), accepted))
+        for result in results:
+            result.pop("_accepted_at", None)
+
+        print(
+            f"Finished scaling {len(changes)} pools in {time.monotonic() - started:.1f}s"
+        )
+        return results
+
+    @staticmethod
+    def print_report(results: List[Dict]) -> None:
+        """Print the apply results as a table followed by per-status totals."""
+        if not results:
+            print("No pools resized")
+            return
+        columns = (
+            "pool",
+            "status",
+            "accept_seconds",
+            "steady_seconds",
+            "dedicated",
+            "low_priority",
+        )
+        rows = [
+            [str(r[c]) if r[c] is not None else "-" for c in columns] for r in results
+        ]
+        widths = [
+            max(len(c), *(len(row[i]) for row in rows)) for i, c in enumerate(columns)
+        ]
+        print("  ".join(c.ljust(w) for c, w in zip(columns, widths)))
+        print("  ".join("-" * w for w in widths))
+        for row, result in zip(rows, results):
+            line = "  ".join(value.ljust(w) for value, w in zip(row, widths))
+            if result["error"]:
+                line += f"  {result['error']}"
+            print(line)
+
+        totals: Dict[str, int] = {}
+        for result in results:
+            totals[result["status"]] = totals.get(result["status"], 0) + 1
+        summary = ", ".join(
+            f"{count} {status}" for status, count in sorted(totals.items())
+        )
+        steady = sorted(r["steady_seconds"] for r in results if r["status"] == "steady")
+        if steady:
+            summary += (
+                f"; time to steady: slowest {steady[-1]:.1f}s, "
+                f"median {steady[len(steady) // 2]:.1f}s"
+            )
+        print(summary)
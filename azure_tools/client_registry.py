@@ -0,0 +1,236 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Tuple
+from .http_session import DEFAULT_POOL_SIZE
+from .throttling import sdk_throttling_kwargs
+
+
+class _RegistryEntry:
+    """One shared client with the helpers' reference count on it."""
+
+    __slots__ = ("client", "credential", "refcount", "retired")
+
+    def __init__(self, client: Any, credential: Any):
+        self.client = client
+        self.credential = credential
+        self.refcount = 0
+        # Set by clear() on clients still in use: closed when the last reference goes
+        self.retired = False
+
+
+class ClientRegistry:
+    """
+    Process-wide registry of Azure SDK clients.
+    Clients are keyed by (client type, scope, credential) so every helper that
+    targets the same subscription (or vault) with the same credential shares a
+    single HTTP pipeline, connection pool and token cache.
+    """
+
+    SUPPORTED_CLIENT_TYPES = {"adf", "batch", "keyvault", "locks"}
+
+    def __init__(self, max_size: int = 64):
+        """
+        Initialize the client registry.
+
+        Args:
+            max_size: Maximum number of clients kept open. Idle clients beyond this
+                bound are closed in least-recently-used order; clients still
+                referenced by a helper are closed once released
+        """
+        self.max_size = max_size
+        self._lock = threading.RLock()
+        self._entries: "OrderedDict[Tuple, _RegistryEntry]" = OrderedDict()
+
+    @staticmethod
+    def make_key(client_type: str, scope: str, credential: Any) -> Tuple[Hashable, ...]:
+        """
+        Build the registry key for a client.
+
+        Args:
+            client_type: Type of client ('adf', 'batch', 'keyvault', or 'locks')
+            scope: Subscription ID for management clients, vault URL for Key Vault
+            credential: Credential object the client authenticates with
+
+        Returns:
+            Tuple usable as a registry key
+        """
+        # The entry keeps a strong reference to the credential, so its id cannot be
+        # reused by another object while the key is live.
+        return (client_type, scope, id(credential))
+
+    def acquire(self, client_type: str, scope: str, credential: Any):
+        """
+        Get a shared client, creating it on first use, and take a reference on it.
+
+        Args:
+            client_type: Type of client ('adf', 'batch', 'keyvault', or 'locks')
+            scope: Subscription ID for management clients, vault URL for Key Vault
+            credential: Credential object the client authenticates with
+
+        Returns:
+            The shared SDK client
+        """
+        key = self.make_key(client_type, scope, credential)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                client = self._build_client(client_type, scope, credential)
+                entry = _RegistryEntry(client, credential)
+                self._entries[key] = entry
+            entry.refcount += 1
+            entry.retired = False
+            self._entries.move_to_end(key)
+            self._evict_idle()
+            return entry.client
+
+    def release(self, client_type: str, scope: str, credential: Any) -> None:
+        """
+        Drop a reference on a shared client.
+        The client stays open for reuse until it is evicted by the size bound
+        or the registry is cleared. A client retired by clear() is closed when
+        its last reference is dropped.
+
+        Args:
+            client_type: Type of client ('adf', 'batch', 'keyvault', or 'locks')
+            scope: Subscription ID for management clients, vault URL for Key Vault
+            credential: Credential object the client authenticates with
+        """
+        key = self.make_key(client_type, scope, credential)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.refcount == 0:
+                return
+            entry.refcount -= 1
+            if entry.refcount == 0 and entry.retired:
+                del self._entries[key]
+                self._close_client(entry.client)
+                return
+            self._evict_idle()
+
+    def _retire_all(self) -> list:
+        """
+        Remove every idle client and mark referenced ones to be closed on release.
+
+        Returns:
+            The removed idle clients, to be closed by the caller
+        """
+        with self._lock:
+            idle = []
+            for key, entry in list(self._entries.items()):
+                if entry.refcount == 0:
+                    del self._entries[key]
+                    idle.append(entry.client)
+                else:
+                    entry.retired = True
+            return idle
+
+    def clear(self) -> None:
+        """
+        Close every idle client in the registry. Clients still referenced by a
+        helper stay usable and are closed when their last reference is released.
+        Intended for process shutdown.
+        """
+        for client in self._retire_all():
+            self._close_client(client)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _evict_idle(self) -> None:
+        """Close least-recently-used idle clients while the registry is over its bound."""
+        if len(self._entries) <= self.max_size:
+            return
+        for key in list(self._entries):
+            if len(self._entries) <= self.max_size:
+                break
+            entry = self._entries[key]
+            if entry.refcount == 0:
+                del self._entries[key]
+                self._close_client(entry.client)
+
+    @staticmethod
+    def _close_client(client) -> None:
+        try:
+            client.close()
+        except Exception as e:
+            print(f"Error closing {type(client).__name__}: {str(e)}")
+
+    @staticmethod
+    def _pooled_transport():
+        """
+        Requests transport keeping DEFAULT_POOL_SIZE connections per host instead
+        of the default 10, so concurrent secret reads don't open throwaway connections.
+        """
+        import requests
+        from azure.core.pipeline.transport import RequestsTransport
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        session = requests.Session()
+        # Retries stay with the SDK pipeline, as in the transport's own session setup
+        adapter = HTTPAdapter(
+            pool_maxsize=DEFAULT_POOL_SIZE,
+            max_retries=Retry(total=False, redirect=False, raise_on_status=False),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return RequestsTransport(session=session, session_owner=True)
+
+    def _build_client(self, client_type: str, scope: str, credential: Any):
+        """Instantiate the SDK client for a registry entry."""
+        if client_type == "adf":
+            from azure.mgmt.datafactory import DataFactoryManagementClient
+
+            return DataFactoryManagementClient(
+                credential=credential,
+                subscription_id=scope,
+                **sdk_throttling_kwargs(),
+            )
+        elif client_type == "batch":
+            from azure.mgmt.batch import BatchManagementClient
+
+            return BatchManagementClient(
+                credential=credential,
+                subscription_id=scope,
+                **sdk_throttling_kwargs(),
+            )
+        elif client_type == "keyvault":
+            from azure.keyvault.secrets import SecretClient
+
+            return SecretClient(
+                vault_url=scope,
+                credential=credential,
+                transport=self._pooled_transport(),
+            )
+        elif client_type == "locks":
+            from azure.mgmt.resource.locks import ManagementLockClient
+
+            return ManagementLockClient(
+                credential=credential,
+                subscription_id=scope,
+                **sdk_throttling_kwargs(),
+            )
+        raise ValueError(
+            f"Unsupported client type: {client_type}. "
+            f"Must be one of: {', '.join(sorted(self.SUPPORTED_CLIENT_TYPES))}"
+        )
+
+
+_default_registry = None
+_default_registry_lock = threading.Lock()
+
+
+def get_client_registry() -> ClientRegistry:
+    """
+    Get the process-wide client registry shared by all azure_tools helpers.
+
+    Returns:
+        The default ClientRegistry instance
+    """
+    global _default_registry
+    if _default_registry is None:
+        with _default_registry_lock:
+            if _default_registry is None:
+                _default_registry = ClientRegistry()
+    return _default_registry
@@ -0,0 +1,148 @@
+import os
+import threading
+
+# Connections kept alive per host (management.azure.com, vault hosts, ...)
+DEFAULT_POOL_SIZE = int(os.getenv("AZURE_TOOLS_HTTP_POOL_SIZE", "32"))
+
+# Connect timeout in seconds; reads are unbounded because testConnectivity can take minutes
+DEFAULT_CONNECT_TIMEOUT = 10
+
+
+class ArmHttpSession:
+    """
+    Shared keep-alive HTTP session for raw REST calls against Azure endpoints.
+    Every direct REST call in azure_tools goes through one instance of this class,
+    so repeated calls to the same host reuse pooled TCP+TLS connections instead
+    of paying a new handshake per call.
+    """
+
+    def __init__(self, pool_size: int = DEFAULT_POOL_SIZE, http2: bool = False):
+        """
+        Initialize the HTTP session.
+
+        Args:
+            pool_size: Maximum number of keep-alive connections per host
+            http2: Use HTTP/2 via httpx when httpx and h2 are installed.
+                Falls back to pooled HTTP/1.1 via requests otherwise
+        """
+        self.pool_size = pool_size
+        self.http2 = http2 and self._http2_available()
+        if http2 and not self.http2:
+            print("HTTP/2 requested but httpx[http2] is not installed, using HTTP/1.1")
+
+        if self.http2:
+            import httpx
+
+            self._session = httpx.Client(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=None, max_keepalive_connections=pool_size
+                ),
+                timeout=httpx.Timeout(None, connect=DEFAULT_CONNECT_TIMEOUT),
+            )
+        else:
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            self._session = requests.Session()
+            # pool_connections is the number of hosts cached, pool_maxsize the
+            # connections kept per host
+            adapter = HTTPAdapter(pool_connections=16, pool_maxsize=pool_size)
+            self._session.mount("https://", adapter)
+            self._session.mount("http://", adapter)
+
+    @staticmethod
+    def _http2_available() -> bool:
+        try:
+            import httpx  # noqa: F401
+            import h2  # noqa: F401
+        except ImportError:
+            return False
+        return True
+
+    def request(self, method: str, url: str, **kwargs):
+        """
+        Send a request through the pooled session.
+
+        Args:
+            method: HTTP method
+            url: Absolute request URL
+            **kwargs: headers, json, params, timeout as accepted by requests
+
+        Returns:
+            Response object exposing status_code, headers, json() and raise_for_status()
+        """
+        if self.http2:
+            timeout = kwargs.pop("timeout", None)
+            if timeout is not None:
+                import httpx
+
+                kwargs["timeout"] = httpx.Timeout(
+                    timeout, connect=DEFAULT_CONNECT_TIMEOUT
+                )
+        else:
+            kwargs.setdefault("timeout", (DEFAULT_CONNECT_TIMEOUT, None))
+        return self._session.request(method, url, **kwargs)
+
+    def get(self, url: str, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url: str, **kwargs):
+        return self.request("PUT", url, **kwargs)
+
+    def patch(self, url: str, **kwargs):
+        return self.request("PATCH", url, **kwargs)
+
+    def delete(self, url: str, **kwargs):
+        return self.request("DELETE", url, **kwargs)
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        self._session.close()
+
+
+_default_session = None
+_default_session_lock = threading.Lock()
+
+
+def get_http_session() -> ArmHttpSession:
+    """
+    Get the process-wide HTTP session used by all raw REST calls in azure_tools.
+
+    Returns:
+        The shared ArmHttpSession instance
+    """
+    global _default_session
+    if _default_session is None:
+        with _default_session_lock:
+            if _default_session is None:
+                _default_session = ArmHttpSession(
+                    http2=os.getenv("AZURE_TOOLS_HTTP2", "").lower() in ("1", "true")
+                )
+    return _default_session
+
+
+def configure_http_session(
+    pool_size: int = DEFAULT_POOL_SIZE, http2: bool = False
+) -> ArmHttpSession:
+    """
+    Replace the process-wide HTTP session with one using the given settings.
+    The previous session's connections are closed.
+
+    Args:
+        pool_size: Maximum number of keep-alive connections per host
+        http2: Use HTTP/2 when httpx[http2] is installed
+
+    Returns:
+        The new shared ArmHttpSession instance
+    """
+    global _default_session
+    with _default_session_lock:
+        previous = _default_session
+        _default_session = ArmHttpSession(pool_size=pool_size, http2=http2)
+    if previous is not None:
+        previous.close()
+    return _default_session
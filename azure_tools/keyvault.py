@@ -1,6 +1,10 @@
-from typing import List, Dict
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Iterator, List
 from .base import AzureResourceBase
 from .auth import AzureAuthentication
+from .secret_cache import SecretCache, get_secret_cache
+from .throttling import get_vault_bucket
 
 
 class AzureKeyVault(AzureResourceBase):
@@ -10,6 +14,7 @@ class AzureKeyVault(AzureResourceBase):
         resource_name: str,
         subscription_id: str = None,
         auth: AzureAuthentication = None,
+        cache: SecretCache = None,
     ):
         """
         Initialize Azure Key Vault resource.
@@ -18,7 +23,8 @@ class AzureKeyVault(AzureResourceBase):
             resource_group_name: Name of the resource group
             resource_name: Name of the Key Vault
             subscription_id: Azure subscription ID. If not provided, will be retrieved from Azure CLI
-            auth: Optional AzureAuthentication instance. If not provided, creates a new one
+            auth: Optional AzureAuthentication instance. If not provided, uses the shared instance
+            cache: Optional SecretCache. If not provided, uses the process-wide cache
         """
         super().__init__(
             resource_group_name=resource_group_name,
@@ -27,50 +33,150 @@ class AzureKeyVault(AzureResourceBase):
             subscription_id=subscription_id,
             auth=auth,
         )
+        self.cache = cache if cache is not None else get_secret_cache()
 
-    def get_secret(self, secret_name: str) -> str:
+    @property
+    def vault_url(self) -> str:
+        return self._client_scope
+
+    def get_secret(
+        self, secret_name: str, version: str = None, use_cache: bool = True
+    ) -> str:
         """
         Get a secret from the key vault.
+        Values are served from the process-wide secret cache while fresh, and
+        concurrent misses for the same secret share a single vault call.
 
         Args:
             secret_name: Name of the secret to retrieve
+            version: Optional version to pin. Defaults to the latest version
+            use_cache: If False, always read the secret from the vault
 
         Returns:
             The secret value as a string
         """
         try:
-            secret = self.secret_client.get_secret(secret_name)
-            return secret.value
+            if not use_cache:
+                return self.secret_client.get_secret(secret_name, version).value
+
+            value = self.cache.get(self.vault_url, secret_name, version)
+            if value is not None:
+                return value
+
+            key = self.cache.key(self.vault_url, secret_name, version)
+            with self.cache.fetch_lock(key):
+                # Another caller may have fetched it while we waited
+                value = self.cache.get(self.vault_url, secret_name, version)
+                if value is not None:
+                    return value
+                secret = self.secret_client.get_secret(secret_name, version)
+                self.cache.put(
+                    self.vault_url,
+                    secret_name,
+                    secret.value,
+                    version=secret.properties.version,
+                    pinned=version is not None,
+                    expires_on=secret.properties.expires_on,
+                )
+                return secret.value
         except Exception as e:
             print(f"Error getting secret {secret_name}: {str(e)}")
             raise
 
-    def list_secrets(self) -> List[Dict]:
+    def get_secrets(
+        self, secret_names: Iterable[str], max_workers: int = 32
+    ) -> Dict[str, str]:
         """
-        List all secrets in the current key vault.
+        Get several secrets concurrently.
+        Cached values are returned without a call; the rest are fetched in
+        parallel under the vault's rate limit.
+
+        Args:
+            secret_names: Names of the secrets to retrieve
+            max_workers: Maximum number of concurrent vault calls. The default
+                matches the shared SecretClient's connection pool size
 
         Returns:
-            List of dictionaries containing secret properties (name, created_on, updated_on, enabled)
+            Dictionary of secret name to value
+        """
+        names = list(dict.fromkeys(secret_names))
+        values = {}
+        missing = []
+        for name in names:
+            value = self.cache.get(self.vault_url, name)
+            if value is None:
+                missing.append(name)
+            else:
+                values[name] = value
+
+        bucket = get_vault_bucket(self.vault_url)
+
+        def fetch(name: str) -> str:
+            delay = bucket.reserve()
+            if delay > 0:
+                time.sleep(delay)
+            return self.get_secret(name)
+
+        if missing:
+            with ThreadPoolExecutor(
+                max_workers=min(max_workers, len(missing))
+            ) as executor:
+                values.update(zip(missing, executor.map(fetch, missing)))
+        return {name: values[name] for name in names}
+
+    def iter_secret_properties(
+        self, prefix: str = None, tags: Dict[str, str] = None
+    ) -> Iterator[Dict]:
+        """
+        Stream secret properties page by page without holding the whole listing.
+        Key Vault cannot filter server-side, so prefix and tags are applied per page.
+
+        Args:
+            prefix: Optional secret name prefix to keep
+            tags: Optional tags every yielded secret must carry with the given values
+
+        Yields:
+            Dictionaries of secret properties (name, created_on, updated_on, enabled, content_type, tags)
         """
         try:
-            secrets = []
-            for secret in self.secret_client.list_properties_of_secrets():
-                secrets.append(
-                    {
+            for page in self.secret_client.list_properties_of_secrets().by_page():
+                for secret in page:
+                    if prefix and not secret.name.startswith(prefix):
+                        continue
+                    if tags and any(
+                        (secret.tags or {}).get(k) != v for k, v in tags.items()
+                    ):
+                        continue
+                    yield {
                         "name": secret.name,
                         "created_on": secret.created_on,
                         "updated_on": secret.updated_on,
                         "enabled": secret.enabled,
+                        "content_type": secret.content_type,
+                        "tags": secret.tags,
                     }
-                )
-            return secrets
         except Exception as e:
             print(f"Error listing secrets: {str(e)}")
             raise
 
+    def list_secrets(self) -> List[Dict]:
+        """
+        List all secrets in the current key vault.
+
+        Returns:
+            List of dictionaries containing secret properties (name, created_on, updated_on, enabled)
+        """
+        return [
+            {
+                key: secret[key]
+                for key in ("name", "created_on", "updated_on", "enabled")
+            }
+            for secret in self.iter_secret_properties()
+        ]
+
     def set_secret(self, secret_name: str, secret_value: str) -> None:
         """
-        Set a secret in the key vault.
+        Set a secret in the key vault and drop its cached latest value.
 
         Args:
             secret_name: Name of the secret to set
@@ -83,4 +189,7 @@ class AzureKeyVault(AzureResourceBase):
             )
         except Exception as e:
             print(f"Error setting secret {secret_name}: {str(e)}")
-            raise 
\ No newline at end of file
+            raise
+        finally:
+            # Even a failed set may have created a new version
+            self.cache.invalidate(self.vault_url, secret_name)
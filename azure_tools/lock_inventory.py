@@ -0,0 +1,254 @@
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+from .auth import AzureAuthentication
+from .http_session import get_http_session
+from .throttling import principal_from_token, send_with_retry
+
+RESOURCE_GRAPH_URL = (
+    "https://management.azure.com/providers/Microsoft.ResourceGraph/resources"
+    "?api-version=2022-10-01"
+)
+
+# Resource Graph accepts at most 1000 subscriptions per request and 1000 rows per page
+MAX_SUBSCRIPTIONS_PER_QUERY = 1000
+MAX_PAGE_SIZE = 1000
+
+# Management locks of every scope (subscription, resource group, resource)
+LOCKS_QUERY = """authorizationresources
+| where type =~ 'microsoft.authorization/locks'
+| project id, name, subscriptionId, resourceGroup,
+    level = tostring(properties.level), notes = tostring(properties.notes)
+| order by id asc"""
+
+_LOCK_ID_RE = re.compile(
+    r"^(?P<scope>.*?)/providers/Microsoft\.Authorization/locks/[^/]+$", re.IGNORECASE
+)
+
+
+def lock_scope(lock_id: str) -> str:
+    """Scope a lock applies to: its resource ID without the locks segment."""
+    match = _LOCK_ID_RE.match(lock_id)
+    return match.group("scope") if match else lock_id
+
+
+def scope_level(scope: str) -> str:
+    """'subscription', 'resourceGroup' or 'resource' for a lock scope."""
+    parts = scope.strip("/").split("/")
+    if len(parts) <= 2:
+        return "subscription"
+    if len(parts) <= 4:
+        return "resourceGroup"
+    return "resource"
+
+
+def lock_inventory_record(row: Dict) -> Dict:
+    """Compact record of one lock from a Resource Graph row."""
+    scope = lock_scope(row["id"])
+    return {
+        "id": row["id"],
+        "name": row["name"],
+        "subscription_id": row.get("subscriptionId"),
+        "resource_group": row.get("resourceGroup") or None,
+        "scope": scope,
+        "scope_level": scope_level(scope),
+        "level": row.get("level"),
+        "notes": row.get("notes") or None,
+    }
+
+
+class ResourceGraphBackend:
+    """
+    Runs Resource Graph queries over REST through the shared keep-alive
+    session, rate limiter and retry engine.
+    """
+
+    def __init__(self, auth: AzureAuthentication = None):
+        """
+        Initialize the backend.
+
+        Args:
+            auth: Optional AzureAuthentication instance. If not provided, uses the shared instance
+        """
+        self.auth = auth if auth is not None else AzureAuthentication.shared()
+
+    def query(
+        self,
+        query: str,
+        subscriptions: Optional[Sequence[str]] = None,
+        skip_token: str = None,
+        page_size: int = MAX_PAGE_SIZE,
+    ) -> Dict:
+        """
+        Fetch one page of query results.
+
+        Args:
+            query: KQL query
+            subscriptions: Subscriptions to query. If None, every subscription the caller can read
+            skip_token: $skipToken of the previous page
+            page_size: Rows per page
+
+        Returns:
+            Response body with 'data' (list of rows) and '$skipToken' when more pages follow
+        """
+        body = {
+            "query": query,
+            "options": {"resultFormat": "objectArray", "$top": page_size},
+        }
+        if subscriptions is not None:
+            body["subscriptions"] = list(subscriptions)
+        if skip_token:
+            body["options"]["$skipToken"] = skip_token
+
+        token = self.auth.get_token()
+        headers = {
+            "Authorization": f"Bearer {token}",
+            "Content-Type": "application/json",
+        }
+        response = send_with_retry(
+            lambda: get_http_session().post(
+                RESOURCE_GRAPH_URL, headers=headers, json=body
+            ),
+            url=RESOURCE_GRAPH_URL,
+            method="POST",
+            principal=principal_from_token(token),
+            # Queries are reads sent as POST, so transient errors can be retried
+            retry_transient=True,
+        )
+        response.raise_for_status()
+        return response.json()
+
+
+@dataclass
+class LockIndex:
+    """
+    Compact index of management locks: lock records by ID, and lock IDs by
+    scope (lower-cased) and by lock level.
+    """
+
+    records: Dict[str, Dict]
+    by_scope: Dict[str, List[str]] = field(default_factory=dict)
+    by_level: Dict[str, List[str]] = field(default_factory=dict)
+    built_at: float = field(default_factory=time.monotonic)
+
+    @classmethod
+    def build(cls, records: Iterable[Dict]) -> "LockIndex":
+        by_id = {}
+        by_scope: Dict[str, List[str]] = {}
+        by_level: Dict[str, List[str]] = {}
+        for record in records:
+            by_id[record["id"]] = record
+            by_scope.setdefault(record["scope"].lower(), []).append(record["id"])
+            by_level.setdefault(record["level"], []).append(record["id"])
+        return cls(records=by_id, by_scope=by_scope, by_level=by_level)
+
+    def locks_at(self, scope: str) -> List[Dict]:
+        """Locks applied directly at a scope (case-insensitive resource ID)."""
+        return [
+            self.records[i] for i in self.by_scope.get(scope.rstrip("/").lower(), [])
+        ]
+
+    def scopes(self, level: str = None) -> List[str]:
+        """Locked scopes, optionally only those holding a lock of the given level."""
+        ids = self.records if level is None else self.by_level.get(level, [])
+        return sorted({self.records[i]["scope"] for i in ids})
+
+    def resource_groups(self, level: str = None) -> List[tuple]:
+        """(subscription, resource group) pairs with a lock on the group itself."""
+        return sorted(
+            {
+                (r["subscription_id"], r["resource_group"])
+                for r in self.records.values()
+                if r["scope_level"] == "resourceGroup"
+                and (level is None or r["level"] == level)
+            }
+        )
+
+    def counts(self) -> Dict[str, Dict[str, int]]:
+        """Number of locks per scope level and lock level."""
+        counts: Dict[str, Dict[str, int]] = {}
+        for record in self.records.values():
+            by_level = counts.setdefault(record["scope_level"], {})
+            by_level[record["level"]] = by_level.get(record["level"], 0) + 1
+        return counts
+
+
+class LockInventory:
+    """
+    Inventory of management locks across subscriptions from Azure Resource Graph.
+    One paged query covers up to 1000 subscriptions, so the number of calls
+    depends on the number of locks, not on the number of resource groups.
+    """
+
+    def __init__(
+        self,
+        subscriptions: Sequence[str] = None,
+        auth: AzureAuthentication = None,
+        backend=None,
+        page_size: int = MAX_PAGE_SIZE,
+    ):
+        """
+        Initialize the lock inventory.
+
+        Args:
+            subscriptions: Subscription IDs to inventory. If not provided, every
+                subscription the caller can read
+            auth: Optional AzureAuthentication instance. If not provided, uses the shared instance
+            backend: Object with a query(query, subscriptions, skip_token, page_size) method
+                returning a Resource Graph response body. Defaults to ResourceGraphBackend
+            page_size: Rows requested per page, at most 1000
+        """
+        self.subscriptions = list(subscriptions) if subscriptions is not None else None
+        self.backend = backend if backend is not None else ResourceGraphBackend(auth)
+        self.page_size = min(page_size, MAX_PAGE_SIZE)
+
+    def _subscription_batches(self) -> List[Optional[List[str]]]:
+        if self.subscriptions is None:
+            return [None]
+        return [
+            self.subscriptions[i : i + MAX_SUBSCRIPTIONS_PER_QUERY]
+            for i in range(0, len(self.subscriptions), MAX_SUBSCRIPTIONS_PER_QUERY)
+        ]
+
+    def iter_locks(self) -> Iterator[Dict]:
+        """
+        Stream lock records page by page, following $skipToken.
+
+        Yields:
+            Lock records with 'id', 'name', 'subscription_id', 'resource_group',
+            'scope', 'scope_level', 'level' and 'notes'
+        """
+        try:
+            for subscriptions in self._subscription_batches():
+                skip_token = None
+                while True:
+                    page = self.backend.query(
+                        LOCKS_QUERY,
+                        subscriptions=subscriptions,
+                        skip_token=skip_token,
+                        page_size=self.page_size,
+                    )
+                    for row in page.get("data", []):
+                        yield lock_inventory_record(row)
+                    skip_token = page.get("$skipToken")
+                    if not skip_token:
+                        break
+        except Exception as e:
+            print(f"Error querying management locks from Resource Graph: {str(e)}")
+            raise
+
+    def build(self) -> LockIndex:
+        """
+        Run the inventory and index the locks by scope and level.
+
+        Returns:
+            LockIndex over every lock found
+        """
+        started = time.monotonic()
+        index = LockIndex.build(self.iter_locks())
+        print(
+            f"Found {len(index.records)} locks on {len(index.by_scope)} scopes "
+            f"in {time.monotonic() - started:.1f}s"
+        )
+        return index
@@ -0,0 +1,414 @@
+import json
+import os
+import socket
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Tuple, Union
+from .auth import AzureAuthentication
+from .locks import AzureResourceLock
+from .subscription_resource import SubscriptionResourceManager
+from .token_cache import DEFAULT_CACHE_DIR, _file_lock
+
+LOCK_JOURNAL_PATH_ENV = "AZURE_TOOLS_LOCK_JOURNAL"
+
+# Path segment between a lock's scope and its name in the lock id
+LOCKS_PROVIDER = "/providers/Microsoft.Authorization/locks/"
+
+ResourceGroupRef = Union[str, Tuple[str, str]]
+
+
+def resolve_resource_groups(
+    resource_groups: Iterable[ResourceGroupRef], subscription_id: str = None
+) -> List[Tuple[str, str]]:
+    """
+    Normalize resource group references to (subscription, resource group).
+    The subscription of plain resource group names is resolved once.
+    """
+    default_subscription = None
+    resolved = []
+    for resource_group in resource_groups:
+        if isinstance(resource_group, str):
+            if default_subscription is None:
+                default_subscription = SubscriptionResourceManager.get_subscription_id(
+                    subscription_id
+                )
+            resource_group = (default_subscription, resource_group)
+        resolved.append(tuple(resource_group))
+    return resolved
+
+
+def lock_record(subscription_id: str, resource_group_name: str, lock) -> Dict:
+    """
+    Journal entry holding everything needed to recreate a lock of a resource group.
+    Listing a resource group also returns the locks of its resources, so the
+    scope the lock was created at is taken from its id.
+    """
+    index = lock.id.lower().rfind(LOCKS_PROVIDER.lower()) if lock.id else -1
+    return {
+        "subscription_id": subscription_id,
+        "resource_group_name": resource_group_name,
+        "id": lock.id,
+        "scope": lock.id[:index] if index > 0 else None,
+        "name": lock.name,
+        "level": lock.level,
+        "notes": lock.notes,
+        "owners": [owner.application_id for owner in (lock.owners or [])],
+    }
+
+
+def lock_scope(record: Dict) -> str:
+    """Scope of a journaled lock: its resource group or one of the group's resources."""
+    if record.get("scope"):
+        return record["scope"]
+    # Entries journaled without a scope are resource group locks
+    return (
+        f"/subscriptions/{record['subscription_id']}"
+        f"/resourceGroups/{record['resource_group_name']}"
+    )
+
+
+def _lock_label(record: Dict) -> str:
+    """Lock name relative to its subscription, for progress messages."""
+    scope = lock_scope(record)
+    index = scope.lower().find("/resourcegroups/")
+    return f"{scope[index + len('/resourceGroups/'):]}/{record['name']}"
+
+
+def lock_parameters(record: Dict) -> Dict:
+    """Body of the create_or_update call that recreates a journaled lock."""
+    parameters = {"level": record["level"], "notes": record["notes"]}
+    if record.get("owners"):
+        parameters["owners"] = [{"applicationId": owner} for owner in record["owners"]]
+    return parameters
+
+
+def _process_alive(pid: int) -> bool:
+    if os.name == "nt":
+        import ctypes
+
+        # PROCESS_QUERY_LIMITED_INFORMATION; os.kill would terminate the process on Windows
+        handle = ctypes.windll.kernel32.OpenProcess(0x1000, False, pid)
+        if not handle:
+            return False
+        ctypes.windll.kernel32.CloseHandle(handle)
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _is_orphaned(record: Dict) -> bool:
+    """Whether a journal entry was left by a process that is no longer running."""
+    if record.get("host") != socket.gethostname() or not record.get("pid"):
+        return True
+    return not _process_alive(record["pid"])
+
+
+def _report_restored(results: List[Dict], started: float) -> None:
+    failed = [r for r in results if r["status"] == "failed"]
+    if results:
+        print(
+            f"Recreated {len(results) - len(failed)} locks, {len(failed)} failed "
+            f"in {time.monotonic() - started:.1f}s"
+        )
+    for result in failed:
+        print(f"  {result['lock']}: {result['error']} (kept in the lock journal)")
+
+
+def _record_key(record: Dict) -> str:
+    return f"{lock_scope(record)}/{record['name']}".lower()
+
+
+class LockJournal:
+    """
+    Local JSON file listing the locks that are (or may be) released.
+    An entry is written before its lock is deleted and removed only after the
+    lock has been recreated, so whatever is in the file after a crash is exactly
+    what has to be put back. The file is rewritten atomically under a file lock
+    and may be shared by several processes on the same host.
+    """
+
+    def __init__(self, path: str = None):
+        """
+        Initialize the journal.
+
+        Args:
+            path: Journal file. Defaults to AZURE_TOOLS_LOCK_JOURNAL or
+                ~/.azure_tools/lock_journal.json
+        """
+        self.path = (
+            path
+            or os.environ.get(LOCK_JOURNAL_PATH_ENV)
+            or os.path.join(DEFAULT_CACHE_DIR, "lock_journal.json")
+        )
+        os.makedirs(
+            os.path.dirname(os.path.abspath(self.path)), mode=0o700, exist_ok=True
+        )
+        self._lock_path = f"{self.path}.lock"
+        self._lock = threading.Lock()
+
+    def _read(self) -> Dict[str, Dict]:
+        if not os.path.exists(self.path):
+            return {}
+        with open(self.path, encoding="utf-8") as f:
+            locks = json.load(f).get("locks", {})
+        # Keys are derived from the entries, so journals written by older versions still match
+        return {_record_key(record): record for record in locks.values()}
+
+    def _write(self, entries: Dict[str, Dict]) -> None:
+        if not entries:
+            if os.path.exists(self.path):
+                os.remove(self.path)
+            return
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"locks": entries}, f, indent=2)
+            f.flush()
+            # The entry must be on disk before the lock it describes is deleted
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+    def _update(self, change: Callable[[Dict[str, Dict]], None]) -> None:
+        with self._lock, _file_lock(self._lock_path, exclusive=True):
+            entries = self._read()
+            change(entries)
+            self._write(entries)
+
+    def entries(self) -> List[Dict]:
+        """All journaled locks."""
+        with self._lock, _file_lock(self._lock_path, exclusive=False):
+            return list(self._read().values())
+
+    def add(self, records: Iterable[Dict]) -> None:
+        """Journal locks that are about to be released."""
+        records = list(records)
+
+        def change(entries: Dict[str, Dict]) -> None:
+            for record in records:
+                entries[_record_key(record)] = record
+
+        self._update(change)
+
+    def mark(self, record: Dict, state: str) -> None:
+        """Set the state of one journaled lock."""
+
+        def change(entries: Dict[str, Dict]) -> None:
+            entry = entries.get(_record_key(record))
+            if entry is not None:
+                entry["state"] = state
+
+        self._update(change)
+
+    def remove(self, record: Dict) -> None:
+        """Drop a lock that has been recreated."""
+        self._update(lambda entries: entries.pop(_record_key(record), None))
+
+
+class UnlockedWindow:
+    """
+    Context manager that keeps the locks of one or many resource groups released
+    for the duration of a with block.
+
+    On entry, locks left released by an earlier run that died are restored from
+    the journal, then the current locks of every resource group are listed,
+    journaled and deleted concurrently. On exit, with or without an exception,
+    every journaled lock is recreated concurrently. A lock that cannot be
+    recreated stays in the journal and is retried by the next window or by recover().
+
+    Example:
+        with UnlockedWindow(["rg-a", "rg-b"]):
+            ...  # delete or move resources
+    """
+
+    def __init__(
+        self,
+        resource_groups: Iterable[ResourceGroupRef],
+        subscription_id: str = None,
+        auth: AzureAuthentication = None,
+        journal: Union[LockJournal, str] = None,
+        max_workers: int = 16,
+    ):
+        """
+        Initialize the window.
+
+        Args:
+            resource_groups: Resource groups to unlock, as names or (subscription_id, name) tuples
+            subscription_id: Subscription for resource groups given by name only. If not provided,
+                resolved the same way as for the resource helpers
+            auth: Optional AzureAuthentication instance. If not provided, uses the shared instance
+            journal: LockJournal or journal file path. Defaults to LockJournal()
+            max_workers: Maximum number of concurrent list, delete and create calls
+        """
+        self.resource_groups = resolve_resource_groups(resource_groups, subscription_id)
+        self.auth = auth if auth is not None else AzureAuthentication.shared()
+        self.journal = (
+            journal if isinstance(journal, LockJournal) else LockJournal(journal)
+        )
+        self.max_workers = max_workers
+        # Entries are tagged with the owning window so recover() leaves live windows alone
+        self.window_id = uuid.uuid4().hex
+        self.released: List[Dict] = []
+        self._helpers: Dict[Tuple[str, str], AzureResourceLock] = {}
+        self._helpers_lock = threading.Lock()
+
+    def _helper(
+        self, subscription_id: str, resource_group_name: str
+    ) -> AzureResourceLock:
+        key = (subscription_id, resource_group_name)
+        with self._helpers_lock:
+            helper = self._helpers.get(key)
+            if helper is None:
+                helper = AzureResourceLock(
+                    resource_group_name=resource_group_name,
+                    subscription_id=subscription_id,
+                    auth=self.auth,
+                )
+                self._helpers[key] = helper
+        return helper
+
+    def _map(self, function: Callable, items: List) -> List:
+        if not items:
+            return []
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(items))
+        ) as executor:
+            return list(executor.map(function, items))
+
+    def _list(self, resource_group: Tuple[str, str]) -> List[Dict]:
+        subscription_id, resource_group_name = resource_group
+        helper = self._helper(subscription_id, resource_group_name)
+        return [
+            lock_record(subscription_id, resource_group_name, lock)
+            for lock in helper.refresh_locks()
+        ]
+
+    def _delete(self, record: Dict) -> Dict:
+        result = {"lock": _record_key(record), "status": "released", "error": None}
+        try:
+            helper = self._helper(
+                record["subscription_id"], record["resource_group_name"]
+            )
+            helper.lock_client.management_locks.delete_by_scope(
+                lock_scope(record), record["name"]
+            )
+            self.journal.mark(record, "released")
+            print(f"Temporarily released lock: {_lock_label(record)}")
+        except Exception as e:
+            result.update(status="failed", error=str(e))
+        return result
+
+    def _create(self, record: Dict) -> Dict:
+        result = {"lock": _record_key(record), "status": "restored", "error": None}
+        try:
+            helper = self._helper(
+                record["subscription_id"], record["resource_group_name"]
+            )
+            helper.lock_client.management_locks.create_or_update_by_scope(
+                scope=lock_scope(record),
+                lock_name=record["name"],
+                parameters=lock_parameters(record),
+            )
+            self.journal.remove(record)
+            print(f"Reset lock: {_lock_label(record)}")
+        except Exception as e:
+            result.update(status="failed", error=str(e))
+        return result
+
+    def release(self) -> List[Dict]:
+        """
+        List, journal and delete the locks of every resource group concurrently.
+        If any lock cannot be deleted, the locks already deleted are recreated
+        before the error is raised.
+
+        Returns:
+            Journal records of the released locks
+        """
+        started = time.monotonic()
+        records = [
+            record
+            for listed in self._map(self._list, self.resource_groups)
+            for record in listed
+        ]
+        for record in records:
+            record.update(
+                state="releasing",
+                window=self.window_id,
+                pid=os.getpid(),
+                host=socket.gethostname(),
+            )
+        self.journal.add(records)
+        self.released = records
+
+        results = self._map(self._delete, records)
+        failed = [r for r in results if r["status"] == "failed"]
+        if failed:
+            self.restore()
+            raise RuntimeError(
+                f"Failed to release {len(failed)} locks: "
+                + "; ".join(f"{r['lock']}: {r['error']}" for r in failed)
+            )
+        print(
+            f"Released {len(records)} locks in {len(self.resource_groups)} resource groups "
+            f"in {time.monotonic() - started:.1f}s"
+        )
+        return records
+
+    def restore(self) -> List[Dict]:
+        """
+        Recreate every lock this window journaled, concurrently.
+
+        Returns:
+            One result per lock with 'lock', 'status' ('restored' or 'failed') and 'error'
+        """
+        started = time.monotonic()
+        pending = [
+            r for r in self.journal.entries() if r.get("window") == self.window_id
+        ]
+        results = self._map(self._create, pending)
+        _report_restored(results, started)
+        self.released = []
+        return results
+
+    def recover(self) -> List[Dict]:
+        """
+        Recreate locks left in the journal by windows whose process is gone.
+
+        Returns:
+            One result per lock with 'lock', 'status' ('restored' or 'failed') and 'error'
+        """
+        orphaned = [r for r in self.journal.entries() if _is_orphaned(r)]
+        if not orphaned:
+            return []
+        print(f"Recovering {len(orphaned)} locks left released by an earlier run")
+        started = time.monotonic()
+        results = self._map(self._create, orphaned)
+        _report_restored(results, started)
+        return results
+
+    def __enter__(self):
+        self.recover()
+        self.release()
+        return self
+
+    def close(self) -> None:
+        """Release the helpers' references on their shared SDK clients."""
+        for helper in self._helpers.values():
+            helper.close()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        try:
+            results = self.restore()
+        finally:
+            self.close()
+        failed = [r for r in results if r["status"] == "failed"]
+        if failed and exc_type is None:
+            raise RuntimeError(
+                f"Failed to recreate {len(failed)} locks; they remain in {self.journal.path}"
+            )
+        return False
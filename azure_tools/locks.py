@@ -1,13 +1,13 @@
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
-from azure.mgmt.resource.locks import ManagementLockClient
 from .base import AzureResourceBase
 from .auth import AzureAuthentication
 
 
 class AzureResourceLock(AzureResourceBase):
     def __init__(
-        self, 
-        resource_group_name: str, 
+        self,
+        resource_group_name: str,
         subscription_id: str = None,
         auth: AzureAuthentication = None,
     ):
@@ -17,7 +17,7 @@ class AzureResourceLock(AzureResourceBase):
         Args:
             resource_group_name: Name of the resource group
             subscription_id: Azure subscription ID. If not provided, will be retrieved from Azure CLI
-            auth: Optional AzureAuthentication instance. If not provided, creates a new one
+            auth: Optional AzureAuthentication instance. If not provided, uses the shared instance
         """
         super().__init__(
             resource_group_name=resource_group_name,
@@ -26,10 +26,31 @@ class AzureResourceLock(AzureResourceBase):
             subscription_id=subscription_id,
             auth=auth,
         )
-        # Initialize lock objects
-        self.lock_objs = self.get_locks()
+        # Lock inventory, listed on first use and kept until refresh_locks()
+        self._lock_objs = None
         self.deleted = False
 
+    @property
+    def lock_objs(self) -> List:
+        """Snapshot of the resource group's locks, listed from ARM on first access."""
+        if self._lock_objs is None:
+            self._lock_objs = self.get_locks()
+        return self._lock_objs
+
+    @lock_objs.setter
+    def lock_objs(self, value: List) -> None:
+        self._lock_objs = value
+
+    def refresh_locks(self) -> List:
+        """
+        Re-list the resource group's locks and replace the local snapshot.
+
+        Returns:
+            List of lock objects
+        """
+        self._lock_objs = self.get_locks()
+        return self._lock_objs
+
     def get_locks(self) -> List:
         """
         Get all locks in the resource group.
@@ -60,22 +81,26 @@ class AzureResourceLock(AzureResourceBase):
 
     def release_locks(self) -> None:
         """
-        Delete all locks in the resource group.
-
-        Returns:
-            List of lock objects that were deleted
+        Delete all locks in the resource group, concurrently.
+        Nothing is persisted, so locks stay released if the process dies before
+        recreate_locks(); use unlocked_window() when that matters.
         """
         try:
             if not self.lock_objs:
                 print("No locks to delete")
                 return
 
-            for lock in self.lock_objs:
+            def release(lock) -> None:
                 self.lock_client.management_locks.delete_at_resource_group_level(
                     self.resource_group_name, lock.name
                 )
                 print(f"Temporarily released lock: {lock.name}")
 
+            with ThreadPoolExecutor(
+                max_workers=min(16, len(self.lock_objs)) or 1
+            ) as executor:
+                list(executor.map(release, self.lock_objs))
+
             self.deleted = True
         except Exception as e:
             print(f"Error managing resource locks: {str(e)}")
@@ -83,7 +108,7 @@ class AzureResourceLock(AzureResourceBase):
 
     def recreate_locks(self) -> None:
         """
-        Recreate locks in the resource group.
+        Recreate locks in the resource group, concurrently.
         Only works if locks were previously deleted.
         """
         try:
@@ -95,7 +120,7 @@ class AzureResourceLock(AzureResourceBase):
                 print("Locks were not deleted, skipping recreation")
                 return
 
-            for lock in self.lock_objs:
+            def recreate(lock) -> None:
                 self.lock_client.management_locks.create_or_update_at_resource_group_level(
                     resource_group_name=self.resource_group_name,
                     lock_name=lock.name,
@@ -103,15 +128,43 @@ class AzureResourceLock(AzureResourceBase):
                 )
                 print(f"Reset lock: {lock.name}")
 
+            with ThreadPoolExecutor(
+                max_workers=min(16, len(self.lock_objs)) or 1
+            ) as executor:
+                list(executor.map(recreate, self.lock_objs))
+
+            self.deleted = False
         except Exception as e:
             print(f"Error recreating resource locks: {str(e)}")
             raise
 
+    def unlocked_window(self, journal=None):
+        """
+        Context manager that releases the resource group's locks and recreates
+        them on exit, journaling them on disk so a crashed run is recovered.
+
+        Args:
+            journal: Optional LockJournal or journal file path
+
+        Returns:
+            UnlockedWindow for this resource group
+        """
+        from .lock_window import UnlockedWindow
+
+        return UnlockedWindow(
+            [(self.subscription_id, self.resource_group_name)],
+            auth=self.auth,
+            journal=journal,
+        )
+
     def create_lock(
         self, lock_name: str, level: str = "CanNotDelete", notes: str = None
     ) -> None:
         """
         Create a new resource lock at the resource group level.
+        The existence check uses the local snapshot, or re-lists the locks while
+        they are released; call refresh_locks() first if locks may have been
+        changed by someone else since the snapshot was taken.
 
         Args:
             lock_name: Name of the lock to create
@@ -124,24 +177,28 @@ class AzureResourceLock(AzureResourceBase):
                     "Lock level must be either 'CanNotDelete' or 'ReadOnly'"
                 )
 
-            self.lock_objs = self.get_locks()
-            # Check if lock already exists
-            for lock in self.lock_objs:
+            # Check if lock already exists. While the locks are released the
+            # snapshot lists locks that no longer exist, so ARM is asked instead
+            live = self.get_locks() if self.deleted else self.lock_objs
+            for lock in live:
                 if lock.name == lock_name:
                     print(f"Lock {lock_name} already exists")
                     return
 
             # Create the lock
-            self.lock_client.management_locks.create_or_update_at_resource_group_level(
+            created = self.lock_client.management_locks.create_or_update_at_resource_group_level(
                 resource_group_name=self.resource_group_name,
                 lock_name=lock_name,
                 parameters={"level": level, "notes": notes},
             )
             print(f"Created lock: {lock_name} with level {level}")
 
-            # Update local lock objects
-            self.lock_objs = self.get_locks()
+            # Update the local snapshot from the response instead of re-listing,
+            # replacing a released lock of the same name so it is not recreated twice
+            self.lock_objs[:] = [
+                lock for lock in self.lock_objs if lock.name != lock_name
+            ] + [created]
 
         except Exception as e:
             print(f"Error creating resource lock: {str(e)}")
-            raise 
\ No newline at end of file
+            raise
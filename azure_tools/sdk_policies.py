@@ -0,0 +1,76 @@
+import asyncio
+import random
+import time
+from azure.core.pipeline.policies import (
+    AsyncHTTPPolicy,
+    AsyncRetryPolicy,
+    HTTPPolicy,
+    RetryPolicy,
+)
+from .throttling import (
+    ArmRateLimiter,
+    get_rate_limiter,
+    principal_from_token,
+    request_scope,
+)
+
+
+class ArmThrottlingPolicy(HTTPPolicy):
+    """
+    azure-core pipeline policy that spends rate limiter tokens before each
+    attempt and feeds the remaining-quota headers back after it.
+    Installed as the SDK clients' custom hook policy, which runs after the
+    retry and authentication policies.
+    """
+
+    def __init__(self, limiter: "ArmRateLimiter" = None):
+        super().__init__()
+        self.limiter = limiter or get_rate_limiter()
+
+    def send(self, request):
+        http_request = request.http_request
+        scope = request_scope(http_request.url)
+        principal = principal_from_token(http_request.headers.get("Authorization"))
+        delay = self.limiter.reserve(scope, principal, http_request.method)
+        if delay > 0:
+            time.sleep(delay)
+        response = self.next.send(request)
+        self.limiter.observe(scope, principal, response.http_response.headers)
+        return response
+
+
+class AsyncArmThrottlingPolicy(AsyncHTTPPolicy):
+    """
+    Async counterpart of ArmThrottlingPolicy for the azure.mgmt.*.aio clients.
+    """
+
+    def __init__(self, limiter: "ArmRateLimiter" = None):
+        super().__init__()
+        self.limiter = limiter or get_rate_limiter()
+
+    async def send(self, request):
+        http_request = request.http_request
+        scope = request_scope(http_request.url)
+        principal = principal_from_token(http_request.headers.get("Authorization"))
+        delay = self.limiter.reserve(scope, principal, http_request.method)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        response = await self.next.send(request)
+        self.limiter.observe(scope, principal, response.http_response.headers)
+        return response
+
+
+class _JitterMixin:
+    """Adds full jitter to azure-core's exponential backoff; Retry-After still wins."""
+
+    def get_backoff_time(self, settings) -> float:
+        backoff = super().get_backoff_time(settings)
+        return random.uniform(0, backoff) if backoff else backoff
+
+
+class JitteredRetryPolicy(_JitterMixin, RetryPolicy):
+    pass
+
+
+class AsyncJitteredRetryPolicy(_JitterMixin, AsyncRetryPolicy):
+    pass
@@ -0,0 +1,199 @@
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Dict, Optional, Tuple
+from .token_cache import KeyedLocks
+
+# (vault URL, secret name, version or None for the latest version)
+SecretKey = Tuple[str, str, Optional[str]]
+
+
+class CachedSecret:
+    """
+    One cached secret value. The value is held in a bytearray so it can be
+    overwritten with zeros when the entry is evicted or invalidated. Strings
+    handed out by value() are ordinary Python strings and are not wiped.
+    """
+
+    __slots__ = ("_value", "version", "fetched_at", "expires_at")
+
+    def __init__(self, value: str, version: Optional[str], expires_at: Optional[float]):
+        self._value = bytearray(value.encode("utf-8"))
+        self.version = version
+        self.fetched_at = time.monotonic()
+        # Monotonic deadline, or None for entries that never expire (pinned versions)
+        self.expires_at = expires_at
+
+    def value(self) -> str:
+        return self._value.decode("utf-8")
+
+    def is_fresh(self) -> bool:
+        return self.expires_at is None or time.monotonic() < self.expires_at
+
+    def wipe(self) -> None:
+        """Overwrite the cached bytes with zeros."""
+        for i in range(len(self._value)):
+            self._value[i] = 0
+        self._value = bytearray()
+
+
+class SecretCache:
+    """
+    In-process cache of Key Vault secret values keyed by vault, name and version.
+    The latest version of a secret is served for its TTL (default or per secret)
+    and capped at the secret's own expiry; a pinned version never changes, so it
+    is kept until evicted. Entries are evicted least recently used beyond
+    max_entries, and evicted or invalidated values are zeroed.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 300,
+        max_entries: int = 1024,
+        ttl_overrides: Dict[str, float] = None,
+    ):
+        """
+        Initialize the secret cache.
+
+        Args:
+            ttl: Seconds the latest version of a secret is served without a call
+            max_entries: Maximum number of cached values across all vaults
+            ttl_overrides: Optional per-secret TTLs by secret name
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.ttl_overrides = dict(ttl_overrides or {})
+        self._entries: "OrderedDict[SecretKey, CachedSecret]" = OrderedDict()
+        self._lock = threading.Lock()
+        # Single-flight locks per key: concurrent misses wait for the first fetch
+        self._fetch_locks = KeyedLocks()
+        self._async_fetch_locks = KeyedLocks(asyncio.Lock)
+
+    @staticmethod
+    def key(vault_url: str, name: str, version: str = None) -> SecretKey:
+        return (vault_url.rstrip("/").lower(), name.lower(), version or None)
+
+    def fetch_lock(self, key: SecretKey):
+        """Context manager held while fetching a key, so concurrent misses wait for it."""
+        return self._fetch_locks.hold(key)
+
+    def async_fetch_lock(self, key: SecretKey):
+        """
+        Async counterpart of fetch_lock(). asyncio locks belong to one event loop,
+        so the lock is per running loop and dropped when no coroutine needs it.
+        """
+        return self._async_fetch_locks.async_hold((asyncio.get_running_loop(), key))
+
+    def ttl_for(self, name: str) -> float:
+        return self.ttl_overrides.get(name, self.ttl)
+
+    def get(self, vault_url: str, name: str, version: str = None) -> Optional[str]:
+        """
+        Get a cached secret value if it is still fresh.
+
+        Returns:
+            The value, or None on a miss
+        """
+        key = self.key(vault_url, name, version)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if not entry.is_fresh():
+                del self._entries[key]
+                entry.wipe()
+                return None
+            self._entries.move_to_end(key)
+            return entry.value()
+
+    def put(
+        self,
+        vault_url: str,
+        name: str,
+        value: str,
+        version: str = None,
+        pinned: bool = False,
+        ttl: float = None,
+        expires_on: datetime = None,
+    ) -> None:
+        """
+        Store a secret value.
+
+        Args:
+            vault_url: Vault the secret was read from
+            name: Secret name
+            value: Secret value
+            version: Version of the value. Stored under the version key when pinned,
+                otherwise under the secret's latest-version key
+            pinned: Whether the caller asked for this specific version
+            ttl: TTL for this value. Defaults to the secret's override or the cache TTL
+            expires_on: Expiry of the secret itself; the entry never outlives it
+        """
+        if value is None:
+            return
+        expires_at = None
+        if not pinned:
+            expires_at = time.monotonic() + (
+                ttl if ttl is not None else self.ttl_for(name)
+            )
+        if expires_on is not None:
+            remaining = (expires_on - datetime.now(timezone.utc)).total_seconds()
+            deadline = time.monotonic() + max(remaining, 0)
+            expires_at = deadline if expires_at is None else min(expires_at, deadline)
+
+        key = self.key(vault_url, name, version if pinned else None)
+        entry = CachedSecret(value, version, expires_at)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            self._entries[key] = entry
+            evicted = []
+            while len(self._entries) > self.max_entries:
+                evicted.append(self._entries.popitem(last=False)[1])
+        if previous is not None:
+            previous.wipe()
+        for old in evicted:
+            old.wipe()
+
+    def invalidate(self, vault_url: str, name: str = None) -> None:
+        """
+        Drop the latest-version entry of a secret, or every entry of the vault
+        when name is None. Pinned versions of a named secret are kept since a
+        version's value cannot change.
+        """
+        vault_key = vault_url.rstrip("/").lower()
+        with self._lock:
+            if name is None:
+                keys = [k for k in self._entries if k[0] == vault_key]
+            else:
+                keys = [self.key(vault_url, name)]
+            dropped = [self._entries.pop(k) for k in keys if k in self._entries]
+        for entry in dropped:
+            entry.wipe()
+
+    def clear(self) -> None:
+        with self._lock:
+            dropped = list(self._entries.values())
+            self._entries.clear()
+        for entry in dropped:
+            entry.wipe()
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def get_secret_cache() -> SecretCache:
+    """
+    Get the process-wide secret cache shared by all AzureKeyVault helpers.
+
+    Returns:
+        The default SecretCache instance
+    """
+    global _default_cache
+    if _default_cache is None:
+        with _default_cache_lock:
+            if _default_cache is None:
+                _default_cache = SecretCache()
+    return _default_cache
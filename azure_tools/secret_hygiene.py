@@ -0,0 +1,348 @@
+import json
+import math
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+from .auth import AzureAuthentication
+from .keyvault import AzureKeyVault
+from .throttling import get_vault_bucket
+
+# A vault by name, or by (resource_group, vault) / (subscription_id, resource_group, vault)
+VaultRef = Union[str, Tuple[str, str], Tuple[str, str, str]]
+
+REPORT_COLUMNS = (
+    "vault",
+    "secret",
+    "enabled",
+    "expires_on",
+    "days_to_expiry",
+    "last_rotated",
+    "rotation_age_days",
+    "versions",
+    "disabled_versions",
+    "flags",
+    "error",
+)
+
+
+def _iso(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value is not None else None
+
+
+def _days_since(value: Optional[str], now: datetime) -> Optional[int]:
+    if value is None:
+        return None
+    return (now - datetime.fromisoformat(value)).days
+
+
+def _days_until(value: datetime, now: datetime) -> int:
+    """Whole days from now until value, negative once it has passed."""
+    return math.trunc((value - now).total_seconds() / 86400)
+
+
+class SecretHygieneScan:
+    """
+    Expiry and rotation audit of every secret in many Key Vaults.
+    Each vault's secrets are listed concurrently, then the version histories of
+    all secrets are listed concurrently under the per-vault rate limit. Version
+    summaries are cached per secret, keyed by the current version's updated_on,
+    so a rerun only lists versions of secrets that changed since the last scan.
+    Disabling an older version does not change that timestamp, so its count
+    is only refreshed when the secret changes or with full=True.
+    """
+
+    def __init__(
+        self,
+        vaults: Iterable[VaultRef],
+        subscription_id: str = None,
+        auth: AzureAuthentication = None,
+        max_workers: int = 16,
+        expiry_window_days: int = 30,
+        stale_after_days: int = 180,
+        cache_path: str = None,
+    ):
+        """
+        Initialize the scan.
+
+        Args:
+            vaults: Vaults to scan, as names or (resource_group, vault) or
+                (subscription_id, resource_group, vault) tuples
+            subscription_id: Subscription for vaults given without one
+            auth: Optional AzureAuthentication instance. If not provided, uses the shared instance
+            max_workers: Maximum number of concurrent vault calls
+            expiry_window_days: Secrets expiring within this many days are flagged 'expiring'
+            stale_after_days: Secrets whose newest version is older than this are flagged 'stale'
+            cache_path: Optional JSON file holding version summaries between runs
+        """
+        self.vaults = [self._vault_ref(v) for v in vaults]
+        self.subscription_id = subscription_id
+        self.auth = auth if auth is not None else AzureAuthentication.shared()
+        self.max_workers = max_workers
+        self.expiry_window_days = expiry_window_days
+        self.stale_after_days = stale_after_days
+        self.cache_path = cache_path
+        self._cache = self._load_cache()
+        self._helpers: Dict[str, AzureKeyVault] = {}
+        self._helpers_lock = threading.Lock()
+
+    @staticmethod
+    def _vault_ref(vault: VaultRef) -> Tuple[Optional[str], Optional[str], str]:
+        if isinstance(vault, str):
+            return (None, None, vault)
+        if len(vault) == 2:
+            return (None,) + tuple(vault)
+        return tuple(vault)
+
+    def _helper(self, vault: Tuple[Optional[str], Optional[str], str]) -> AzureKeyVault:
+        subscription_id, resource_group_name, vault_name = vault
+        with self._helpers_lock:
+            helper = self._helpers.get(vault_name)
+            if helper is None:
+                # The resource group is informational only; secrets are read from the vault URL
+                helper = AzureKeyVault(
+                    resource_group_name=resource_group_name,
+                    resource_name=vault_name,
+                    subscription_id=subscription_id or self.subscription_id,
+                    auth=self.auth,
+                )
+                self._helpers[vault_name] = helper
+        return helper
+
+    def _list_secrets(
+        self, vault: Tuple[Optional[str], Optional[str], str]
+    ) -> List[Dict]:
+        helper = self._helper(vault)
+        delay = get_vault_bucket(helper.vault_url).reserve()
+        if delay > 0:
+            time.sleep(delay)
+        return [
+            {
+                "vault": vault[2],
+                "secret": secret.name,
+                "enabled": secret.enabled,
+                "expires_on": _iso(secret.expires_on),
+                "updated_on": _iso(secret.updated_on),
+            }
+            for secret in helper.secret_client.list_properties_of_secrets()
+        ]
+
+    def _safe_list_secrets(
+        self, vault: Tuple[Optional[str], Optional[str], str]
+    ) -> Tuple[Optional[List[Dict]], Optional[str]]:
+        try:
+            return self._list_secrets(vault), None
+        except Exception as e:
+            print(f"Error listing secrets in {vault[2]}: {str(e)}")
+            return None, str(e)
+
+    def _version_summary(self, secret: Dict) -> Dict:
+        helper = self._helper((None, None, secret["vault"]))
+        delay = get_vault_bucket(helper.vault_url).reserve()
+        if delay > 0:
+            time.sleep(delay)
+        created = []
+        disabled = 0
+        for version in helper.secret_client.list_properties_of_secret_versions(
+            secret["secret"]
+        ):
+            if version.created_on is not None:
+                created.append(version.created_on)
+            if not version.enabled:
+                disabled += 1
+        return {
+            "updated_on": secret["updated_on"],
+            "versions": len(created),
+            "disabled_versions": disabled,
+            "last_rotated": _iso(max(created)) if created else None,
+        }
+
+    def _safe_version_summary(
+        self, secret: Dict
+    ) -> Tuple[Optional[Dict], Optional[str]]:
+        try:
+            return self._version_summary(secret), None
+        except Exception as e:
+            print(
+                f"Error listing versions of {secret['vault']}/{secret['secret']}: {str(e)}"
+            )
+            return None, str(e)
+
+    def run(self, full: bool = False) -> Dict[str, List]:
+        """
+        Scan every vault.
+
+        Args:
+            full: If True, list the versions of every secret, ignoring the cache
+
+        Returns:
+            Columnar report: one list per column in REPORT_COLUMNS, one row per secret,
+            ordered by vault and secret name. 'flags' holds a comma-separated subset of
+            'expired', 'expiring', 'stale', 'never_rotated' and 'versions_failed'.
+            A vault whose secrets could not be listed gets one row with no secret,
+            the 'scan_failed' flag and the error, so failures are never left out
+        """
+        started = time.monotonic()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            listings = {}
+            failed_vaults: Dict[str, str] = {}
+            for vault, (listed, error) in zip(
+                self.vaults, executor.map(self._safe_list_secrets, self.vaults)
+            ):
+                listings[vault[2]] = listed
+                if error is not None:
+                    failed_vaults[vault[2]] = error
+            secrets = [s for listed in listings.values() if listed for s in listed]
+
+            summaries: Dict[Tuple[str, str], Dict] = {}
+            pending = []
+            for secret in secrets:
+                cached = self._cache.get(secret["vault"], {}).get(secret["secret"])
+                if not full and cached and cached["updated_on"] == secret["updated_on"]:
+                    summaries[(secret["vault"], secret["secret"])] = cached
+                else:
+                    pending.append(secret)
+            print(
+                f"Scanning {len(secrets)} secrets in {len(self.vaults)} vaults, "
+                f"listing versions of {len(pending)} ({len(secrets) - len(pending)} cached)"
+            )
+            failed_secrets: Dict[Tuple[str, str], str] = {}
+            for secret, (summary, error) in zip(
+                pending, executor.map(self._safe_version_summary, pending)
+            ):
+                key = (secret["vault"], secret["secret"])
+                if summary is not None:
+                    summaries[key] = summary
+                else:
+                    failed_secrets[key] = error
+
+        self._save_cache(
+            [v for v, listed in listings.items() if listed is not None],
+            secrets,
+            summaries,
+        )
+        secrets.sort(key=lambda s: (s["vault"], s["secret"]))
+        report = self._report(secrets, summaries, failed_vaults, failed_secrets)
+        print(
+            f"Scanned {len(secrets)} secrets in {time.monotonic() - started:.1f}s"
+            + (
+                f"; {len(failed_vaults)} vaults and {len(failed_secrets)} secrets failed"
+                if failed_vaults or failed_secrets
+                else ""
+            )
+        )
+        return report
+
+    def _report(
+        self,
+        secrets: List[Dict],
+        summaries: Dict[Tuple[str, str], Dict],
+        failed_vaults: Dict[str, str] = None,
+        failed_secrets: Dict[Tuple[str, str], str] = None,
+    ) -> Dict[str, List]:
+        now = datetime.now(timezone.utc)
+        failed_secrets = failed_secrets or {}
+        report: Dict[str, List] = {column: [] for column in REPORT_COLUMNS}
+        for vault, error in sorted((failed_vaults or {}).items()):
+            row = dict.fromkeys(REPORT_COLUMNS)
+            row.update(vault=vault, flags="scan_failed", error=error)
+            for column in REPORT_COLUMNS:
+                report[column].append(row[column])
+        for secret in secrets:
+            key = (secret["vault"], secret["secret"])
+            summary = summaries.get(key, {})
+            rotation_age = _days_since(summary.get("last_rotated"), now)
+
+            flags = []
+            days_to_expiry = None
+            if secret["expires_on"] is not None:
+                expires_on = datetime.fromisoformat(secret["expires_on"])
+                days_to_expiry = _days_until(expires_on, now)
+                if expires_on <= now:
+                    flags.append("expired")
+                elif days_to_expiry <= self.expiry_window_days:
+                    flags.append("expiring")
+            if rotation_age is not None and rotation_age > self.stale_after_days:
+                flags.append("stale")
+            if summary.get("versions") == 1:
+                flags.append("never_rotated")
+            if key in failed_secrets:
+                flags.append("versions_failed")
+
+            row = {
+                "vault": secret["vault"],
+                "secret": secret["secret"],
+                "enabled": secret["enabled"],
+                "expires_on": secret["expires_on"],
+                "days_to_expiry": days_to_expiry,
+                "last_rotated": summary.get("last_rotated"),
+                "rotation_age_days": rotation_age,
+                "versions": summary.get("versions"),
+                "disabled_versions": summary.get("disabled_versions"),
+                "flags": ",".join(flags),
+                "error": failed_secrets.get(key),
+            }
+            for column in REPORT_COLUMNS:
+                report[column].append(row[column])
+        return report
+
+    @staticmethod
+    def print_report(report: Dict[str, List], flagged_only: bool = True) -> None:
+        """
+        Print the report as a table (by default only flagged secrets) followed by
+        per-flag totals, including vaults and secrets that could not be scanned.
+        """
+        rows = list(zip(*(report[c] for c in REPORT_COLUMNS)))
+        flags_at = REPORT_COLUMNS.index("flags")
+        shown = [row for row in rows if row[flags_at]] if flagged_only else rows
+        if shown:
+            cells = [[str(v) if v is not None else "-" for v in row] for row in shown]
+            widths = [
+                max(len(c), *(len(r[i]) for r in cells))
+                for i, c in enumerate(REPORT_COLUMNS)
+            ]
+            print("  ".join(c.ljust(w) for c, w in zip(REPORT_COLUMNS, widths)))
+            print("  ".join("-" * w for w in widths))
+            for r in cells:
+                print("  ".join(v.ljust(w) for v, w in zip(r, widths)))
+
+        totals: Dict[str, int] = {}
+        for row in rows:
+            for flag in filter(None, row[flags_at].split(",")):
+                totals[flag] = totals.get(flag, 0) + 1
+        secret_at = REPORT_COLUMNS.index("secret")
+        print(
+            f"{sum(row[secret_at] is not None for row in rows)} secrets; "
+            + (
+                ", ".join(f"{count} {flag}" for flag, count in sorted(totals.items()))
+                or "no findings"
+            )
+        )
+
+    def _load_cache(self) -> Dict[str, Dict[str, Dict]]:
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return {}
+        with open(self.cache_path, encoding="utf-8") as f:
+            return json.load(f).get("vaults", {})
+
+    def _save_cache(
+        self,
+        scanned: List[str],
+        secrets: List[Dict],
+        summaries: Dict[Tuple[str, str], Dict],
+    ) -> None:
+        """Replace the cached summaries of the listed vaults and rewrite the cache file atomically."""
+        for vault in scanned:
+            self._cache[vault] = {}
+        for secret in secrets:
+            summary = summaries.get((secret["vault"], secret["secret"]))
+            if summary is not None:
+                self._cache[secret["vault"]][secret["secret"]] = summary
+        if not self.cache_path:
+            return
+        tmp_path = f"{self.cache_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"vaults": self._cache}, f, indent=2)
+        os.replace(tmp_path, self.cache_path)
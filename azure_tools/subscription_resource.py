@@ -1,6 +1,9 @@
-from azure.mgmt.resource import ResourceManagementClient, SubscriptionClient
+from pathlib import Path
 from subprocess import PIPE, run
 from typing import Optional
+import json
+import os
+import threading
 from .auth import AzureAuthentication
 
 
@@ -9,7 +12,14 @@ class SubscriptionResourceManager:
     Manages subscription and resource group operations.
     Uses composition with AzureAuthentication and is the source of truth for subscription operations.
     """
-    
+
+    # Environment variables checked (in order) for an explicit subscription ID
+    SUBSCRIPTION_ENV_VARS = ("AZURE_SUBSCRIPTION_ID", "ARM_SUBSCRIPTION_ID")
+
+    # Subscription ID resolved for this process, shared by every helper
+    _resolved_subscription_id = None
+    _resolve_lock = threading.Lock()
+
     def __init__(
         self,
         subscription_id: str = None,
@@ -20,80 +30,191 @@ class SubscriptionResourceManager:
 
         Args:
             subscription_id: Azure subscription ID. If not provided, will be auto-detected
-            auth: Optional AzureAuthentication instance. If not provided, creates a new one
+            auth: Optional AzureAuthentication instance. If not provided, uses the shared instance
         """
-        # Use provided auth instance or create a new one
-        self.auth = auth if auth is not None else AzureAuthentication()
-        
+        # Use provided auth instance or the process-wide shared one
+        self.auth = auth if auth is not None else AzureAuthentication.shared()
+
         # For backward compatibility, expose credential
         self.credential = self.auth.credential
-        
-        # Create subscription client first
-        self.subscription_client = SubscriptionClient(credential=self.credential)
-        
-        # Handle subscription_id using SDK
-        self.subscription_id = subscription_id or SubscriptionResourceManager.get_subscription_id()
-        
-        # Create resource management client
-        self.resource_client = ResourceManagementClient(
-            credential=self.credential, 
-            subscription_id=self.subscription_id
+
+        # Handle subscription_id (memoized for the process after first lookup)
+        self.subscription_id = SubscriptionResourceManager.get_subscription_id(
+            subscription_id
         )
 
+        # SDK clients are created on first use
+        self._subscription_client = None
+        self._resource_client = None
+
+    @property
+    def subscription_client(self):
+        if self._subscription_client is None:
+            from azure.mgmt.resource import SubscriptionClient
+
+            self._subscription_client = SubscriptionClient(credential=self.credential)
+        return self._subscription_client
+
+    @property
+    def resource_client(self):
+        if self._resource_client is None:
+            from azure.mgmt.resource import ResourceManagementClient
+
+            self._resource_client = ResourceManagementClient(
+                credential=self.credential,
+                subscription_id=self.subscription_id,
+            )
+        return self._resource_client
+
+    @classmethod
+    def get_subscription_id(cls, subscription_id: str = None) -> str:
+        """
+        Resolve the subscription ID without paying for an Azure CLI process on the hot path.
+
+        Resolution order:
+            1. The explicit subscription_id argument
+            2. AZURE_SUBSCRIPTION_ID / ARM_SUBSCRIPTION_ID environment variables
+            3. The value already resolved in this process
+            4. The default subscription in the Azure CLI profile (~/.azure/azureProfile.json)
+            5. The only enabled subscription visible to the credential (SubscriptionClient)
+            6. `az account show` as a last resort
+
+        Args:
+            subscription_id: Optional explicit subscription ID, returned as-is
+
+        Returns:
+            str: The subscription ID
+
+        Raises:
+            RuntimeError: If no subscription ID could be resolved
+        """
+        if subscription_id:
+            return subscription_id
+
+        for env_var in cls.SUBSCRIPTION_ENV_VARS:
+            if os.getenv(env_var):
+                return os.getenv(env_var)
+
+        if cls._resolved_subscription_id is not None:
+            return cls._resolved_subscription_id
+
+        with cls._resolve_lock:
+            if cls._resolved_subscription_id is None:
+                resolved = (
+                    cls._subscription_id_from_profile()
+                    or cls._subscription_id_from_sdk()
+                    or cls._subscription_id_from_cli()
+                )
+                if not resolved:
+                    raise RuntimeError(
+                        "Could not resolve an Azure subscription ID. Pass subscription_id, "
+                        "set AZURE_SUBSCRIPTION_ID or run 'az login'."
+                    )
+                cls._resolved_subscription_id = resolved
+        return cls._resolved_subscription_id
+
+    @classmethod
+    def reset_subscription_id(cls) -> None:
+        """Forget the subscription ID memoized for this process."""
+        with cls._resolve_lock:
+            cls._resolved_subscription_id = None
+
+    @staticmethod
+    def _subscription_id_from_profile() -> Optional[str]:
+        """Read the default subscription from the Azure CLI profile file."""
+        config_dir = os.getenv("AZURE_CONFIG_DIR") or Path.home() / ".azure"
+        profile_path = Path(config_dir) / "azureProfile.json"
+        try:
+            # The CLI writes this file with a UTF-8 BOM
+            profile = json.loads(profile_path.read_text(encoding="utf-8-sig"))
+        except (OSError, ValueError):
+            return None
+        return next(
+            (
+                s.get("id")
+                for s in profile.get("subscriptions", [])
+                if s.get("isDefault")
+            ),
+            None,
+        )
 
     @staticmethod
-    def get_subscription_id():
+    def _subscription_id_from_sdk() -> Optional[str]:
+        """Use the subscription visible to the shared credential, if it is unambiguous."""
+        try:
+            from azure.mgmt.resource import SubscriptionClient
+
+            client = SubscriptionClient(
+                credential=AzureAuthentication.shared().credential
+            )
+            enabled = [
+                s.subscription_id
+                for s in client.subscriptions.list()
+                if s.state == "Enabled"
+            ]
+        except Exception as e:
+            print(f"Could not list subscriptions via SDK: {str(e)}")
+            return None
+        return enabled[0] if len(enabled) == 1 else None
+
+    @staticmethod
+    def _subscription_id_from_cli() -> Optional[str]:
         """Get the current subscription ID using Azure CLI"""
         cmd = "az account show --query id --output tsv"
-        return SubscriptionResourceManager.run_cmd(cmd).stdout.strip()
+        return SubscriptionResourceManager.run_cmd(cmd).stdout.strip() or None
 
     @staticmethod
     def switch_subscription(subscription_name_or_id):
         """
         Switch to a different subscription using Azure CLI.
-        
+
         Args:
             subscription_name_or_id: Either the subscription name or subscription ID
-            
+
         Returns:
             CompletedProcess: Result of the az account set command
-            
+
         Raises:
             RuntimeError: If the subscription switch fails
         """
-        cmd = f"az account set --subscription \"{subscription_name_or_id}\""
+        cmd = f'az account set --subscription "{subscription_name_or_id}"'
         result = SubscriptionResourceManager.run_cmd(cmd)
-        
+
         if result.returncode != 0:
             raise RuntimeError(f"Failed to switch subscription: {result.stderr}")
-        
+
+        # The CLI default changed, so the memoized value is stale
+        SubscriptionResourceManager.reset_subscription_id()
         return result
 
     def get_sub_id_by_name(self, target_name):
         """
         Get subscription ID by subscription display name.
-        
+
         Args:
             target_name: The friendly name of the subscription
-            
+
         Returns:
             str: The subscription ID if found, raises RuntimeError if not found
         """
         subscription_id = next(
-            (s.subscription_id for s in self.subscription_client.subscriptions.list()
-                if s.display_name == target_name),  # exact match (case-sensitive)
-            None
+            (
+                s.subscription_id
+                for s in self.subscription_client.subscriptions.list()
+                if s.display_name == target_name
+            ),  # exact match (case-sensitive)
+            None,
         )
-        
+
         if subscription_id is None:
             raise RuntimeError(f'No subscription called "{target_name}" was found')
-        
+
         return subscription_id
 
     def list_subscriptions(self):
         """
         List all subscriptions the signed-in identity can see.
-        
+
         Returns:
             Iterator of subscriptions
         """
@@ -103,7 +224,7 @@ class SubscriptionResourceManager:
     def list_rg_in_subscription(self):
         """
         List all resource groups in the current subscription.
-        
+
         Returns:
             Iterator of resource groups
         """
@@ -112,10 +233,10 @@ class SubscriptionResourceManager:
     def list_resource_in_rg(self, resource_group):
         """
         List all resources in a specific resource group.
-        
+
         Args:
             resource_group: Name of the resource group
-            
+
         Returns:
             Iterator of resources in the resource group
         """
@@ -126,10 +247,10 @@ class SubscriptionResourceManager:
     def get_resource_group(self, resource_group_name):
         """
         Get details of a specific resource group.
-        
+
         Args:
             resource_group_name: Name of the resource group
-            
+
         Returns:
             Resource group details
         """
@@ -138,45 +259,50 @@ class SubscriptionResourceManager:
     def list_resource_in_sub(self, resource_type: Optional[str] = None):
         """
         List resources in the subscription, optionally filtered by resource type.
-        
+
         Args:
             resource_type: Optional resource type filter. Allowed values:
                 - Microsoft.KeyVault/vaults
                 - Microsoft.DataFactory/factories
                 - Microsoft.Batch/batchAccounts
-                
+
         Returns:
             Iterator of resources in the subscription
-            
+
         Raises:
             ValueError: If an invalid resource type is provided
         """
         # Define allowed resource types
         allowed_resource_types = {
             "Microsoft.KeyVault/vaults",
-            "Microsoft.DataFactory/factories", 
-            "Microsoft.Batch/batchAccounts"
+            "Microsoft.DataFactory/factories",
+            "Microsoft.Batch/batchAccounts",
         }
-        
+
         # Validate resource type if provided
         if resource_type and resource_type not in allowed_resource_types:
             raise ValueError(
                 f"Invalid resource type '{resource_type}'. "
                 f"Allowed types: {', '.join(sorted(allowed_resource_types))}"
             )
-        
+
         # List resources with optional filter
         if resource_type:
             filter_str = f"resourceType eq '{resource_type}'"
-            return [i.as_dict() for i in self.resource_client.resources.list(filter=filter_str)]
+            return [
+                i.as_dict()
+                for i in self.resource_client.resources.list(filter=filter_str)
+            ]
         else:
             return [i.as_dict() for i in self.resource_client.resources.list()]
 
-
     @staticmethod
     def run_cmd(msg):
         """Run a shell command and return the result"""
         return run(
-            args=msg, stdout=PIPE, stderr=PIPE, universal_newlines=True, shell=True,
+            args=msg,
+            stdout=PIPE,
+            stderr=PIPE,
+            universal_newlines=True,
+            shell=True,
         )
-
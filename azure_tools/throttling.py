@@ -0,0 +1,430 @@
+import base64
+import json
+import random
+import re
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+# ARM token-bucket quotas per (subscription, principal): (bucket size, refill per second)
+ARM_BUCKET_LIMITS = {
+    "read": (250, 25.0),
+    "write": (200, 10.0),
+}
+
+# Key Vault allows 4000 secret transactions per 10 seconds per vault; the bucket
+# stays under that even when the burst is spent at the start of a window
+KEY_VAULT_BUCKET_LIMITS = (200, 380.0)
+
+# Throttled or timed-out requests were not processed, so any method can be resent
+THROTTLING_STATUS_CODES = {408, 429}
+# Transient server errors may follow a request that was applied, so they are only
+# retried for idempotent methods unless the caller opts in
+TRANSIENT_STATUS_CODES = {500, 502, 503, 504}
+RETRYABLE_STATUS_CODES = THROTTLING_STATUS_CODES | TRANSIENT_STATUS_CODES
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+
+_SUBSCRIPTION_RE = re.compile(r"/subscriptions/([^/?]+)", re.IGNORECASE)
+
+
+class TokenBucket:
+    """
+    Token bucket that hands out reservations instead of blocking,
+    so the same bucket can be used from threads and from asyncio code.
+    """
+
+    def __init__(self, capacity: float, refill_rate: float):
+        """
+        Initialize the token bucket.
+
+        Args:
+            capacity: Maximum number of tokens (burst size)
+            refill_rate: Tokens added per second
+        """
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.refill_rate
+        )
+        self._updated = now
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """
+        Take tokens from the bucket, going into debt if it is empty.
+
+        Args:
+            tokens: Number of tokens to take
+
+        Returns:
+            Seconds the caller must wait before sending the request
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.refill_rate
+
+    def observe_remaining(self, remaining: int) -> None:
+        """
+        Align the bucket with the quota the server reports as remaining.
+
+        Args:
+            remaining: Value of an x-ms-ratelimit-remaining-* header
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self._tokens, float(remaining))
+
+
+class ArmRateLimiter:
+    """
+    Per (scope, principal, read/write) token buckets for ARM requests.
+    Buckets start at the published ARM quotas and are corrected from the
+    x-ms-ratelimit-remaining-* headers of every response.
+    """
+
+    def __init__(self, limits: Dict[str, Tuple[float, float]] = None):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            limits: Mapping of operation kind ('read' / 'write') to (bucket size, refill per second)
+        """
+        self.limits = limits or ARM_BUCKET_LIMITS
+        self._buckets: Dict[Tuple[str, str, str], TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def operation_kind(method: str) -> str:
+        return "read" if method.upper() in ("GET", "HEAD") else "write"
+
+    def bucket(self, scope: str, principal: str, kind: str) -> TokenBucket:
+        key = (scope, principal, kind)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.get(key)
+                if bucket is None:
+                    bucket = TokenBucket(*self.limits[kind])
+                    self._buckets[key] = bucket
+        return bucket
+
+    def reserve(self, scope: str, principal: str, method: str) -> float:
+        """
+        Reserve quota for one request.
+
+        Returns:
+            Seconds to wait before sending the request
+        """
+        return self.bucket(scope, principal, self.operation_kind(method)).reserve()
+
+    def observe(self, scope: str, principal: str, headers) -> None:
+        """
+        Feed the remaining-quota headers of a response back into the buckets.
+
+        Args:
+            scope: Subscription ID (or host) the request targeted
+            principal: Identity the request was made as
+            headers: Response headers
+        """
+        for kind, suffixes in (
+            ("read", ("reads", "global-reads")),
+            ("write", ("writes", "deletes", "global-writes", "global-deletes")),
+        ):
+            remaining = [
+                int(headers[name])
+                for name in (
+                    f"x-ms-ratelimit-remaining-subscription-{s}" for s in suffixes
+                )
+                if name in headers and str(headers[name]).isdigit()
+            ]
+            if remaining:
+                self.bucket(scope, principal, kind).observe_remaining(min(remaining))
+
+
+class RetryEngine:
+    """
+    Jittered exponential backoff that honors Retry-After.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 6,
+        base_delay: float = 1.0,
+        max_delay: float = 60.0,
+    ):
+        """
+        Initialize the retry engine.
+
+        Args:
+            max_attempts: Total attempts including the first one
+            base_delay: Backoff for the first retry in seconds
+            max_delay: Upper bound for a single backoff in seconds
+        """
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    @staticmethod
+    def retry_after(headers) -> Optional[float]:
+        """
+        Parse the Retry-After (or retry-after-ms) header of a response.
+
+        Returns:
+            Seconds to wait, or None if the server did not say
+        """
+        if headers is None:
+            return None
+        for name, scale in (
+            ("retry-after-ms", 1000.0),
+            ("x-ms-retry-after-ms", 1000.0),
+        ):
+            value = headers.get(name)
+            if value:
+                try:
+                    return float(value) / scale
+                except ValueError:
+                    pass
+        value = headers.get("Retry-After")
+        if value:
+            try:
+                return float(value)
+            except ValueError:
+                return None
+        return None
+
+    def backoff(self, attempt: int, headers=None) -> float:
+        """
+        Compute the delay before the next attempt.
+
+        Args:
+            attempt: Number of attempts made so far (1 after the first failure)
+            headers: Headers of the failed response, if any
+
+        Returns:
+            Seconds to wait
+        """
+        retry_after = self.retry_after(headers)
+        if retry_after is not None:
+            return min(retry_after, self.max_delay)
+        # Full jitter keeps many concurrent callers from retrying in lockstep
+        return random.uniform(
+            0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        )
+
+    def should_retry(
+        self,
+        status_code: int,
+        attempt: int,
+        method: str = "GET",
+        retry_transient: bool = None,
+    ) -> bool:
+        """
+        Decide whether a failed attempt is resent.
+
+        Args:
+            status_code: Status code of the failed response
+            attempt: Number of attempts made so far
+            method: HTTP method of the request
+            retry_transient: Whether 5xx responses are retried. Defaults to True
+                for idempotent methods only
+
+        Returns:
+            True if the request should be sent again
+        """
+        if attempt >= self.max_attempts:
+            return False
+        if status_code in THROTTLING_STATUS_CODES:
+            return True
+        if status_code in TRANSIENT_STATUS_CODES:
+            if retry_transient is None:
+                return method.upper() in IDEMPOTENT_METHODS
+            return retry_transient
+        return False
+
+
+def principal_from_token(token: Optional[str]) -> str:
+    """
+    Extract the object ID of the caller from a bearer token without validating it.
+
+    Args:
+        token: Raw JWT access token (with or without the 'Bearer ' prefix)
+
+    Returns:
+        The oid claim, or 'unknown' if the token cannot be decoded
+    """
+    if not token:
+        return "unknown"
+    return _principal_from_jwt(token.removeprefix("Bearer ").strip())
+
+
+_principal_cache: Dict[str, str] = {}
+_principal_cache_lock = threading.Lock()
+
+
+def _principal_from_jwt(token: str) -> str:
+    with _principal_cache_lock:
+        principal = _principal_cache.get(token)
+    if principal is None:
+        try:
+            payload = token.split(".")[1]
+            claims = json.loads(
+                base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4))
+            )
+            principal = claims.get("oid") or claims.get("appid") or "unknown"
+        except (IndexError, ValueError):
+            principal = "unknown"
+        with _principal_cache_lock:
+            if len(_principal_cache) > 64:
+                _principal_cache.clear()
+            _principal_cache[token] = principal
+    return principal
+
+
+def request_scope(url: str) -> str:
+    """
+    Get the throttling scope of a request: the subscription ID, or the host
+    for requests outside a subscription.
+    """
+    match = _SUBSCRIPTION_RE.search(url)
+    return match.group(1).lower() if match else urlparse(url).netloc
+
+
+def sdk_throttling_kwargs(is_async: bool = False) -> Dict:
+    """
+    Keyword arguments that install the shared rate limiter and jittered retry
+    policy on an azure.mgmt.* client.
+
+    Args:
+        is_async: Build the policies for an azure.mgmt.*.aio client
+
+    Returns:
+        Dict of client constructor keyword arguments
+    """
+    # The policies subclass azure-core classes, so they load with the first SDK client
+    from .sdk_policies import (
+        ArmThrottlingPolicy,
+        AsyncArmThrottlingPolicy,
+        AsyncJitteredRetryPolicy,
+        JitteredRetryPolicy,
+    )
+
+    if is_async:
+        return {
+            "retry_policy": AsyncJitteredRetryPolicy(
+                retry_total=5, retry_backoff_max=60
+            ),
+            "custom_hook_policy": AsyncArmThrottlingPolicy(),
+        }
+    return {
+        "retry_policy": JitteredRetryPolicy(retry_total=5, retry_backoff_max=60),
+        "custom_hook_policy": ArmThrottlingPolicy(),
+    }
+
+
+def send_with_retry(
+    send: Callable[[], object],
+    url: str,
+    method: str,
+    principal: str,
+    limiter: "ArmRateLimiter" = None,
+    retry: RetryEngine = None,
+    retry_transient: bool = None,
+    deadline: float = None,
+):
+    """
+    Send a raw REST request under the shared rate limiter, retrying throttled
+    and transient failures with jittered exponential backoff. Transient server
+    errors are only retried for idempotent methods unless retry_transient is set.
+
+    Args:
+        send: Zero-argument callable performing the request and returning the response
+        url: Request URL, used to derive the throttling scope
+        method: HTTP method, used to pick the read or write bucket
+        principal: Identity the request is made as
+        limiter: Rate limiter to use. Defaults to the process-wide limiter
+        retry: Retry engine to use. Defaults to RetryEngine()
+        retry_transient: Retry 5xx responses. Defaults to True for idempotent methods,
+            set it for read-only POSTs and leave it unset for actions
+        deadline: Optional time.monotonic() deadline for the whole call, retries
+            included. No wait or retry is started that would end after it
+
+    Returns:
+        The last response received
+
+    Raises:
+        TimeoutError: If the rate limiter wait alone would pass the deadline
+    """
+    limiter = limiter or get_rate_limiter()
+    retry = retry or RetryEngine()
+    scope = request_scope(url)
+    attempt = 0
+    while True:
+        attempt += 1
+        delay = limiter.reserve(scope, principal, method)
+        if deadline is not None and time.monotonic() + delay >= deadline:
+            raise TimeoutError(f"Deadline passed before {method} {url} could be sent")
+        if delay > 0:
+            time.sleep(delay)
+        response = send()
+        limiter.observe(scope, principal, response.headers)
+        if not retry.should_retry(
+            response.status_code, attempt, method, retry_transient
+        ):
+            return response
+        delay = retry.backoff(attempt, response.headers)
+        if deadline is not None and time.monotonic() + delay >= deadline:
+            return response
+        print(
+            f"Request throttled or failed with {response.status_code}, retrying in {delay:.1f}s "
+            f"(attempt {attempt}/{retry.max_attempts})"
+        )
+        time.sleep(delay)
+
+
+_default_limiter = None
+_default_limiter_lock = threading.Lock()
+
+_vault_buckets: Dict[str, TokenBucket] = {}
+
+
+def get_rate_limiter() -> ArmRateLimiter:
+    """
+    Get the process-wide ARM rate limiter shared by SDK and raw REST calls.
+
+    Returns:
+        The default ArmRateLimiter instance
+    """
+    global _default_limiter
+    if _default_limiter is None:
+        with _default_limiter_lock:
+            if _default_limiter is None:
+                _default_limiter = ArmRateLimiter()
+    return _default_limiter
+
+
+def get_vault_bucket(vault_url: str) -> TokenBucket:
+    """
+    Get the process-wide token bucket for secret transactions against one vault.
+
+    Args:
+        vault_url: Vault URL, e.g. https://myvault.vault.azure.net
+
+    Returns:
+        The vault's TokenBucket
+    """
+    key = urlparse(vault_url).netloc.lower() or vault_url.lower()
+    bucket = _vault_buckets.get(key)
+    if bucket is None:
+        with _default_limiter_lock:
+            bucket = _vault_buckets.get(key)
+            if bucket is None:
+                bucket = _vault_buckets[key] = TokenBucket(*KEY_VAULT_BUCKET_LIMITS)
+    return bucket
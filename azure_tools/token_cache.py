@@ -0,0 +1,509 @@
+import asyncio
+import hashlib
+import json
+import os
+import socket
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+
+if TYPE_CHECKING:
+    from azure.core.credentials import AccessToken
+
+
+# Environment switches for the on-disk cache
+TOKEN_CACHE_ENV = "AZURE_TOOLS_TOKEN_CACHE"
+TOKEN_CACHE_PATH_ENV = "AZURE_TOOLS_TOKEN_CACHE_PATH"
+TOKEN_CACHE_KEY_ENV = "AZURE_TOOLS_TOKEN_CACHE_KEY"
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".azure_tools")
+
+# Tokens expiring sooner than this are treated as expired
+EXPIRY_MARGIN = 300
+
+# Tokens are refreshed in the background this long before they expire
+REFRESH_MARGIN = 600
+
+
+def refresh_delay(token: "AccessToken") -> float:
+    """
+    Seconds until a token should be refreshed: REFRESH_MARGIN before expiry,
+    but never sooner than half its remaining lifetime so short-lived tokens
+    do not cause a refresh loop.
+    """
+    remaining = token.expires_on - time.time()
+    return max(remaining - REFRESH_MARGIN, remaining / 2, 0.0)
+
+
+def _request_options(tenant_id: str = None, enable_cae: bool = False) -> Dict:
+    """Keyword arguments of a credential's get_token, leaving out defaults."""
+    options = {}
+    if tenant_id:
+        options["tenant_id"] = tenant_id
+    if enable_cae:
+        options["enable_cae"] = True
+    return options
+
+
+def token_cache_enabled() -> bool:
+    """Whether the on-disk token cache was switched on through the environment."""
+    return os.environ.get(TOKEN_CACHE_ENV, "").lower() in ("1", "true", "yes")
+
+
+def _cli_account() -> str:
+    """Tenant and user of the Azure CLI's default subscription, or "" if not logged in."""
+    config_dir = os.environ.get("AZURE_CONFIG_DIR") or os.path.join(
+        os.path.expanduser("~"), ".azure"
+    )
+    try:
+        # The CLI writes this file with a byte order mark
+        with open(
+            os.path.join(config_dir, "azureProfile.json"), encoding="utf-8-sig"
+        ) as f:
+            subscriptions = json.load(f).get("subscriptions", [])
+    except (OSError, ValueError):
+        return ""
+    for subscription in subscriptions:
+        if subscription.get("isDefault"):
+            user = subscription.get("user", {}).get("name", "")
+            return f"{subscription.get('tenantId', '')}/{user}"
+    return ""
+
+
+def credential_identity() -> str:
+    """
+    Fingerprint of the principal DefaultAzureCredential signs in as, used to keep
+    cached tokens of different users, service principals and tenants apart.
+    It covers the service principal and username settings, the Azure CLI's
+    signed-in account and the host (for managed identities). Accounts that
+    cannot be read locally (Azure PowerShell, Azure Developer CLI) are only
+    told apart by these settings, so set AZURE_CLIENT_ID or AZURE_USERNAME when
+    switching between them.
+    """
+    parts = [socket.gethostname()]
+    parts.extend(
+        os.environ.get(name, "")
+        for name in ("AZURE_CLIENT_ID", "AZURE_TENANT_ID", "AZURE_USERNAME")
+    )
+    parts.append(_cli_account())
+    return hashlib.sha256("|".join(parts).encode()).hexdigest()[:16]
+
+
+class KeyedLocks:
+    """
+    One lock per key, created on first use. Holding the lock of a key while
+    fetching its token makes the fetch single-flight: concurrent callers for
+    the same key wait for the first one instead of all hitting Entra ID,
+    while callers for other keys proceed. Locks taken through hold() or
+    async_hold() are dropped once nobody holds or waits for them, so keys
+    that are only used once do not accumulate.
+    """
+
+    def __init__(self, lock_factory=threading.Lock):
+        self._lock_factory = lock_factory
+        self._locks = {}
+        self._users: Dict = {}
+        self._guard = threading.Lock()
+
+    def __call__(self, key):
+        with self._guard:
+            lock = self._locks.get(key)
+            if lock is None:
+                lock = self._locks[key] = self._lock_factory()
+            return lock
+
+    def _enter(self, key):
+        with self._guard:
+            self._users[key] = self._users.get(key, 0) + 1
+            lock = self._locks.get(key)
+            if lock is None:
+                lock = self._locks[key] = self._lock_factory()
+            return lock
+
+    def _exit(self, key) -> None:
+        with self._guard:
+            self._users[key] -= 1
+            if not self._users[key]:
+                del self._users[key]
+                del self._locks[key]
+
+    @contextmanager
+    def hold(self, key):
+        """Hold the lock of a key, dropping it when the last user is done."""
+        lock = self._enter(key)
+        try:
+            with lock:
+                yield
+        finally:
+            self._exit(key)
+
+    @asynccontextmanager
+    async def async_hold(self, key):
+        """Async counterpart of hold() for locks made by an asyncio lock factory."""
+        lock = self._enter(key)
+        try:
+            async with lock:
+                yield
+        finally:
+            self._exit(key)
+
+
+@contextmanager
+def _file_lock(path: str, exclusive: bool):
+    """Hold an advisory lock on path (fcntl on POSIX, msvcrt on Windows)."""
+    with open(path, "a+b") as lock_file:
+        if os.name == "nt":
+            import msvcrt
+
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(
+                lock_file.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH
+            )
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+class PersistentTokenCache:
+    """
+    Encrypted token file shared by every process of the same user on a host.
+    Entries are keyed by signed-in principal, scope and tenant, encrypted with
+    Fernet, and read and written under a file lock so concurrent processes never
+    see a torn file. The Fernet key is kept in the OS key store (DPAPI, Keychain
+    or libsecret) through msal-extensions; where no key store is available it
+    falls back to an owner-only key file next to the cache, which protects the
+    tokens from other users but not from anyone who can read this user's files.
+    """
+
+    def __init__(self, path: str = None, key: bytes = None):
+        """
+        Initialize the token cache.
+
+        Args:
+            path: Cache file. Defaults to AZURE_TOOLS_TOKEN_CACHE_PATH or
+                ~/.azure_tools/token_cache.bin
+            key: Fernet key. Defaults to AZURE_TOOLS_TOKEN_CACHE_KEY, or a key created
+                on first use and kept in the OS key store (or an owner-only key file)
+        """
+        try:
+            from cryptography.fernet import Fernet
+        except ImportError as e:
+            raise ImportError(
+                "The on-disk token cache requires the 'cryptography' package"
+            ) from e
+
+        self.path = (
+            path
+            or os.environ.get(TOKEN_CACHE_PATH_ENV)
+            or os.path.join(DEFAULT_CACHE_DIR, "token_cache.bin")
+        )
+        os.makedirs(
+            os.path.dirname(os.path.abspath(self.path)), mode=0o700, exist_ok=True
+        )
+        self._lock_path = f"{self.path}.lock"
+        self._fernet = Fernet(key or self._load_key())
+
+    def _load_key(self) -> bytes:
+        env_key = os.environ.get(TOKEN_CACHE_KEY_ENV)
+        if env_key:
+            return env_key.encode()
+
+        key_path = os.path.join(
+            os.path.dirname(os.path.abspath(self.path)), "token_cache.key"
+        )
+        with _file_lock(self._lock_path, exclusive=True):
+            persistence = self._key_store(f"{key_path}.protected")
+            if persistence is None:
+                return self._load_key_file(key_path)
+            from msal_extensions.persistence import PersistenceNotFound
+
+            try:
+                return persistence.load().encode()
+            except PersistenceNotFound:
+                pass
+            from cryptography.fernet import Fernet
+
+            key = Fernet.generate_key()
+            persistence.save(key.decode())
+            if os.path.exists(key_path):
+                # Tokens encrypted with the old plaintext key are simply fetched again
+                os.remove(key_path)
+            return key
+
+    @staticmethod
+    def _key_store(location: str):
+        """OS-protected persistence for the Fernet key, or None if unavailable."""
+        try:
+            from msal_extensions import build_encrypted_persistence
+
+            return build_encrypted_persistence(location)
+        except Exception as e:
+            reason = str(e).splitlines()[0] if str(e) else type(e).__name__
+            print(
+                "OS key store unavailable, keeping the token cache key in an "
+                f"owner-only file: {reason}"
+            )
+            return None
+
+    @staticmethod
+    def _load_key_file(key_path: str) -> bytes:
+        from cryptography.fernet import Fernet
+
+        if not os.path.exists(key_path):
+            # O_EXCL with 0600 so the key is never readable by other users, even briefly
+            fd = os.open(key_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+            with os.fdopen(fd, "wb") as f:
+                f.write(Fernet.generate_key())
+        with open(key_path, "rb") as f:
+            return f.read().strip()
+
+    @staticmethod
+    def entry_key(
+        scopes: Tuple[str, ...],
+        tenant_id: str = None,
+        enable_cae: bool = False,
+        identity: str = "",
+    ) -> str:
+        """
+        Cache key of a token request.
+
+        Args:
+            scopes: Requested scopes
+            tenant_id: Tenant the token is requested from
+            enable_cae: Whether a Continuous Access Evaluation token is requested
+            identity: Principal requesting the token (see credential_identity)
+        """
+        return "|".join(
+            (
+                identity,
+                tenant_id or "",
+                "cae" if enable_cae else "",
+                " ".join(sorted(scopes)),
+            )
+        )
+
+    def _read(self) -> Dict[str, Dict]:
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, "rb") as f:
+                return json.loads(self._fernet.decrypt(f.read()))
+        except Exception as e:
+            # A corrupt file or a rotated key only costs a fresh token
+            print(f"Ignoring unreadable token cache {self.path}: {str(e)}")
+            return {}
+
+    def load(self, key: str) -> Optional["AccessToken"]:
+        """
+        Get a cached token that is not about to expire.
+
+        Returns:
+            The token, or None if there is no usable entry
+        """
+        with _file_lock(self._lock_path, exclusive=False):
+            entry = self._read().get(key)
+        if entry is None or entry["expires_on"] - time.time() <= EXPIRY_MARGIN:
+            return None
+        from azure.core.credentials import AccessToken
+
+        return AccessToken(entry["token"], entry["expires_on"])
+
+    def save(self, key: str, token: "AccessToken") -> None:
+        """Store a token, dropping expired entries of all keys while the file is locked."""
+        now = time.time()
+        with _file_lock(self._lock_path, exclusive=True):
+            entries = {k: v for k, v in self._read().items() if v["expires_on"] > now}
+            entries[key] = {"token": token.token, "expires_on": token.expires_on}
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "wb") as f:
+                f.write(self._fernet.encrypt(json.dumps(entries).encode()))
+            os.replace(tmp_path, self.path)
+
+    def clear(self) -> None:
+        with _file_lock(self._lock_path, exclusive=True):
+            if os.path.exists(self.path):
+                os.remove(self.path)
+
+
+class CachedTokenCredential:
+    """
+    Token credential that layers an in-memory and an on-disk cache over another
+    credential. SDK clients and raw REST calls built on it reuse tokens obtained
+    by earlier processes, and each token is refreshed on a background timer
+    before it expires, so callers rarely wait for Entra ID.
+    """
+
+    def __init__(self, credential, cache: PersistentTokenCache):
+        """
+        Initialize the cached credential.
+
+        Args:
+            credential: Credential that actually acquires tokens (e.g. DefaultAzureCredential)
+            cache: PersistentTokenCache shared with other processes
+        """
+        self.credential = credential
+        self.cache = cache
+        self.identity = credential_identity()
+        self._tokens: Dict[str, "AccessToken"] = {}
+        self._timers: Dict[str, threading.Timer] = {}
+        self._locks = KeyedLocks()
+
+    def get_token(
+        self, *scopes: str, claims: str = None, tenant_id: str = None, **kwargs
+    ) -> "AccessToken":
+        if claims:
+            # Claims challenges must reach the identity provider
+            return self.credential.get_token(
+                *scopes, claims=claims, tenant_id=tenant_id, **kwargs
+            )
+
+        options = _request_options(tenant_id, kwargs.get("enable_cae", False))
+        key = self.cache.entry_key(scopes, identity=self.identity, **options)
+        token = self._tokens.get(key)
+        if token is not None and token.expires_on - time.time() > EXPIRY_MARGIN:
+            return token
+        with self._locks(key):
+            token = self._tokens.get(key)
+            if token is not None and token.expires_on - time.time() > EXPIRY_MARGIN:
+                return token
+            token = self.cache.load(key)
+            if token is None:
+                token = self.credential.get_token(*scopes, **options)
+                self.cache.save(key, token)
+            self._tokens[key] = token
+            self._schedule_refresh(key, scopes, options, token)
+            return token
+
+    def _schedule_refresh(
+        self, key: str, scopes, options: Dict, token: "AccessToken"
+    ) -> None:
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        delay = refresh_delay(token)
+        timer = threading.Timer(delay, self._refresh, args=(key, scopes, options))
+        timer.daemon = True
+        self._timers[key] = timer
+        timer.start()
+
+    def _refresh(self, key: str, scopes, options: Dict) -> None:
+        try:
+            with self._locks(key):
+                # Another process may have refreshed already
+                token = self.cache.load(key)
+                if token is None or token.expires_on - time.time() <= REFRESH_MARGIN:
+                    token = self.credential.get_token(*scopes, **options)
+                    self.cache.save(key, token)
+                self._tokens[key] = token
+                self._schedule_refresh(key, scopes, options, token)
+        except Exception as e:
+            print(f"Background token refresh failed, will fetch on next use: {str(e)}")
+
+    def close(self) -> None:
+        for timer in list(self._timers.values()):
+            timer.cancel()
+        self._timers.clear()
+        close = getattr(self.credential, "close", None)
+        if close is not None:
+            close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class AsyncCachedTokenCredential:
+    """
+    Async counterpart of CachedTokenCredential for azure.identity.aio credentials.
+    Background refreshes run as tasks on the event loop that requested the token.
+    """
+
+    def __init__(self, credential, cache: PersistentTokenCache):
+        """
+        Initialize the cached credential.
+
+        Args:
+            credential: Async credential that actually acquires tokens
+            cache: PersistentTokenCache shared with other processes
+        """
+        self.credential = credential
+        self.cache = cache
+        self.identity = credential_identity()
+        self._tokens: Dict[str, "AccessToken"] = {}
+        self._handles: Dict[str, "asyncio.TimerHandle"] = {}
+        self._locks = KeyedLocks(asyncio.Lock)
+
+    async def get_token(
+        self, *scopes: str, claims: str = None, tenant_id: str = None, **kwargs
+    ) -> "AccessToken":
+        if claims:
+            return await self.credential.get_token(
+                *scopes, claims=claims, tenant_id=tenant_id, **kwargs
+            )
+
+        options = _request_options(tenant_id, kwargs.get("enable_cae", False))
+        key = self.cache.entry_key(scopes, identity=self.identity, **options)
+        token = self._tokens.get(key)
+        if token is not None and token.expires_on - time.time() > EXPIRY_MARGIN:
+            return token
+        async with self._locks(key):
+            token = self._tokens.get(key)
+            if token is not None and token.expires_on - time.time() > EXPIRY_MARGIN:
+                return token
+            token = await asyncio.to_thread(self.cache.load, key)
+            if token is None:
+                token = await self.credential.get_token(*scopes, **options)
+                await asyncio.to_thread(self.cache.save, key, token)
+            self._tokens[key] = token
+            self._schedule_refresh(key, scopes, options, token)
+            return token
+
+    def _schedule_refresh(
+        self, key: str, scopes, options: Dict, token: "AccessToken"
+    ) -> None:
+        handle = self._handles.pop(key, None)
+        if handle is not None:
+            handle.cancel()
+        delay = refresh_delay(token)
+        loop = asyncio.get_running_loop()
+        self._handles[key] = loop.call_later(
+            delay, lambda: loop.create_task(self._refresh(key, scopes, options))
+        )
+
+    async def _refresh(self, key: str, scopes, options: Dict) -> None:
+        try:
+            async with self._locks(key):
+                token = await asyncio.to_thread(self.cache.load, key)
+                if token is None or token.expires_on - time.time() <= REFRESH_MARGIN:
+                    token = await self.credential.get_token(*scopes, **options)
+                    await asyncio.to_thread(self.cache.save, key, token)
+                self._tokens[key] = token
+                self._schedule_refresh(key, scopes, options, token)
+        except Exception as e:
+            print(f"Background token refresh failed, will fetch on next use: {str(e)}")
+
+    async def close(self) -> None:
+        for handle in list(self._handles.values()):
+            handle.cancel()
+        self._handles.clear()
+        await self.credential.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
@@ -0,0 +1,154 @@
+import asyncio
+import inspect
+import time
+from typing import Any, Callable, Optional
+
+
+class WaitCancelledError(RuntimeError):
+    """Raised when a wait is cancelled through its cancel event."""
+
+
+class Waiter:
+    """
+    Polls a condition with exponential backoff until it holds, a deadline
+    passes or the wait is cancelled. Works from sync and asyncio code.
+    """
+
+    def __init__(
+        self,
+        initial_delay: float = 1.0,
+        factor: float = 2.0,
+        max_delay: float = 30.0,
+        timeout: Optional[float] = None,
+        cancel_event: Any = None,
+        on_progress: Optional[Callable[[int, float, Any], None]] = None,
+    ):
+        """
+        Initialize the waiter.
+
+        Args:
+            initial_delay: Delay after the first unsuccessful check in seconds
+            factor: Multiplier applied to the delay after every check
+            max_delay: Upper bound for a single delay in seconds
+            timeout: Optional overall deadline in seconds
+            cancel_event: Optional threading.Event (sync) or asyncio.Event (async)
+                that aborts the wait when set
+            on_progress: Optional callback called after every unsuccessful check
+                with (attempt, elapsed seconds, last predicate result)
+        """
+        if initial_delay < 0 or factor < 1 or max_delay < initial_delay:
+            raise ValueError(
+                "Waiter requires initial_delay >= 0, factor >= 1 and max_delay >= initial_delay"
+            )
+        self.initial_delay = initial_delay
+        self.factor = factor
+        self.max_delay = max_delay
+        self.timeout = timeout
+        self.cancel_event = cancel_event
+        self.on_progress = on_progress
+
+    def delays(self):
+        """Yield the delay schedule: initial_delay, growing by factor, capped at max_delay."""
+        delay = self.initial_delay
+        while True:
+            yield delay
+            delay = min(self.max_delay, delay * self.factor)
+
+    def _next_delay(
+        self, delays, started: float, attempt: int, result: Any, description: str
+    ) -> float:
+        elapsed = time.monotonic() - started
+        if self.on_progress is not None:
+            self.on_progress(attempt, elapsed, result)
+        delay = next(delays)
+        if self.timeout is not None:
+            remaining = self.timeout - elapsed
+            if remaining <= 0:
+                raise TimeoutError(
+                    f"Timed out after {self.timeout}s waiting for {description}"
+                )
+            delay = min(delay, remaining)
+        return delay
+
+    def wait_until(
+        self, predicate: Callable[[], Any], description: str = "condition"
+    ) -> Any:
+        """
+        Call predicate until it returns a truthy value.
+
+        Args:
+            predicate: Zero-argument callable checking the condition
+            description: What is being waited for, used in error messages
+
+        Returns:
+            The first truthy value returned by predicate
+
+        Raises:
+            TimeoutError: If the timeout expires first
+            WaitCancelledError: If the cancel event is set
+        """
+        started = time.monotonic()
+        delays = self.delays()
+        attempt = 0
+        while True:
+            attempt += 1
+            result = predicate()
+            if result:
+                return result
+            delay = self._next_delay(delays, started, attempt, result, description)
+            if self.cancel_event is not None:
+                if self.cancel_event.wait(delay):
+                    raise WaitCancelledError(f"Wait for {description} was cancelled")
+            else:
+                time.sleep(delay)
+
+    async def async_wait_until(
+        self, predicate: Callable[[], Any], description: str = "condition"
+    ) -> Any:
+        """
+        Async variant of wait_until. predicate may be a plain function or a coroutine function.
+
+        Returns:
+            The first truthy value returned by predicate
+
+        Raises:
+            TimeoutError: If the timeout expires first
+            WaitCancelledError: If the cancel event is set
+        """
+        started = time.monotonic()
+        delays = self.delays()
+        attempt = 0
+        while True:
+            attempt += 1
+            result = predicate()
+            if inspect.isawaitable(result):
+                result = await result
+            if result:
+                return result
+            delay = self._next_delay(delays, started, attempt, result, description)
+            if self.cancel_event is not None:
+                try:
+                    await asyncio.wait_for(self.cancel_event.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    continue
+                raise WaitCancelledError(f"Wait for {description} was cancelled")
+            await asyncio.sleep(delay)
+
+
+def wait_until(
+    predicate: Callable[[], Any], description: str = "condition", **kwargs
+) -> Any:
+    """
+    Poll predicate with exponential backoff until it returns a truthy value.
+    Keyword arguments are passed to Waiter.
+    """
+    return Waiter(**kwargs).wait_until(predicate, description)
+
+
+async def async_wait_until(
+    predicate: Callable[[], Any], description: str = "condition", **kwargs
+) -> Any:
+    """
+    Async variant of wait_until. Keyword arguments are passed to Waiter.
+    """
+    return await Waiter(**kwargs).async_wait_until(predicate, description)
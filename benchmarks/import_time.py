@@ -0,0 +1,103 @@
+"""
+Import-time benchmark for azure_tools entry points.
+
+Runs each import in a fresh interpreter with -X importtime several times and
+reports the median cumulative time of the top-level module, plus the slowest
+modules it pulled in. With --max-ms the script exits non-zero when any entry
+point exceeds the budget, so it can guard against import-time regressions.
+
+Usage:
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --runs 7 --max-ms 150 azure_tools azure_tools.aio.adf
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+DEFAULT_MODULES = ["azure_tools", "azure_tools.adf", "azure_tools.aio.adf"]
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def measure(module: str = None) -> Tuple[float, Dict[str, float]]:
+    """
+    Import a module in a fresh interpreter (or just start one when module is None).
+
+    Returns:
+        (cumulative milliseconds for the module, cumulative milliseconds per imported module)
+    """
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            f"import {module}" if module else "pass",
+        ],
+        capture_output=True,
+        text=True,
+        cwd=REPO_ROOT,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{result.stderr}")
+
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative_us, name = line[len("import time:") :].split("|")
+        if cumulative_us.strip().isdigit():
+            cumulative[name.strip()] = int(cumulative_us) / 1000
+    return cumulative.get(module, 0.0), cumulative
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("modules", nargs="*", default=DEFAULT_MODULES)
+    parser.add_argument(
+        "--runs", type=int, default=5, help="Fresh interpreters per module"
+    )
+    parser.add_argument(
+        "--top", type=int, default=5, help="Slowest dependencies to list"
+    )
+    parser.add_argument(
+        "--max-ms", type=float, help="Fail if a module's median exceeds this"
+    )
+    args = parser.parse_args(argv)
+
+    # Modules loaded by interpreter startup (site, .pth hooks) are not attributed to azure_tools
+    _, startup = measure()
+
+    failed = False
+    for module in args.modules:
+        samples = []
+        breakdown = {}
+        for _ in range(args.runs):
+            total, breakdown = measure(module)
+            samples.append(total)
+        median = statistics.median(samples)
+        over = args.max_ms is not None and median > args.max_ms
+        failed = failed or over
+        print(
+            f"{module}: median {median:.1f}ms, min {min(samples):.1f}ms over {args.runs} runs"
+            + ("  OVER BUDGET" if over else "")
+        )
+        slowest = sorted(
+            (
+                (ms, name)
+                for name, ms in breakdown.items()
+                if name != module and name not in startup
+            ),
+            reverse=True,
+        )[: args.top]
+        for ms, name in slowest:
+            print(f"    {ms:8.1f}ms  {name}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,138 @@
+import asyncio
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from azure.mgmt.datafactory.models import ActivityRun, PipelineRun
+
+from azure_tools.adf.pipelines import ADFPipeline
+from azure_tools.adf.runs import QUERY_WINDOW_SLACK, activity_query_window
+from azure_tools.aio.adf.pipelines import ADFPipeline as AsyncADFPipeline
+
+RUN_START = datetime(2024, 5, 1, 10, 0, 0, 123456, tzinfo=timezone.utc)
+RUN_END = datetime(2024, 5, 1, 11, 0, tzinfo=timezone.utc)
+
+
+def pipeline_run(run_id="run-1", status="Succeeded"):
+    return PipelineRun.deserialize(
+        {
+            "runId": run_id,
+            "status": status,
+            "runStart": "2024-05-01T10:00:00.1234567Z",
+            "runEnd": "2024-05-01T11:00:00Z",
+        }
+    )
+
+
+def activity_run(name, output=None):
+    return ActivityRun.deserialize(
+        {"activityName": name, "status": "Succeeded", "output": output or {}}
+    )
+
+
+class FakeActivityRuns:
+    def __init__(self, pages):
+        self.pages = pages
+        self.calls = []
+
+    def query_by_pipeline_run(
+        self, resource_group_name, factory_name, run_id, filter_parameters
+    ):
+        self.calls.append(
+            (
+                filter_parameters.last_updated_after,
+                filter_parameters.last_updated_before,
+                filter_parameters.continuation_token,
+            )
+        )
+        index = len(self.calls) - 1
+        return SimpleNamespace(
+            value=self.pages[index],
+            continuation_token="next" if index + 1 < len(self.pages) else None,
+        )
+
+
+def fake_client(pages, status="Succeeded"):
+    return SimpleNamespace(
+        pipelines=SimpleNamespace(
+            create_run=lambda **kwargs: SimpleNamespace(run_id="run-1")
+        ),
+        pipeline_runs=SimpleNamespace(get=lambda **kwargs: pipeline_run(status=status)),
+        activity_runs=FakeActivityRuns(pages),
+    )
+
+
+def helper(cls, client):
+    pipeline = cls(
+        resource_group_name="rg",
+        resource_name="adf-1",
+        subscription_id="sub-1",
+        auth=SimpleNamespace(credential=None),
+    )
+    pipeline.client = client
+    return pipeline
+
+
+def test_activity_query_window_parses_as_dict_timestamps():
+    after, before = activity_query_window(pipeline_run().as_dict())
+
+    assert after == RUN_START - QUERY_WINDOW_SLACK
+    assert before == RUN_END + QUERY_WINDOW_SLACK
+
+
+def test_activity_query_window_of_a_running_run_ends_now():
+    started = datetime.now(timezone.utc)
+    after, before = activity_query_window({"run_start": "2024-05-01T10:00:00"})
+
+    assert after == datetime(2024, 5, 1, 10, tzinfo=timezone.utc) - QUERY_WINDOW_SLACK
+    assert before >= started + QUERY_WINDOW_SLACK
+
+
+def test_fetch_activity_reads_every_page_in_the_run_window():
+    client = fake_client([[activity_run("a")], [activity_run("b")]])
+    pipeline = helper(ADFPipeline, client)
+
+    activities = pipeline.fetch_activity(run="run-1")
+
+    assert [a["activity_name"] for a in activities] == ["a", "b"]
+    after, before, token = client.activity_runs.calls[0]
+    assert (after, before, token) == (
+        RUN_START - QUERY_WINDOW_SLACK,
+        RUN_END + QUERY_WINDOW_SLACK,
+        None,
+    )
+    assert client.activity_runs.calls[1][2] == "next"
+
+
+def test_run_and_fetch_returns_the_activity_result_sets():
+    result_sets = [{"rows": [[1]]}]
+    client = fake_client([[activity_run("lookup", {"resultSets": result_sets})]])
+    pipeline = helper(ADFPipeline, client)
+
+    assert pipeline.run_and_fetch("pipeline", "lookup") == result_sets
+
+
+def test_async_iter_activity_runs_uses_the_run_window():
+    client = fake_client([[activity_run("a")]])
+
+    async def async_call(value):
+        return value
+
+    client.pipeline_runs = SimpleNamespace(
+        get=lambda **kwargs: async_call(pipeline_run())
+    )
+    activity_runs = client.activity_runs
+    client.activity_runs = SimpleNamespace(
+        query_by_pipeline_run=lambda **kwargs: async_call(
+            activity_runs.query_by_pipeline_run(**kwargs)
+        )
+    )
+    pipeline = helper(AsyncADFPipeline, client)
+
+    async def collect():
+        return [a async for a in pipeline.iter_activity_runs("run-1")]
+
+    assert [a["activity_name"] for a in asyncio.run(collect())] == ["a"]
+    assert activity_runs.calls[0][:2] == (
+        RUN_START - QUERY_WINDOW_SLACK,
+        RUN_END + QUERY_WINDOW_SLACK,
+    )
@@ -0,0 +1,154 @@
+import threading
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+
+from azure_tools.adf.runs import PipelineRunHandle, PipelineRunMonitor, iter_run_query
+
+
+class FakeRun:
+    def __init__(self, run_id, status):
+        self.run_id = run_id
+        self.status = status
+
+    def as_dict(self):
+        return {"run_id": self.run_id, "status": self.status}
+
+
+class FakePipelineRuns:
+    """Runs finish after a fixed number of polls of their factory."""
+
+    def __init__(self, polls_to_finish=2, hidden=()):
+        self.polls_to_finish = polls_to_finish
+        self.hidden = set(hidden)
+        self.queries = []
+        self.gets = []
+        self._polls = {}
+        self._lock = threading.Lock()
+
+    def _status(self, run_id):
+        return (
+            "Succeeded" if self._polls[run_id] >= self.polls_to_finish else "InProgress"
+        )
+
+    def query_by_factory(self, resource_group_name, factory_name, filter_parameters):
+        run_ids = filter_parameters.filters[0].values
+        with self._lock:
+            self.queries.append((factory_name, list(run_ids)))
+            runs = []
+            for run_id in run_ids:
+                self._polls[run_id] = self._polls.get(run_id, 0) + 1
+                if run_id not in self.hidden:
+                    runs.append(FakeRun(run_id, self._status(run_id)))
+        return SimpleNamespace(value=runs, continuation_token=None)
+
+    def get(self, resource_group_name, factory_name, run_id):
+        with self._lock:
+            self.gets.append(run_id)
+            return FakeRun(run_id, self._status(run_id))
+
+
+def handle(run_id, factory="adf-1"):
+    return PipelineRunHandle(
+        run_id=run_id,
+        pipeline_name="pipeline",
+        resource_group_name="rg",
+        factory_name=factory,
+        subscription_id="sub-1",
+    )
+
+
+def monitor_with(pipeline_runs, **kwargs):
+    monitor = PipelineRunMonitor(
+        auth=SimpleNamespace(credential=None),
+        min_interval=0.01,
+        max_interval=0.05,
+        **kwargs,
+    )
+    client = SimpleNamespace(pipeline_runs=pipeline_runs)
+    return monitor, mock.patch.object(monitor, "_client", return_value=client)
+
+
+def test_iter_run_query_follows_continuation_tokens():
+    pages = {
+        None: SimpleNamespace(value=[1, 2], continuation_token="page-2"),
+        "page-2": SimpleNamespace(value=[3], continuation_token=None),
+    }
+    seen_tokens = []
+
+    def query(filter_parameters, **kwargs):
+        seen_tokens.append(filter_parameters.continuation_token)
+        return pages[filter_parameters.continuation_token]
+
+    parameters = SimpleNamespace(continuation_token=None)
+
+    assert list(iter_run_query(query, parameters)) == [1, 2, 3]
+    assert seen_tokens == [None, "page-2"]
+
+
+def test_refresh_batches_one_query_per_factory():
+    pipeline_runs = FakePipelineRuns(polls_to_finish=1)
+    monitor, patched = monitor_with(pipeline_runs)
+    handles = [handle("a1"), handle("a2"), handle("b1", factory="adf-2")]
+    monitor.track(*handles)
+
+    with patched:
+        finished = monitor.refresh()
+
+    assert sorted(q[0] for q in pipeline_runs.queries) == ["adf-1", "adf-2"]
+    assert set(finished) == set(handles)
+    assert all(h.status == "Succeeded" for h in handles)
+    assert pipeline_runs.gets == []
+
+
+def test_runs_missing_from_the_query_fall_back_to_get():
+    pipeline_runs = FakePipelineRuns(polls_to_finish=1, hidden={"recovery"})
+    monitor, patched = monitor_with(pipeline_runs)
+    monitor.track(handle("recovery"))
+
+    with patched:
+        monitor.refresh()
+
+    assert pipeline_runs.gets == ["recovery"]
+
+
+def test_wait_polls_until_every_run_is_terminal():
+    pipeline_runs = FakePipelineRuns(polls_to_finish=3)
+    monitor, patched = monitor_with(pipeline_runs)
+    handles = [handle(f"run-{i}") for i in range(5)]
+
+    with patched:
+        assert monitor.wait(handles, timeout=5) == handles
+
+    assert all(h.is_terminal for h in handles)
+    # One batched query per poll, not one call per run
+    assert len(pipeline_runs.queries) == 3
+
+
+def test_runs_tracked_after_the_poller_stopped_get_a_new_poller():
+    pipeline_runs = FakePipelineRuns(polls_to_finish=1)
+    monitor, patched = monitor_with(pipeline_runs)
+
+    with patched:
+        monitor.wait([handle("first")], timeout=5)
+        late = handle("late")
+        monitor.wait([late], timeout=5)
+
+    assert late.is_terminal
+
+
+def test_wait_times_out():
+    pipeline_runs = FakePipelineRuns(polls_to_finish=10**6)
+    monitor, patched = monitor_with(pipeline_runs)
+    slow = handle("slow")
+
+    with patched:
+        with pytest.raises(TimeoutError):
+            monitor.wait([slow], timeout=0.1)
+        # Stop the poller before the fake client goes away
+        poller = monitor._poller
+        monitor.untrack(slow)
+        poller.join(timeout=1)
+
+    assert not poller.is_alive()
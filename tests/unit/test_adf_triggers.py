@@ -0,0 +1,137 @@
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from azure_tools.adf.triggers import ADFTrigger
+from azure_tools.aio.adf.triggers import ADFTrigger as AsyncADFTrigger
+
+
+def trigger(name, state, trigger_type="ScheduleTrigger"):
+    return SimpleNamespace(
+        name=name, properties=SimpleNamespace(type=trigger_type, runtime_state=state)
+    )
+
+
+class FakeTriggers:
+    def __init__(self, triggers, failing=()):
+        self.triggers = triggers
+        self.failing = set(failing)
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def list_by_factory(self, resource_group_name, factory_name):
+        return iter(self.triggers)
+
+    def _begin(self, action, name):
+        with self._lock:
+            self.calls.append((action, name))
+        if name in self.failing:
+            raise RuntimeError(f"{name} is misconfigured")
+        return SimpleNamespace(result=lambda: None)
+
+    def begin_start(self, resource_group_name, factory_name, trigger_name):
+        return self._begin("start", trigger_name)
+
+    def begin_stop(self, resource_group_name, factory_name, trigger_name):
+        return self._begin("stop", trigger_name)
+
+
+def adf_triggers(cls, fake):
+    helper = cls(
+        resource_group_name="rg",
+        resource_name="adf-1",
+        subscription_id="sub-1",
+        auth=SimpleNamespace(credential=None),
+    )
+    helper.client = SimpleNamespace(triggers=fake)
+    return helper
+
+
+TRIGGERS = [
+    trigger("nightly", "Stopped"),
+    trigger("hourly", "Started"),
+    trigger("broken", "Stopped"),
+    trigger("window", "Stopped", "TumblingWindowTrigger"),
+    trigger("on-blob", "Stopped", "BlobEventsTrigger"),
+]
+
+
+def test_concurrent_start_skips_started_triggers_and_collects_errors():
+    fake = FakeTriggers(TRIGGERS, failing={"broken"})
+    helper = adf_triggers(ADFTrigger, fake)
+
+    outcome = helper.manage_all_triggers("start", concurrent=True, max_workers=2)
+
+    assert sorted(fake.calls) == [
+        ("start", "broken"),
+        ("start", "nightly"),
+        ("start", "window"),
+    ]
+    by_name = {r["trigger"]: r for r in outcome["results"]}
+    assert set(by_name) == {"nightly", "hourly", "broken", "window"}
+    assert by_name["hourly"]["status"] == "skipped"
+    assert by_name["nightly"]["status"] == "succeeded"
+    assert by_name["window"]["status"] == "succeeded"
+    assert by_name["broken"]["status"] == "failed"
+    assert by_name["broken"]["error"] == "broken is misconfigured"
+    assert outcome["action"] == "start"
+    assert outcome["elapsed_seconds"] >= 0
+    assert all(
+        set(r) == {"trigger", "status", "seconds", "error"} for r in outcome["results"]
+    )
+
+
+def test_concurrent_stop_only_calls_started_triggers():
+    fake = FakeTriggers(TRIGGERS)
+    helper = adf_triggers(ADFTrigger, fake)
+
+    outcome = helper.manage_all_triggers("stop", concurrent=True)
+
+    assert fake.calls == [("stop", "hourly")]
+    assert [r["status"] for r in outcome["results"]].count("skipped") == 3
+
+
+def test_invalid_action_is_rejected():
+    helper = adf_triggers(ADFTrigger, FakeTriggers(TRIGGERS))
+
+    with pytest.raises(ValueError, match="Invalid action"):
+        helper.manage_all_triggers("pause", concurrent=True)
+
+
+def test_async_concurrent_start_collects_errors():
+    fake = FakeTriggers(TRIGGERS, failing={"broken"})
+
+    async def pages():
+        for item in TRIGGERS:
+            yield item
+
+    async def begin(action, name):
+        poller = fake._begin(action, name)
+
+        async def result():
+            return poller.result()
+
+        return SimpleNamespace(result=result)
+
+    helper = adf_triggers(
+        AsyncADFTrigger,
+        SimpleNamespace(
+            list_by_factory=lambda *args: pages(),
+            begin_start=lambda rg, factory, name: begin("start", name),
+            begin_stop=lambda rg, factory, name: begin("stop", name),
+        ),
+    )
+
+    outcome = asyncio.run(
+        helper.manage_all_triggers("start", concurrent=True, max_workers=2)
+    )
+
+    statuses = {r["trigger"]: r["status"] for r in outcome["results"]}
+    assert statuses == {
+        "hourly": "skipped",
+        "nightly": "succeeded",
+        "broken": "failed",
+        "window": "succeeded",
+    }
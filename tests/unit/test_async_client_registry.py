@@ -0,0 +1,76 @@
+import asyncio
+
+from azure_tools.aio import client_registry
+from azure_tools.aio.auth import AzureAuthentication
+from azure_tools.aio.client_registry import AsyncClientRegistry
+
+
+class FakeAsyncClient:
+    def __init__(self):
+        self.closed = False
+
+    async def close(self):
+        await asyncio.sleep(0)
+        self.closed = True
+
+
+class FakeAsyncRegistry(AsyncClientRegistry):
+    def _build_client(self, client_type, scope, credential):
+        return FakeAsyncClient()
+
+
+CREDENTIAL = object()
+
+
+def test_each_event_loop_gets_its_own_registry():
+    async def registry():
+        return client_registry.get_async_client_registry()
+
+    async def same_loop_twice():
+        return (
+            client_registry.get_async_client_registry(),
+            client_registry.get_async_client_registry(),
+        )
+
+    first, second = asyncio.run(same_loop_twice())
+    assert first is second
+    assert asyncio.run(registry()) is not first
+
+
+def test_each_event_loop_gets_its_own_shared_auth(monkeypatch):
+    monkeypatch.setattr(AzureAuthentication, "__init__", lambda self: None)
+
+    async def shared():
+        return AzureAuthentication.shared(), AzureAuthentication.shared()
+
+    first, again = asyncio.run(shared())
+    assert first is again
+    second, _ = asyncio.run(shared())
+    assert second is not first
+
+
+def test_eviction_close_task_is_kept_and_awaited_by_aclear():
+    async def scenario():
+        registry = FakeAsyncRegistry(max_size=0, loop=asyncio.get_running_loop())
+        client = registry.acquire("adf", "sub-1", CREDENTIAL)
+        registry.release("adf", "sub-1", CREDENTIAL)
+        assert len(registry._closing) == 1
+        await registry.aclear()
+        return client, registry
+
+    client, registry = asyncio.run(scenario())
+    assert client.closed
+    assert not registry._closing
+
+
+def test_aclear_keeps_referenced_clients_open():
+    async def scenario():
+        registry = FakeAsyncRegistry(loop=asyncio.get_running_loop())
+        busy = registry.acquire("adf", "sub-1", CREDENTIAL)
+        await registry.aclear()
+        assert not busy.closed
+        registry.release("adf", "sub-1", CREDENTIAL)
+        await asyncio.gather(*registry._closing)
+        return busy
+
+    assert asyncio.run(scenario()).closed
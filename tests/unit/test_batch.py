@@ -0,0 +1,160 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from azure_tools import waiters
+from azure_tools.aio.batch import AzureBatchPool as AsyncAzureBatchPool
+from azure_tools.batch import AzureBatchPool, fixed_scale_patch
+
+
+def pool(etag, state, dedicated, low_priority=0, current=None):
+    return SimpleNamespace(
+        etag=etag,
+        allocation_state=state,
+        current_dedicated_nodes=dedicated if current is None else current,
+        current_low_priority_nodes=low_priority,
+        scale_settings=SimpleNamespace(
+            fixed_scale=SimpleNamespace(
+                target_dedicated_nodes=dedicated,
+                target_low_priority_nodes=low_priority,
+            ),
+            auto_scale=None,
+        ),
+        resize_operation_status=None,
+    )
+
+
+class FakePools:
+    def __init__(self, reads, updated=None):
+        self.reads = list(reads)
+        self.updated = updated
+        self.gets = 0
+        self.updates = []
+
+    def get(self, resource_group_name, account_name, pool_name):
+        self.gets += 1
+        return self.reads.pop(0) if len(self.reads) > 1 else self.reads[0]
+
+    def update(
+        self, resource_group_name, account_name, pool_name, parameters, if_match
+    ):
+        self.updates.append((json.loads(parameters), if_match))
+        return self.updated
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    monkeypatch.setattr(waiters.time, "sleep", lambda seconds: None)
+
+
+def batch_pool(cls, pools):
+    helper = cls(
+        resource_group_name="rg",
+        resource_name="batch-1",
+        pool_name="pool-1",
+        subscription_id="sub-1",
+        auth=SimpleNamespace(credential=None),
+    )
+    helper.client = SimpleNamespace(pool=pools)
+    return helper
+
+
+def test_resize_patches_only_the_scale_settings_under_the_etag():
+    pools = FakePools([], updated=pool("etag-2", "Resizing", 5))
+    helper = batch_pool(AzureBatchPool, pools)
+
+    state = helper.resize_pool(5, etag="etag-1")
+
+    assert pools.gets == 0
+    assert pools.updates == [
+        (
+            {
+                "properties": {
+                    "scaleSettings": {"fixedScale": {"targetDedicatedNodes": 5}}
+                }
+            },
+            "etag-1",
+        )
+    ]
+    assert state["etag"] == "etag-2"
+
+
+def test_resize_reads_the_etag_and_keeps_the_low_priority_target():
+    pools = FakePools(
+        [pool("etag-1", "Steady", 2, low_priority=3)], pool("e", "Resizing", 5)
+    )
+    helper = batch_pool(AzureBatchPool, pools)
+
+    helper.resize_pool(5, resize_timeout="PT15M")
+
+    assert pools.updates == [
+        (fixed_scale_patch(5, 3, resize_timeout="PT15M"), "etag-1")
+    ]
+
+
+def test_unchanged_target_is_not_sent():
+    pools = FakePools([pool("etag-1", "Steady", 5)])
+    helper = batch_pool(AzureBatchPool, pools)
+
+    assert helper.scale_pool_nodes(5, dry_run=False)["target_dedicated_nodes"] == 5
+    assert pools.updates == []
+
+
+def test_dry_run_sends_nothing():
+    pools = FakePools([pool("etag-1", "Steady", 2)])
+    helper = batch_pool(AzureBatchPool, pools)
+
+    helper.scale_pool_nodes(5)
+
+    assert pools.updates == []
+
+
+def test_wait_ignores_a_steady_read_from_before_the_resize():
+    pools = FakePools(
+        [
+            pool("etag-1", "Steady", 2),
+            pool("etag-1", "Steady", 2),
+            pool("etag-2", "Resizing", 5, current=3),
+            pool("etag-3", "Steady", 5),
+        ],
+        updated=pool("etag-2", "Resizing", 5, current=2),
+    )
+    helper = batch_pool(AzureBatchPool, pools)
+
+    state = helper.resize_pool(5, wait=True, waiter=waiters.Waiter(initial_delay=1))
+
+    assert state["current_dedicated_nodes"] == 5
+    assert state["etag"] == "etag-3"
+
+
+def test_async_wait_ignores_a_steady_read_from_before_the_resize():
+    pools = FakePools(
+        [
+            pool("etag-1", "Steady", 2),
+            pool("etag-2", "Steady", 2, low_priority=1),
+            pool("etag-3", "Steady", 5, low_priority=1),
+        ]
+    )
+
+    async def call(function, *args, **kwargs):
+        return function(*args, **kwargs)
+
+    helper = batch_pool(
+        AsyncAzureBatchPool,
+        SimpleNamespace(
+            get=lambda **kwargs: call(pools.get, **kwargs),
+            update=lambda **kwargs: call(pools.update, **kwargs),
+        ),
+    )
+
+    state = asyncio.run(
+        helper.wait_for_steady(
+            waiter=waiters.Waiter(initial_delay=0.001, max_delay=0.001),
+            target_dedicated_nodes=5,
+            target_low_priority_nodes=1,
+        )
+    )
+
+    assert state["etag"] == "etag-3"
@@ -0,0 +1,196 @@
+import threading
+import time
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+
+from azure_tools import batch_scaling
+from azure_tools.batch_scaling import BatchScalingOrchestrator
+
+SUB = "sub-1"
+
+
+class FakeBatchPools:
+    """Pool states by name, plus a log of resize and wait calls."""
+
+    def __init__(self, states, failing=None):
+        self.states = states
+        self.failing = failing or {}
+        self.resized = []
+        self.waited = []
+        self.lock = threading.Lock()
+
+    def helper(self, resource_group_name, resource_name, pool_name, **kwargs):
+        return FakeBatchPool(self, resource_name, pool_name)
+
+
+class FakeBatchPool:
+    def __init__(self, pools, account, name):
+        self.pools = pools
+        self.account = account
+        self.name = name
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def get_pool_state(self):
+        return self.pools.states[self.name]
+
+    def resize_pool(self, dedicated, low_priority, etag=None):
+        with self.pools.lock:
+            self.pools.resized.append((self.name, dedicated, low_priority, etag))
+        if self.name in self.pools.failing:
+            raise self.pools.failing[self.name]
+
+    def wait_for_steady(
+        self, waiter, target_dedicated_nodes, target_low_priority_nodes
+    ):
+        with self.pools.lock:
+            self.pools.waited.append(self.name)
+        return {
+            "current_dedicated_nodes": target_dedicated_nodes,
+            "current_low_priority_nodes": target_low_priority_nodes,
+            "resize_errors": [],
+        }
+
+
+def state(dedicated, low_priority=0, etag="etag-1"):
+    return {
+        "etag": etag,
+        "allocation_state": "Steady",
+        "target_dedicated_nodes": dedicated,
+        "target_low_priority_nodes": low_priority,
+    }
+
+
+def orchestrator(targets, pools, **kwargs):
+    with mock.patch.object(
+        batch_scaling.SubscriptionResourceManager,
+        "get_subscription_id",
+        return_value=SUB,
+    ):
+        scaling = BatchScalingOrchestrator(
+            targets, auth=SimpleNamespace(credential=None), **kwargs
+        )
+    patched = mock.patch.object(batch_scaling, "AzureBatchPool", pools.helper)
+    return scaling, patched
+
+
+def test_targets_are_resolved_to_four_part_keys_and_validated():
+    scaling, _ = orchestrator(
+        {
+            ("rg", "acct", "pool-a"): 3,
+            ("sub-2", "rg", "acct", "pool-b"): (2, None),
+            ("rg", "acct", "pool-c"): (0, 4),
+        },
+        FakeBatchPools({}),
+    )
+
+    assert scaling.targets == {
+        (SUB, "rg", "acct", "pool-a"): (3, None),
+        ("sub-2", "rg", "acct", "pool-b"): (2, None),
+        (SUB, "rg", "acct", "pool-c"): (0, 4),
+    }
+    for target in (-1, (1, -2), 2.5, "3", (1,), True, (1, 2.0)):
+        with pytest.raises(ValueError):
+            orchestrator({("rg", "acct", "pool-a"): target}, FakeBatchPools({}))
+
+
+def test_missing_low_priority_target_keeps_the_current_one():
+    pools = FakeBatchPools(
+        {"same": state(3, low_priority=2), "more": state(3, low_priority=2)}
+    )
+    scaling, patched = orchestrator(
+        {("rg", "acct", "same"): 3, ("rg", "acct", "more"): (5, None)}, pools
+    )
+
+    with patched:
+        plan = scaling.plan()
+
+    assert plan["unchanged"] == [f"{SUB}/rg/acct/same"]
+    assert [(c["pool_name"], c["target_low_priority"]) for c in plan["changes"]] == [
+        ("more", 2)
+    ]
+
+
+def test_resizes_are_paced_per_account():
+    pools = FakeBatchPools({name: state(1) for name in ("a-1", "a-2", "a-3", "b-1")})
+    scaling, patched = orchestrator(
+        {
+            ("rg", "acct-a", "a-1"): 2,
+            ("rg", "acct-a", "a-2"): 2,
+            ("rg", "acct-a", "a-3"): 2,
+            ("rg", "acct-b", "b-1"): 2,
+        },
+        pools,
+        # A burst of two that refills too slowly to matter in a test
+        account_rate_limit=(2, 0.001),
+    )
+    sleeps = []
+
+    with (
+        patched,
+        mock.patch.object(
+            batch_scaling,
+            "time",
+            SimpleNamespace(sleep=sleeps.append, monotonic=time.monotonic),
+        ),
+    ):
+        results = scaling.apply(dry_run=False, wait=False)
+
+    assert sorted(r["pool"] for r in results) == [
+        "acct-a/a-1",
+        "acct-a/a-2",
+        "acct-a/a-3",
+        "acct-b/b-1",
+    ]
+    assert {r["status"] for r in results} == {"accepted"}
+    # Only the third resize on acct-a exceeds its burst
+    assert len(sleeps) == 1
+    assert len(pools.resized) == 4
+
+
+def test_rejected_resizes_are_not_waited_for(capsys):
+    pools = FakeBatchPools(
+        {"ok": state(1), "stale": state(1), "broken": state(1)},
+        failing={
+            "stale": RuntimeError("(412) Precondition Failed"),
+            "broken": RuntimeError("Quota exceeded"),
+        },
+    )
+    scaling, patched = orchestrator(
+        {
+            ("rg", "acct", "ok"): 4,
+            ("rg", "acct", "stale"): 4,
+            ("rg", "acct", "broken"): 4,
+        },
+        pools,
+    )
+
+    with patched:
+        results = scaling.apply(dry_run=False)
+
+    assert pools.waited == ["ok"]
+    by_pool = {r["pool"]: r for r in results}
+    assert by_pool["acct/ok"]["status"] == "steady"
+    assert by_pool["acct/ok"]["dedicated"] == 4
+    assert by_pool["acct/stale"]["status"] == "failed"
+    assert "412" in by_pool["acct/stale"]["error"]
+    assert by_pool["acct/stale"]["steady_seconds"] is None
+    assert all("_accepted_at" not in r for r in results)
+
+    capsys.readouterr()
+    BatchScalingOrchestrator.print_report(results)
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[-1].startswith("2 failed, 1 steady; time to steady: slowest ")
+    assert any(line.endswith("Quota exceeded") for line in lines)
+
+
+def test_print_report_without_results(capsys):
+    BatchScalingOrchestrator.print_report([])
+
+    assert capsys.readouterr().out == "No pools resized\n"
@@ -0,0 +1,133 @@
+import gc
+from types import SimpleNamespace
+from unittest import mock
+
+from azure_tools import base
+from azure_tools.client_registry import ClientRegistry
+
+
+class FakeClient:
+    def __init__(self, name):
+        self.name = name
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class FakeRegistry(ClientRegistry):
+    def __init__(self, max_size=64):
+        super().__init__(max_size=max_size)
+        self.built = []
+
+    def _build_client(self, client_type, scope, credential):
+        client = FakeClient(f"{client_type}:{scope}")
+        self.built.append(client)
+        return client
+
+
+CREDENTIAL = object()
+
+
+def test_acquire_shares_one_client_per_key():
+    registry = FakeRegistry()
+    first = registry.acquire("adf", "sub-1", CREDENTIAL)
+    second = registry.acquire("adf", "sub-1", CREDENTIAL)
+    other = registry.acquire("adf", "sub-2", CREDENTIAL)
+
+    assert first is second
+    assert other is not first
+    assert len(registry.built) == 2
+
+
+def test_release_keeps_idle_client_for_reuse():
+    registry = FakeRegistry()
+    client = registry.acquire("adf", "sub-1", CREDENTIAL)
+    registry.release("adf", "sub-1", CREDENTIAL)
+
+    assert not client.closed
+    assert registry.acquire("adf", "sub-1", CREDENTIAL) is client
+
+
+def test_eviction_closes_least_recently_used_idle_clients():
+    registry = FakeRegistry(max_size=2)
+    clients = [registry.acquire("adf", f"sub-{i}", CREDENTIAL) for i in range(3)]
+    # Everything is referenced, so nothing can be evicted yet
+    assert len(registry) == 3
+    assert not any(c.closed for c in clients)
+
+    registry.release("adf", "sub-0", CREDENTIAL)
+
+    assert clients[0].closed
+    assert len(registry) == 2
+
+
+def test_clear_keeps_referenced_clients_open_until_released():
+    registry = FakeRegistry()
+    idle = registry.acquire("adf", "sub-idle", CREDENTIAL)
+    registry.release("adf", "sub-idle", CREDENTIAL)
+    busy = registry.acquire("adf", "sub-busy", CREDENTIAL)
+
+    registry.clear()
+
+    assert idle.closed
+    assert not busy.closed
+    registry.release("adf", "sub-busy", CREDENTIAL)
+    assert busy.closed
+    assert len(registry) == 0
+
+
+def test_acquire_after_clear_reuses_retired_client():
+    registry = FakeRegistry()
+    busy = registry.acquire("adf", "sub-1", CREDENTIAL)
+    registry.clear()
+
+    assert registry.acquire("adf", "sub-1", CREDENTIAL) is busy
+    registry.release("adf", "sub-1", CREDENTIAL)
+    registry.release("adf", "sub-1", CREDENTIAL)
+    # Reacquiring cancelled the retirement, so the client is kept idle
+    assert not busy.closed
+
+
+def test_unbalanced_release_is_ignored():
+    registry = FakeRegistry()
+    registry.release("adf", "sub-1", CREDENTIAL)
+    client = registry.acquire("adf", "sub-1", CREDENTIAL)
+    registry.release("adf", "sub-1", CREDENTIAL)
+    registry.release("adf", "sub-1", CREDENTIAL)
+
+    assert registry.acquire("adf", "sub-1", CREDENTIAL) is client
+
+
+def _helper():
+    return base.AzureResourceBase(
+        resource_group_name="rg",
+        resource_name="factory",
+        resource_type="adf",
+        subscription_id="sub-1",
+        auth=SimpleNamespace(credential=CREDENTIAL),
+    )
+
+
+def test_helper_close_releases_its_reference():
+    registry = FakeRegistry(max_size=0)
+    with mock.patch.object(base, "get_client_registry", return_value=registry):
+        with _helper() as helper:
+            client = helper.client
+            assert not client.closed
+        helper.close()
+
+    assert client.closed
+    assert len(registry) == 0
+
+
+def test_dropped_helper_releases_its_reference():
+    registry = FakeRegistry(max_size=0)
+    with mock.patch.object(base, "get_client_registry", return_value=registry):
+        helper = _helper()
+        client = helper.client
+        del helper
+        gc.collect()
+
+    assert client.closed
+    assert len(registry) == 0
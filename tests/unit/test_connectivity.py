@@ -0,0 +1,126 @@
+import time
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+import requests
+
+from azure_tools import base
+from azure_tools.adf.connectivity import ConnectivitySweep
+from azure_tools.adf.linked_services import ADFLinkedServices
+
+
+class FakeSession:
+    def __init__(self, status_code, headers=None, body=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.body = body or {}
+        self.timeouts = []
+
+    def request(self, method, url, headers=None, timeout=None, **kwargs):
+        self.timeouts.append(timeout)
+        response = requests.Response()
+        response.status_code = self.status_code
+        response.headers.update(self.headers)
+        response._content = b"{}"
+        response.json = lambda: self.body
+        return response
+
+
+def linked_services():
+    helper = ADFLinkedServices(
+        resource_group_name="rg",
+        resource_name="adf-1",
+        subscription_id="sub-1",
+        auth=SimpleNamespace(credential=None, get_token=lambda: "token"),
+    )
+    helper.get_linked_service_details = lambda name: {"name": name, "properties": {}}
+    return helper
+
+
+def test_connection_test_timeout_covers_throttling_retries():
+    session = FakeSession(429, {"Retry-After": "0.2"})
+    helper = linked_services()
+
+    started = time.monotonic()
+    with mock.patch.object(base, "get_http_session", return_value=session):
+        with pytest.raises(requests.HTTPError):
+            helper.test_linked_service_connection("ls", timeout=0.5, quiet=True)
+    elapsed = time.monotonic() - started
+
+    assert elapsed < 0.5
+    assert 1 < len(session.timeouts) <= 3
+    # Every attempt only gets the time left before the deadline
+    assert session.timeouts == sorted(session.timeouts, reverse=True)
+    assert session.timeouts[0] <= 0.5
+
+
+def test_connection_test_is_not_resent_after_a_server_error():
+    session = FakeSession(500)
+    helper = linked_services()
+
+    with mock.patch.object(base, "get_http_session", return_value=session):
+        with pytest.raises(requests.HTTPError):
+            helper.test_linked_service_connection("ls", timeout=30, quiet=True)
+
+    assert len(session.timeouts) == 1
+
+
+def test_connection_test_returns_the_service_result():
+    session = FakeSession(200, body={"succeeded": True})
+    helper = linked_services()
+
+    with mock.patch.object(base, "get_http_session", return_value=session):
+        assert helper.test_linked_service_connection("ls", quiet=True) == {
+            "succeeded": True
+        }
+
+    assert session.timeouts == [None]
+
+
+class FakeHelper:
+    def __init__(self, outcomes):
+        self.outcomes = outcomes
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def list_linked_services(self, filter_by_type=None):
+        return [
+            {"name": name, "properties": {"type": "Snowflake"}}
+            for name in self.outcomes
+        ]
+
+    def test_linked_service_connection(self, name, timeout=None, quiet=False):
+        outcome = self.outcomes[name]
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+def test_sweep_classifies_each_outcome():
+    helper = FakeHelper(
+        {
+            "ok": {"succeeded": True},
+            "bad-password": {"succeeded": False, "errors": [{"message": "denied"}]},
+            "slow": TimeoutError("Deadline passed"),
+            "broken": RuntimeError("boom"),
+        }
+    )
+    sweep = ConnectivitySweep(
+        [("sub-1", "rg", "adf-1")], auth=SimpleNamespace(credential=None)
+    )
+
+    with mock.patch.object(sweep, "_helper", return_value=helper):
+        results = sweep.run()
+
+    assert {r["linked_service"]: r["status"] for r in results} == {
+        "bad-password": "failed",
+        "broken": "error",
+        "ok": "succeeded",
+        "slow": "timeout",
+    }
+    assert [r["linked_service"] for r in results] == sorted(helper.outcomes)
@@ -0,0 +1,202 @@
+import asyncio
+import threading
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+
+from azure_tools import keyvault
+from azure_tools.aio import keyvault as aio_keyvault
+from azure_tools.secret_cache import SecretCache
+from azure_tools.throttling import TokenBucket
+
+VAULT = "https://kv-1.vault.azure.net"
+
+
+def secret(name):
+    return SimpleNamespace(
+        value=f"value-{name}",
+        properties=SimpleNamespace(version="v1", expires_on=None),
+    )
+
+
+def vault(cls, client, cache=None):
+    helper = cls(
+        resource_group_name="rg",
+        resource_name="kv-1",
+        subscription_id="sub-1",
+        auth=SimpleNamespace(credential=None),
+        cache=cache if cache is not None else SecretCache(),
+    )
+    helper.client = client
+    return helper
+
+
+def drained_bucket():
+    """Bucket with a burst of two that refills too slowly to matter in a test."""
+    return TokenBucket(capacity=2, refill_rate=0.001)
+
+
+def test_misses_are_fetched_concurrently_under_the_vault_bucket():
+    names = ["a", "b", "c", "d"]
+    # Every fetch waits for the others, so this only passes if they overlap
+    barrier = threading.Barrier(len(names), timeout=5)
+    calls = []
+    sleeps = []
+
+    def get_secret(name, version=None):
+        calls.append(name)
+        barrier.wait()
+        return secret(name)
+
+    cache = SecretCache()
+    cache.put(VAULT, "cached", "from-cache")
+    helper = vault(
+        keyvault.AzureKeyVault, SimpleNamespace(get_secret=get_secret), cache
+    )
+    bucket = drained_bucket()
+
+    with (
+        mock.patch.object(keyvault, "get_vault_bucket", return_value=bucket),
+        mock.patch.object(keyvault, "time", SimpleNamespace(sleep=sleeps.append)),
+    ):
+        values = helper.get_secrets(["cached", *names, "a"], max_workers=8)
+
+    assert values == {"cached": "from-cache", **{n: f"value-{n}" for n in names}}
+    assert sorted(calls) == names
+    # Two fetches fit in the burst; the others wait for the bucket to refill
+    assert len(sleeps) == 2
+    assert all(delay > 0 for delay in sleeps)
+
+
+def test_partial_failure_raises_and_keeps_the_fetched_secrets():
+    calls = []
+
+    def get_secret(name, version=None):
+        calls.append(name)
+        if name == "broken":
+            raise RuntimeError("Forbidden")
+        return secret(name)
+
+    helper = vault(keyvault.AzureKeyVault, SimpleNamespace(get_secret=get_secret))
+
+    with pytest.raises(RuntimeError, match="Forbidden"):
+        helper.get_secrets(["a", "broken", "b"])
+
+    calls.clear()
+    with pytest.raises(RuntimeError, match="Forbidden"):
+        helper.get_secrets(["a", "broken", "b"])
+    # Only the failed secret is fetched again
+    assert calls == ["broken"]
+
+
+def test_async_misses_are_paced_by_the_vault_bucket():
+    sleeps = []
+
+    async def get_secret(name, version=None):
+        if name == "broken":
+            raise RuntimeError("Forbidden")
+        return secret(name)
+
+    async def sleep(delay):
+        sleeps.append(delay)
+
+    helper = vault(aio_keyvault.AzureKeyVault, SimpleNamespace(get_secret=get_secret))
+    bucket = drained_bucket()
+
+    with (
+        mock.patch.object(aio_keyvault, "get_vault_bucket", return_value=bucket),
+        mock.patch.object(aio_keyvault.asyncio, "sleep", sleep),
+    ):
+        values = asyncio.run(helper.get_secrets(["a", "b", "c"], max_workers=2))
+        with pytest.raises(RuntimeError, match="Forbidden"):
+            asyncio.run(helper.get_secrets(["a", "broken"]))
+
+    assert values == {name: f"value-{name}" for name in "abc"}
+    assert len(sleeps) == 2
+
+
+def properties(name, tags=None):
+    return SimpleNamespace(
+        name=name,
+        created_on=None,
+        updated_on=None,
+        enabled=True,
+        content_type=None,
+        tags=tags,
+    )
+
+
+PAGES = [
+    [
+        properties("app-db", {"env": "prod", "team": "data"}),
+        properties("other-db", {"env": "prod"}),
+    ],
+    [
+        properties("app-cache", {"env": "dev"}),
+        properties("app-api", None),
+    ],
+    [properties("app-queue", {"env": "prod"})],
+]
+
+
+class FakeListing:
+    def __init__(self, pages):
+        self.pages = pages
+        self.pages_read = 0
+
+    def by_page(self):
+        for page in self.pages:
+            self.pages_read += 1
+            yield iter(page)
+
+
+def test_prefix_and_tags_are_applied_across_pages():
+    listing = FakeListing(PAGES)
+    helper = vault(
+        keyvault.AzureKeyVault,
+        SimpleNamespace(list_properties_of_secrets=lambda: listing),
+    )
+
+    secrets = helper.iter_secret_properties(prefix="app-", tags={"env": "prod"})
+
+    assert next(secrets)["name"] == "app-db"
+    # Pages are read lazily, one at a time
+    assert listing.pages_read == 1
+    assert [s["name"] for s in secrets] == ["app-queue"]
+    assert listing.pages_read == 3
+    assert [s["name"] for s in helper.iter_secret_properties(prefix="app-")] == [
+        "app-db",
+        "app-cache",
+        "app-api",
+        "app-queue",
+    ]
+
+
+def test_async_prefix_and_tags_are_applied_across_pages():
+    class AsyncListing:
+        def by_page(self):
+            async def pages():
+                for page in PAGES:
+                    yield items(page)
+
+            return pages()
+
+    async def items(page):
+        for item in page:
+            yield item
+
+    helper = vault(
+        aio_keyvault.AzureKeyVault,
+        SimpleNamespace(list_properties_of_secrets=AsyncListing),
+    )
+
+    async def collect():
+        return [
+            s["name"]
+            async for s in helper.iter_secret_properties(
+                prefix="app-", tags={"env": "prod"}
+            )
+        ]
+
+    assert asyncio.run(collect()) == ["app-db", "app-queue"]
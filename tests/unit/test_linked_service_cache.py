@@ -0,0 +1,201 @@
+import asyncio
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+import requests
+
+from azure_tools import base
+from azure_tools.adf.linked_service_cache import LinkedServiceCache
+from azure_tools.adf.linked_services import ADFLinkedServices
+from azure_tools.aio.adf.linked_services import (
+    ADFLinkedServices as AsyncADFLinkedServices,
+)
+
+
+def definition(account="old-acct", etag="etag-1"):
+    return {
+        "name": "ls-sf",
+        "etag": etag,
+        "properties": {
+            "type": "SnowflakeV2",
+            "typeProperties": {"accountIdentifier": account},
+        },
+    }
+
+
+def age(cache, seconds):
+    """Make every cached definition older, leaving the process clock alone."""
+    for entries in cache._factories.values():
+        for entry in entries.values():
+            entry.fetched_at -= seconds
+
+
+class FakeSession:
+    """Serves one linked service and answers 304 when If-None-Match matches."""
+
+    def __init__(self, current, on_request=None):
+        self.current = current
+        self.on_request = on_request
+        self.requests = []
+
+    def request(self, method, url, headers=None, **kwargs):
+        self.requests.append(headers.get("If-None-Match"))
+        if self.on_request is not None:
+            self.on_request()
+        response = requests.Response()
+        if headers.get("If-None-Match") == self.current["etag"]:
+            response.status_code = 304
+            response._content = b""
+        else:
+            response.status_code = 200
+            response._content = b"{}"
+            response.json = lambda: self.current
+        return response
+
+
+class FakeLinkedServicesClient:
+    def __init__(self, fail=None):
+        self.fail = fail
+        self.updates = []
+
+    def create_or_update(self, **kwargs):
+        self.updates.append(kwargs)
+        if self.fail is not None:
+            raise self.fail
+        return SimpleNamespace(as_dict=lambda: kwargs["linked_service"])
+
+
+def helper(cls=ADFLinkedServices, cache=None, client=None):
+    linked_services = cls(
+        resource_group_name="rg",
+        resource_name="adf-1",
+        subscription_id="sub-1",
+        auth=SimpleNamespace(credential=None, get_token=lambda: "token"),
+        cache=cache if cache is not None else LinkedServiceCache(ttl=300),
+    )
+    linked_services.client = SimpleNamespace(
+        linked_services=client or FakeLinkedServicesClient()
+    )
+    return linked_services
+
+
+def test_fresh_entry_is_served_without_a_call():
+    session = FakeSession(definition())
+    adf = helper()
+
+    with mock.patch.object(base, "get_http_session", return_value=session):
+        adf.get_linked_service_details("ls-sf")
+        age(adf.cache, 299)
+        assert adf.get_linked_service_details("ls-sf") == definition()
+
+    assert session.requests == [None]
+
+
+def test_stale_entry_is_revalidated_with_its_etag():
+    session = FakeSession(definition())
+    adf = helper()
+
+    with mock.patch.object(base, "get_http_session", return_value=session):
+        adf.get_linked_service_details("ls-sf")
+        age(adf.cache, 301)
+        assert adf.get_linked_service_details("ls-sf") == definition()
+        # The 304 restarted the TTL
+        age(adf.cache, 299)
+        adf.get_linked_service_details("ls-sf")
+
+    assert session.requests == [None, "etag-1"]
+
+
+def test_changed_service_replaces_the_stale_entry():
+    session = FakeSession(definition())
+    adf = helper()
+
+    with mock.patch.object(base, "get_http_session", return_value=session):
+        adf.get_linked_service_details("ls-sf")
+        session.current = definition("new-acct", etag="etag-2")
+        age(adf.cache, 301)
+        refreshed = adf.get_linked_service_details("ls-sf")
+
+    assert refreshed["properties"]["typeProperties"]["accountIdentifier"] == "new-acct"
+    assert adf.cache.get(adf.factory_key, "ls-sf").etag == "etag-2"
+
+
+def test_304_after_eviction_falls_back_to_a_full_get():
+    adf = helper()
+    session = FakeSession(
+        definition(),
+        # The entry is evicted while the conditional GET is in flight
+        on_request=lambda: adf.cache.invalidate(adf.factory_key),
+    )
+
+    with mock.patch.object(base, "get_http_session", return_value=session):
+        adf.cache.put(adf.factory_key, definition())
+        age(adf.cache, 301)
+        assert adf.get_linked_service_details("ls-sf") == definition()
+
+    assert session.requests == ["etag-1", None]
+
+
+def test_definitions_are_copied_in_and_out():
+    cache = LinkedServiceCache()
+    stored = definition()
+    returned = cache.put(("sub-1", "rg", "adf-1"), stored)
+
+    stored["properties"]["typeProperties"]["accountIdentifier"] = "changed"
+    returned["properties"]["typeProperties"]["accountIdentifier"] = "changed"
+    touched = cache.touch(("sub-1", "rg", "adf-1"), "ls-sf")
+    touched["properties"]["type"] = "changed"
+
+    entry = cache.get(("sub-1", "rg", "adf-1"), "ls-sf")
+    assert entry.definition == definition()
+
+
+def test_put_invalidates_the_entry_even_when_it_fails():
+    client = FakeLinkedServicesClient(fail=RuntimeError("412 Precondition Failed"))
+    adf = helper(client=client)
+    adf.cache.put(adf.factory_key, definition())
+
+    with pytest.raises(RuntimeError):
+        adf.put_linked_service("ls-sf", definition("new-acct"), if_match="etag-1")
+
+    assert client.updates[0]["if_match"] == "etag-1"
+    assert adf.cache.get(adf.factory_key, "ls-sf") is None
+
+
+def test_account_update_is_conditional_on_the_cached_etag():
+    client = FakeLinkedServicesClient()
+    adf = helper(client=client)
+    adf.cache.put(adf.factory_key, definition())
+
+    adf.update_linked_service_sf_account("ls-sf", "old-acct", "new-acct", dry_run=False)
+
+    update = client.updates[0]
+    assert update["if_match"] == "etag-1"
+    assert update["linked_service"]["properties"]["typeProperties"] == {
+        "accountIdentifier": "new-acct"
+    }
+    assert adf.cache.get(adf.factory_key, "ls-sf") is None
+
+
+def test_async_account_update_is_conditional_and_invalidates_on_failure():
+    client = FakeLinkedServicesClient(fail=RuntimeError("412 Precondition Failed"))
+
+    async def create_or_update(**kwargs):
+        return client.create_or_update(**kwargs)
+
+    adf = helper(
+        AsyncADFLinkedServices,
+        client=SimpleNamespace(create_or_update=create_or_update),
+    )
+    adf.cache.put(adf.factory_key, definition())
+
+    with pytest.raises(RuntimeError, match="412"):
+        asyncio.run(
+            adf.update_linked_service_sf_account(
+                "ls-sf", "old-acct", "new-acct", dry_run=False
+            )
+        )
+
+    assert client.updates[0]["if_match"] == "etag-1"
+    assert adf.cache.get(adf.factory_key, "ls-sf") is None
@@ -0,0 +1,124 @@
+from azure_tools.lock_inventory import (
+    LOCKS_QUERY,
+    LockIndex,
+    LockInventory,
+)
+
+
+def subscription(i):
+    return f"00000000-0000-0000-0000-{i:012d}"
+
+
+def lock_row(sub, name, group=None, resource=None, level="CanNotDelete"):
+    scope = f"/subscriptions/{sub}"
+    if group is not None:
+        scope += f"/resourceGroups/{group}"
+    if resource is not None:
+        scope += f"/providers/Microsoft.Storage/storageAccounts/{resource}"
+    return {
+        "id": f"{scope}/providers/Microsoft.Authorization/locks/{name}",
+        "name": name,
+        "subscriptionId": sub,
+        "resourceGroup": group or "",
+        "level": level,
+        "notes": "",
+    }
+
+
+class FakeGraphBackend:
+    """Serves fixed rows paged like Resource Graph and records every query."""
+
+    def __init__(self, rows):
+        self.rows = list(rows)
+        self.queries = []
+
+    def query(self, query, subscriptions=None, skip_token=None, page_size=1000):
+        self.queries.append(
+            {
+                "query": query,
+                "subscriptions": subscriptions,
+                "skip_token": skip_token,
+                "page_size": page_size,
+            }
+        )
+        rows = self.rows
+        if subscriptions is not None:
+            rows = [r for r in rows if r["subscriptionId"] in set(subscriptions)]
+        start = int(skip_token or 0)
+        page = {"data": rows[start : start + page_size]}
+        if start + page_size < len(rows):
+            page["$skipToken"] = str(start + page_size)
+        return page
+
+
+def test_pages_are_followed_by_skip_token():
+    rows = [
+        lock_row(subscription(1), f"lock-{i:02d}", group=f"rg-{i}") for i in range(7)
+    ]
+    backend = FakeGraphBackend(rows)
+
+    locks = list(LockInventory(backend=backend, page_size=3).iter_locks())
+
+    assert [lock["name"] for lock in locks] == [row["name"] for row in rows]
+    assert [q["skip_token"] for q in backend.queries] == [None, "3", "6"]
+    assert all(q["query"] == LOCKS_QUERY for q in backend.queries)
+    assert all(q["subscriptions"] is None for q in backend.queries)
+
+
+def test_subscriptions_are_queried_in_batches_of_1000():
+    subscriptions = [subscription(i) for i in range(2500)]
+    backend = FakeGraphBackend(
+        [lock_row(subscriptions[0], "first"), lock_row(subscriptions[-1], "last")]
+    )
+
+    inventory = LockInventory(subscriptions, backend=backend, page_size=5000)
+    names = [lock["name"] for lock in inventory.iter_locks()]
+
+    assert names == ["first", "last"]
+    assert [len(q["subscriptions"]) for q in backend.queries] == [1000, 1000, 500]
+    assert backend.queries[1]["subscriptions"][0] == subscriptions[1000]
+    assert all(q["page_size"] == 1000 for q in backend.queries)
+
+
+def test_calls_do_not_depend_on_the_number_of_resource_groups():
+    sub = subscription(1)
+    few = FakeGraphBackend([lock_row(sub, "lock", group=f"rg-{i}") for i in range(2)])
+    many = FakeGraphBackend(
+        [lock_row(sub, "lock", group=f"rg-{i}") for i in range(900)]
+    )
+
+    LockInventory([sub], backend=few).build()
+    index = LockInventory([sub], backend=many).build()
+
+    assert len(few.queries) == len(many.queries) == 1
+    assert len(index.resource_groups()) == 900
+
+
+def test_index_looks_up_locks_by_scope_and_level():
+    sub = subscription(1)
+    index = LockIndex.build(
+        LockInventory(
+            backend=FakeGraphBackend(
+                [
+                    lock_row(sub, "sub-lock", level="ReadOnly"),
+                    lock_row(sub, "rg-lock", group="rg-data"),
+                    lock_row(sub, "rg-read", group="rg-data", level="ReadOnly"),
+                    lock_row(sub, "sa-lock", group="rg-data", resource="sadata"),
+                ]
+            )
+        ).iter_locks()
+    )
+
+    group_scope = f"/subscriptions/{sub}/resourceGroups/rg-data"
+    assert [r["name"] for r in index.locks_at(group_scope.upper() + "/")] == [
+        "rg-lock",
+        "rg-read",
+    ]
+    assert index.locks_at(f"{group_scope}/providers/Other/x/y") == []
+    assert index.scopes("ReadOnly") == [f"/subscriptions/{sub}", group_scope]
+    assert index.resource_groups("CanNotDelete") == [(sub, "rg-data")]
+    assert index.counts() == {
+        "subscription": {"ReadOnly": 1},
+        "resourceGroup": {"CanNotDelete": 1, "ReadOnly": 1},
+        "resource": {"CanNotDelete": 1},
+    }
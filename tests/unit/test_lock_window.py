@@ -0,0 +1,182 @@
+import asyncio
+import json
+import os
+import socket
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+
+from azure_tools.aio.lock_window import UnlockedWindow as AsyncUnlockedWindow
+from azure_tools.aio.locks import AzureResourceLock as AsyncAzureResourceLock
+from azure_tools.lock_window import LockJournal, UnlockedWindow, lock_record
+from azure_tools.locks import AzureResourceLock
+
+GROUP = "/subscriptions/sub-1/resourceGroups/rg"
+ACCOUNT = f"{GROUP}/providers/Microsoft.Storage/storageAccounts/sa"
+LOCKS = "/providers/Microsoft.Authorization/locks/"
+
+
+def lock(scope, name, level="CanNotDelete"):
+    return SimpleNamespace(
+        id=f"{scope}{LOCKS}{name}", name=name, level=level, notes=None, owners=None
+    )
+
+
+class FakeManagementLocks:
+    def __init__(self, locks, fail_create=()):
+        self.locks = {(item.id.rsplit(LOCKS, 1)[0], item.name): item for item in locks}
+        self.fail_create = set(fail_create)
+
+    def list_at_resource_group_level(self, resource_group_name):
+        return list(self.locks.values())
+
+    def delete_by_scope(self, scope, lock_name):
+        del self.locks[(scope, lock_name)]
+
+    def create_or_update_by_scope(self, scope, lock_name, parameters):
+        if lock_name in self.fail_create:
+            raise RuntimeError("AuthorizationFailed")
+        self.locks[(scope, lock_name)] = lock(scope, lock_name, parameters["level"])
+
+
+class AsyncFakeManagementLocks:
+    def __init__(self, fake):
+        self.fake = fake
+
+    def list_at_resource_group_level(self, resource_group_name):
+        async def pages():
+            for item in self.fake.list_at_resource_group_level(resource_group_name):
+                yield item
+
+        return pages()
+
+    async def delete_by_scope(self, scope, lock_name):
+        self.fake.delete_by_scope(scope, lock_name)
+
+    async def create_or_update_by_scope(self, **kwargs):
+        self.fake.create_or_update_by_scope(**kwargs)
+
+
+def window(cls, helper_cls, management_locks, journal):
+    unlocked = cls(
+        [("sub-1", "rg")], auth=SimpleNamespace(credential=None), journal=journal
+    )
+    helper = helper_cls(
+        resource_group_name="rg",
+        subscription_id="sub-1",
+        auth=SimpleNamespace(credential=None),
+    )
+    helper.client = SimpleNamespace(management_locks=management_locks)
+    patched = mock.patch.object(unlocked, "_helper", return_value=helper)
+    return unlocked, patched
+
+
+@pytest.fixture
+def journal(tmp_path):
+    return LockJournal(str(tmp_path / "journal.json"))
+
+
+def test_lock_record_keeps_the_scope_of_resource_locks():
+    record = lock_record("sub-1", "rg", lock(ACCOUNT, "no-delete"))
+
+    assert record["scope"] == ACCOUNT
+    assert record["id"] == f"{ACCOUNT}{LOCKS}no-delete"
+
+
+def test_window_recreates_each_lock_at_its_own_scope(journal):
+    fake = FakeManagementLocks([lock(GROUP, "rg-lock"), lock(ACCOUNT, "sa-lock")])
+    before = set(fake.locks)
+    unlocked, patched = window(UnlockedWindow, AzureResourceLock, fake, journal)
+
+    with patched:
+        with unlocked:
+            assert fake.locks == {}
+            assert {r["state"] for r in journal.entries()} == {"released"}
+
+    assert set(fake.locks) == before
+    assert journal.entries() == []
+
+
+def test_recover_restores_locks_left_by_a_dead_process(journal):
+    orphaned = lock_record("sub-1", "rg", lock(ACCOUNT, "sa-lock"))
+    orphaned.update(state="released", window="old", pid=1, host="other-host")
+    # Entries written before scopes were journaled are resource group locks
+    legacy = {
+        "subscription_id": "sub-1",
+        "resource_group_name": "rg",
+        "name": "rg-lock",
+        "level": "ReadOnly",
+        "notes": None,
+        "owners": [],
+        "state": "released",
+        "host": "other-host",
+        "pid": 1,
+    }
+    with open(journal.path, "w", encoding="utf-8") as f:
+        json.dump({"locks": {"x": orphaned, "sub-1/rg/rg-lock": legacy}}, f)
+    fake = FakeManagementLocks([])
+    unlocked, patched = window(UnlockedWindow, AzureResourceLock, fake, journal)
+
+    with patched:
+        results = unlocked.recover()
+
+    assert {r["status"] for r in results} == {"restored"}
+    assert set(fake.locks) == {(ACCOUNT, "sa-lock"), (GROUP, "rg-lock")}
+    assert fake.locks[(GROUP, "rg-lock")].level == "ReadOnly"
+    assert journal.entries() == []
+
+
+def test_recover_leaves_live_windows_alone(journal):
+    live = lock_record("sub-1", "rg", lock(GROUP, "rg-lock"))
+    live.update(window="live", pid=os.getpid(), host=socket.gethostname())
+    journal.add([live])
+    unlocked, patched = window(
+        UnlockedWindow, AzureResourceLock, FakeManagementLocks([]), journal
+    )
+
+    with patched:
+        assert unlocked.recover() == []
+
+    assert journal.entries() == [live]
+
+
+def test_lock_that_cannot_be_recreated_stays_in_the_journal(journal):
+    fake = FakeManagementLocks(
+        [lock(GROUP, "rg-lock"), lock(GROUP, "stuck")], fail_create={"stuck"}
+    )
+    unlocked, patched = window(UnlockedWindow, AzureResourceLock, fake, journal)
+
+    with patched:
+        with pytest.raises(RuntimeError, match="1 locks"):
+            with unlocked:
+                pass
+
+    assert [r["name"] for r in journal.entries()] == ["stuck"]
+
+
+def test_async_window_recreates_each_lock_at_its_own_scope(journal):
+    fake = FakeManagementLocks([lock(GROUP, "rg-lock"), lock(ACCOUNT, "sa-lock")])
+    before = set(fake.locks)
+    unlocked, patched = window(
+        AsyncUnlockedWindow,
+        AsyncAzureResourceLock,
+        AsyncFakeManagementLocks(fake),
+        journal,
+    )
+
+    async def scenario():
+        async with unlocked:
+            assert fake.locks == {}
+            assert len(journal.entries()) == 2
+
+    with (
+        patched,
+        mock.patch.object(asyncio, "to_thread", wraps=asyncio.to_thread) as to_thread,
+    ):
+        asyncio.run(scenario())
+
+    assert set(fake.locks) == before
+    assert journal.entries() == []
+    journal_calls = {call.args[0].__name__ for call in to_thread.call_args_list}
+    assert {"add", "mark", "remove", "entries"} <= journal_calls
@@ -0,0 +1,109 @@
+import asyncio
+from types import SimpleNamespace
+
+from azure_tools.aio.locks import AzureResourceLock as AsyncAzureResourceLock
+from azure_tools.locks import AzureResourceLock
+
+
+class FakeManagementLocks:
+    def __init__(self, names):
+        self.locks = {
+            name: SimpleNamespace(name=name, level="CanNotDelete", notes=None)
+            for name in names
+        }
+        self.created = []
+
+    def list_at_resource_group_level(self, resource_group_name):
+        return list(self.locks.values())
+
+    def delete_at_resource_group_level(self, resource_group_name, lock_name):
+        del self.locks[lock_name]
+
+    def create_or_update_at_resource_group_level(
+        self, resource_group_name, lock_name, parameters
+    ):
+        self.created.append(lock_name)
+        lock = SimpleNamespace(name=lock_name, **parameters)
+        self.locks[lock_name] = lock
+        return lock
+
+
+class AsyncFakeManagementLocks:
+    def __init__(self, fake):
+        self.fake = fake
+
+    def list_at_resource_group_level(self, resource_group_name):
+        async def pages():
+            for lock in self.fake.list_at_resource_group_level(resource_group_name):
+                yield lock
+
+        return pages()
+
+    async def delete_at_resource_group_level(self, resource_group_name, lock_name):
+        self.fake.delete_at_resource_group_level(resource_group_name, lock_name)
+
+    async def create_or_update_at_resource_group_level(self, **kwargs):
+        return self.fake.create_or_update_at_resource_group_level(**kwargs)
+
+
+def helper(cls, management_locks):
+    locks = cls(
+        resource_group_name="rg",
+        subscription_id="sub-1",
+        auth=SimpleNamespace(credential=None),
+    )
+    locks.client = SimpleNamespace(management_locks=management_locks)
+    return locks
+
+
+def test_create_lock_skips_a_lock_that_exists():
+    fake = FakeManagementLocks(["keep"])
+    locks = helper(AzureResourceLock, fake)
+
+    locks.create_lock("keep")
+
+    assert fake.created == []
+
+
+def test_create_lock_recreates_a_released_lock_once():
+    fake = FakeManagementLocks(["keep"])
+    locks = helper(AzureResourceLock, fake)
+    locks.release_locks()
+
+    locks.create_lock("keep", level="ReadOnly")
+    assert fake.created == ["keep"]
+    assert [lock.name for lock in locks.lock_objs] == ["keep"]
+
+    locks.recreate_locks()
+    assert fake.locks["keep"].level == "ReadOnly"
+
+
+def test_async_create_lock_recreates_a_released_lock():
+    fake = FakeManagementLocks(["keep"])
+    locks = helper(AsyncAzureResourceLock, AsyncFakeManagementLocks(fake))
+
+    async def scenario():
+        await locks.load_locks()
+        await locks.release_locks()
+        await locks.create_lock("keep")
+
+    asyncio.run(scenario())
+
+    assert fake.created == ["keep"]
+    assert [lock.name for lock in locks.lock_objs] == ["keep"]
+
+
+def test_release_and_recreate_handle_many_locks_and_none():
+    names = [f"lock-{i}" for i in range(40)]
+    fake = FakeManagementLocks(names)
+    locks = helper(AzureResourceLock, fake)
+
+    locks.release_locks()
+    assert fake.locks == {}
+    locks.recreate_locks()
+    assert sorted(fake.created) == sorted(names)
+
+    empty = helper(AzureResourceLock, FakeManagementLocks([]))
+    empty.release_locks()
+    empty.recreate_locks()
+    assert empty.deleted is False
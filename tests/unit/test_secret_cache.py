@@ -0,0 +1,161 @@
+import asyncio
+import threading
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from azure_tools import secret_cache
+from azure_tools.aio.keyvault import AzureKeyVault as AsyncAzureKeyVault
+from azure_tools.keyvault import AzureKeyVault
+from azure_tools.secret_cache import SecretCache
+
+VAULT = "https://kv-1.vault.azure.net"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(secret_cache.time, "monotonic", clock.monotonic)
+    return clock
+
+
+def secret(name, value, version="v1", expires_on=None):
+    return SimpleNamespace(
+        value=value,
+        properties=SimpleNamespace(version=version, expires_on=expires_on),
+    )
+
+
+def test_latest_version_is_served_for_its_ttl(clock):
+    cache = SecretCache(ttl=60, ttl_overrides={"short": 5})
+    cache.put(VAULT, "db-password", "s3cret", version="v1")
+    cache.put(VAULT, "short", "value", version="v1")
+
+    clock.now += 30
+    assert cache.get(VAULT.upper() + "/", "DB-PASSWORD") == "s3cret"
+    assert cache.get(VAULT, "short") is None
+    clock.now += 31
+    assert cache.get(VAULT, "db-password") is None
+
+
+def test_entry_never_outlives_the_secret(clock):
+    cache = SecretCache(ttl=3600)
+    expires_on = datetime.now(timezone.utc) + timedelta(seconds=10)
+    cache.put(VAULT, "name", "value", expires_on=expires_on)
+
+    clock.now += 11
+    assert cache.get(VAULT, "name") is None
+
+
+def test_pinned_versions_do_not_expire(clock):
+    cache = SecretCache(ttl=1)
+    cache.put(VAULT, "name", "old", version="v1", pinned=True)
+
+    clock.now += 3600
+    assert cache.get(VAULT, "name", "v1") == "old"
+    assert cache.get(VAULT, "name") is None
+
+
+def test_least_recently_used_entries_are_evicted_and_wiped():
+    cache = SecretCache(max_entries=2)
+    cache.put(VAULT, "a", "1")
+    cache.put(VAULT, "b", "2")
+    evicted = cache._entries[cache.key(VAULT, "a")]
+    cache.get(VAULT, "a")
+    cache.put(VAULT, "c", "3")
+
+    assert cache.get(VAULT, "b") is None
+    assert cache.get(VAULT, "a") == "1"
+    assert cache.get(VAULT, "c") == "3"
+    assert evicted.value() == "1"
+    dropped = cache._entries[cache.key(VAULT, "c")]
+    cache.clear()
+    assert dropped.value() == ""
+
+
+def test_invalidate_keeps_pinned_versions():
+    cache = SecretCache()
+    cache.put(VAULT, "name", "latest")
+    cache.put(VAULT, "name", "pinned", version="v1", pinned=True)
+    cache.put("https://other.vault.azure.net", "name", "elsewhere")
+
+    cache.invalidate(VAULT, "name")
+    assert cache.get(VAULT, "name") is None
+    assert cache.get(VAULT, "name", "v1") == "pinned"
+
+    cache.invalidate(VAULT)
+    assert cache.get(VAULT, "name", "v1") is None
+    assert cache.get("https://other.vault.azure.net", "name") == "elsewhere"
+
+
+def vault(cls, get_secret, cache):
+    helper = cls(
+        resource_group_name="rg",
+        resource_name="kv-1",
+        subscription_id="sub-1",
+        auth=SimpleNamespace(credential=None),
+        cache=cache,
+    )
+    helper.client = SimpleNamespace(get_secret=get_secret)
+    return helper
+
+
+def test_concurrent_misses_share_one_vault_call():
+    calls = []
+    started = threading.Event()
+    release = threading.Event()
+
+    def get_secret(name, version=None):
+        calls.append(name)
+        started.set()
+        release.wait(5)
+        return secret(name, "value")
+
+    cache = SecretCache()
+    helper = vault(AzureKeyVault, get_secret, cache)
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(helper.get_secret("name")))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    started.wait(5)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert results == ["value"] * 4
+    assert calls == ["name"]
+    assert cache._fetch_locks._locks == {}
+
+
+def test_async_misses_share_one_call_across_event_loops():
+    calls = []
+
+    async def get_secret(name, version=None):
+        calls.append(name)
+        await asyncio.sleep(0.01)
+        return secret(name, f"value-{len(calls)}")
+
+    cache = SecretCache()
+    helper = vault(AsyncAzureKeyVault, get_secret, cache)
+
+    async def fetch_concurrently():
+        return await asyncio.gather(*(helper.get_secret("name") for _ in range(4)))
+
+    assert asyncio.run(fetch_concurrently()) == ["value-1"] * 4
+    cache.invalidate(VAULT, "name")
+    # A second event loop must not reuse locks bound to the first one
+    assert asyncio.run(fetch_concurrently()) == ["value-2"] * 4
+    assert calls == ["name", "name"]
+    assert cache._async_fetch_locks._locks == {}
@@ -0,0 +1,125 @@
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest import mock
+
+from azure_tools.secret_hygiene import REPORT_COLUMNS, SecretHygieneScan
+
+NOW = datetime.now(timezone.utc)
+
+
+def properties(name, expires_on=None, updated_on=NOW):
+    return SimpleNamespace(
+        name=name, enabled=True, expires_on=expires_on, updated_on=updated_on
+    )
+
+
+def version(created_on, enabled=True):
+    return SimpleNamespace(created_on=created_on, enabled=enabled)
+
+
+class FakeSecretClient:
+    def __init__(self, secrets, versions=None, fail=False):
+        self.secrets = secrets
+        self.versions = versions or {}
+        self.fail = fail
+
+    def list_properties_of_secrets(self):
+        if self.fail:
+            raise RuntimeError("Forbidden")
+        return self.secrets
+
+    def list_properties_of_secret_versions(self, name):
+        versions = self.versions.get(name)
+        if isinstance(versions, Exception):
+            raise versions
+        return versions or [version(NOW - timedelta(days=1)), version(NOW)]
+
+
+def scan(clients, **kwargs):
+    hygiene = SecretHygieneScan(
+        list(clients), auth=SimpleNamespace(credential=None), **kwargs
+    )
+    helpers = {
+        name: SimpleNamespace(
+            vault_url=f"https://{name}.vault.azure.net", secret_client=client
+        )
+        for name, client in clients.items()
+    }
+    patched = mock.patch.object(
+        hygiene, "_helper", side_effect=lambda vault: helpers[vault[2]]
+    )
+    return hygiene, patched
+
+
+def rows(report):
+    return [dict(zip(REPORT_COLUMNS, row)) for row in zip(*report.values())]
+
+
+def test_expiry_is_classified_from_the_exact_time():
+    client = FakeSecretClient(
+        [
+            properties("expired-12h", expires_on=NOW - timedelta(hours=12)),
+            properties("expires-12h", expires_on=NOW + timedelta(hours=12)),
+            properties("expires-90d", expires_on=NOW + timedelta(days=90, hours=1)),
+        ]
+    )
+    hygiene, patched = scan({"kv-1": client})
+
+    with patched:
+        report = {r["secret"]: r for r in rows(hygiene.run())}
+
+    assert report["expired-12h"]["flags"] == "expired"
+    assert report["expired-12h"]["days_to_expiry"] == 0
+    assert report["expires-12h"]["flags"] == "expiring"
+    assert report["expires-90d"]["flags"] == ""
+    assert report["expires-90d"]["days_to_expiry"] == 90
+
+
+def test_failed_vaults_and_secrets_are_reported(capsys):
+    clients = {
+        "kv-1": FakeSecretClient(
+            [properties("ok"), properties("broken")],
+            versions={"broken": RuntimeError("Throttled")},
+        ),
+        "kv-2": FakeSecretClient([], fail=True),
+    }
+    hygiene, patched = scan(clients)
+
+    with patched:
+        report = hygiene.run()
+
+    by_name = {(r["vault"], r["secret"]): r for r in rows(report)}
+    assert by_name[("kv-2", None)]["flags"] == "scan_failed"
+    assert by_name[("kv-2", None)]["error"] == "Forbidden"
+    assert by_name[("kv-1", "broken")]["flags"] == "versions_failed"
+    assert by_name[("kv-1", "broken")]["error"] == "Throttled"
+    assert by_name[("kv-1", "ok")]["error"] is None
+
+    SecretHygieneScan.print_report(report)
+    totals = capsys.readouterr().out.splitlines()[-1]
+    assert totals == "2 secrets; 1 scan_failed, 1 versions_failed"
+
+
+def test_rerun_only_lists_versions_of_changed_secrets(tmp_path):
+    client = FakeSecretClient([properties("a"), properties("b")])
+    cache_path = str(tmp_path / "hygiene.json")
+    hygiene, patched = scan({"kv-1": client}, cache_path=cache_path)
+    with patched:
+        hygiene.run()
+
+    client.secrets = [
+        properties("a"),
+        properties("b", updated_on=NOW + timedelta(minutes=1)),
+    ]
+    rerun, patched = scan({"kv-1": client}, cache_path=cache_path)
+    with (
+        patched,
+        mock.patch.object(
+            client,
+            "list_properties_of_secret_versions",
+            wraps=client.list_properties_of_secret_versions,
+        ) as list_versions,
+    ):
+        rerun.run()
+
+    assert [call.args[0] for call in list_versions.call_args_list] == ["b"]
@@ -0,0 +1,187 @@
+import json
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+
+from azure_tools.adf.snowflake_migration import (
+    SnowflakeAccountMigration,
+    rewrite_snowflake_account,
+)
+
+FQDN_MAP = {"old-acct": "new-acct"}
+
+
+def v1_service(account):
+    return {
+        "name": f"ls-v1-{account}",
+        "etag": f"etag-v1-{account}",
+        "properties": {
+            "type": "Snowflake",
+            "typeProperties": {
+                "connectionString": f"jdbc:snowflake://{account}.snowflakecomputing.com/?db=X"
+            },
+        },
+    }
+
+
+def v2_service(account):
+    return {
+        "name": f"ls-v2-{account}",
+        "etag": f"etag-v2-{account}",
+        "properties": {
+            "type": "SnowflakeV2",
+            "typeProperties": {"accountIdentifier": account},
+        },
+    }
+
+
+class FakeLinkedServices:
+    def __init__(self, services, fail=False):
+        self.services = {s["name"]: s for s in services}
+        self.fail = fail
+        self.puts = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def list_linked_services(self, filter_by_type=None):
+        if self.fail:
+            raise RuntimeError("AuthorizationFailed")
+        return [{"name": name} for name in self.services]
+
+    def get_linked_service_details(self, name):
+        return self.services[name]
+
+    def put_linked_service(self, name, definition, if_match=None):
+        self.puts.append((name, definition, if_match))
+
+
+def migration(factories, **kwargs):
+    migration = SnowflakeAccountMigration(
+        [("sub-1", "rg", name) for name in factories],
+        FQDN_MAP,
+        auth=SimpleNamespace(credential=None),
+        **kwargs,
+    )
+    patched = mock.patch.object(
+        migration, "_helper", side_effect=lambda factory: factories[factory[2]]
+    )
+    return migration, patched
+
+
+def test_rewrite_snowflake_account_matches_v1_host_and_v2_identifier():
+    assert rewrite_snowflake_account(v1_service("old-acct"), FQDN_MAP) == (
+        "connectionString",
+        "jdbc:snowflake://old-acct.snowflakecomputing.com/?db=X",
+        "jdbc:snowflake://new-acct.snowflakecomputing.com/?db=X",
+    )
+    assert rewrite_snowflake_account(v2_service("OLD-ACCT"), FQDN_MAP) == (
+        "accountIdentifier",
+        "OLD-ACCT",
+        "new-acct",
+    )
+    assert rewrite_snowflake_account(v1_service("other"), FQDN_MAP) is None
+    assert rewrite_snowflake_account(v1_service("old-acct-2"), FQDN_MAP) is None
+
+
+def test_plan_lists_only_services_on_old_accounts():
+    adf = FakeLinkedServices(
+        [v1_service("old-acct"), v2_service("old-acct"), v2_service("other")]
+    )
+    run, patched = migration({"adf-1": adf})
+
+    with patched:
+        plan = run.plan()
+
+    assert [i["linked_service_name"] for i in plan["pending"]] == [
+        "ls-v1-old-acct",
+        "ls-v2-old-acct",
+    ]
+    assert plan["by_factory"] == {"adf-1": 2}
+    assert plan["failed_factories"] == {}
+
+
+def test_apply_updates_with_the_discovered_etag(tmp_path):
+    adf = FakeLinkedServices([v2_service("old-acct")])
+    run, patched = migration({"adf-1": adf}, progress_path=str(tmp_path / "p.json"))
+
+    with patched:
+        results = run.apply(dry_run=False)
+
+    assert [r["status"] for r in results] == ["updated"]
+    name, definition, if_match = adf.puts[0]
+    assert name == "ls-v2-old-acct"
+    assert definition["properties"]["typeProperties"]["accountIdentifier"] == (
+        "new-acct"
+    )
+    assert if_match == "etag-v2-old-acct"
+    # The cached definition the plan was built from is left untouched
+    assert adf.services[name]["properties"]["typeProperties"]["accountIdentifier"] == (
+        "old-acct"
+    )
+
+
+def test_dry_run_changes_nothing():
+    adf = FakeLinkedServices([v2_service("old-acct")])
+    run, patched = migration({"adf-1": adf})
+
+    with patched:
+        plan = run.apply()
+
+    assert len(plan["pending"]) == 1
+    assert adf.puts == []
+
+
+def test_apply_refuses_a_plan_with_undiscovered_factories():
+    good = FakeLinkedServices([v2_service("old-acct")])
+    broken = FakeLinkedServices([], fail=True)
+    run, patched = migration({"adf-1": good, "adf-2": broken})
+
+    with patched:
+        plan = run.plan()
+        assert list(plan["failed_factories"]) == ["sub-1/rg/adf-2"]
+        with pytest.raises(RuntimeError, match="adf-2"):
+            run.apply(dry_run=False)
+        assert good.puts == []
+
+        results = run.apply(dry_run=False, allow_partial=True)
+
+    assert [r["status"] for r in results] == ["updated"]
+
+
+def test_resume_skips_items_already_updated(tmp_path):
+    progress_path = str(tmp_path / "progress.json")
+    adf = FakeLinkedServices([v1_service("old-acct"), v2_service("old-acct")])
+    run, patched = migration({"adf-1": adf}, progress_path=progress_path)
+    with patched:
+        run.apply(dry_run=False)
+
+    resumed_adf = FakeLinkedServices([v1_service("old-acct"), v2_service("old-acct")])
+    resumed, patched = migration({"adf-1": resumed_adf}, progress_path=progress_path)
+    with patched:
+        plan = resumed.plan()
+        results = resumed.apply(dry_run=False)
+
+    assert plan["pending"] == []
+    assert len(plan["done"]) == 2
+    assert results == []
+    assert resumed_adf.puts == []
+
+
+def test_progress_file_for_another_fqdn_map_is_rejected(tmp_path):
+    progress_path = tmp_path / "progress.json"
+    progress_path.write_text(
+        json.dumps({"fqdn_map": {"old-acct": "elsewhere"}, "items": {}})
+    )
+
+    with pytest.raises(ValueError, match="different fqdn_map"):
+        SnowflakeAccountMigration(
+            [("sub-1", "rg", "adf-1")],
+            FQDN_MAP,
+            auth=SimpleNamespace(credential=None),
+            progress_path=str(progress_path),
+        )
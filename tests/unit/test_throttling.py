@@ -0,0 +1,180 @@
+import base64
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from azure_tools import throttling
+from azure_tools.throttling import (
+    ArmRateLimiter,
+    RetryEngine,
+    TokenBucket,
+    principal_from_token,
+    request_scope,
+    send_with_retry,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(throttling.time, "monotonic", clock.monotonic)
+    monkeypatch.setattr(throttling.time, "sleep", clock.sleep)
+    return clock
+
+
+def response(status_code, headers=None):
+    return SimpleNamespace(status_code=status_code, headers=headers or {})
+
+
+def test_token_bucket_spends_burst_then_reserves_in_debt(clock):
+    bucket = TokenBucket(capacity=2, refill_rate=4.0)
+
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == pytest.approx(0.25)
+    assert bucket.reserve() == pytest.approx(0.5)
+
+
+def test_token_bucket_refills_up_to_capacity(clock):
+    bucket = TokenBucket(capacity=2, refill_rate=1.0)
+    bucket.reserve()
+    bucket.reserve()
+
+    clock.now += 100
+
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == pytest.approx(1.0)
+
+
+def test_token_bucket_follows_remaining_quota_header(clock):
+    bucket = TokenBucket(capacity=100, refill_rate=1.0)
+    bucket.observe_remaining(0)
+
+    assert bucket.reserve() == pytest.approx(1.0)
+
+
+def test_rate_limiter_uses_separate_read_and_write_buckets(clock):
+    limiter = ArmRateLimiter(limits={"read": (1, 1.0), "write": (1, 1.0)})
+
+    assert limiter.reserve("sub", "me", "GET") == 0.0
+    assert limiter.reserve("sub", "me", "PUT") == 0.0
+    assert limiter.reserve("sub", "me", "HEAD") > 0
+    assert limiter.reserve("other-sub", "me", "GET") == 0.0
+
+
+def test_retry_after_headers():
+    assert RetryEngine.retry_after({"Retry-After": "7"}) == 7.0
+    assert RetryEngine.retry_after({"retry-after-ms": "1500"}) == 1.5
+    assert RetryEngine.retry_after({"Retry-After": "soon"}) is None
+    assert RetryEngine.retry_after(None) is None
+
+
+def test_should_retry_limits_server_errors_to_idempotent_methods():
+    retry = RetryEngine(max_attempts=3)
+
+    assert retry.should_retry(429, 1, "POST")
+    assert retry.should_retry(500, 1, "GET")
+    assert retry.should_retry(503, 1, "DELETE")
+    assert not retry.should_retry(500, 1, "POST")
+    assert not retry.should_retry(502, 1, "PATCH")
+    assert retry.should_retry(500, 1, "POST", retry_transient=True)
+    assert not retry.should_retry(500, 1, "GET", retry_transient=False)
+    assert not retry.should_retry(404, 1, "GET")
+    assert not retry.should_retry(429, 3, "GET")
+
+
+def test_send_with_retry_honors_retry_after(clock):
+    responses = iter([response(429, {"Retry-After": "3"}), response(200)])
+    limiter = ArmRateLimiter()
+
+    result = send_with_retry(
+        lambda: next(responses),
+        url="https://management.azure.com/subscriptions/sub-1/resourceGroups/rg",
+        method="GET",
+        principal="me",
+        limiter=limiter,
+    )
+
+    assert result.status_code == 200
+    assert clock.sleeps == [3.0]
+
+
+def test_send_with_retry_gives_up_after_max_attempts(clock):
+    calls = []
+
+    def send():
+        calls.append(1)
+        return response(503, {"Retry-After": "1"})
+
+    result = send_with_retry(
+        send,
+        url="https://management.azure.com/subscriptions/sub-1",
+        method="GET",
+        principal="me",
+        limiter=ArmRateLimiter(),
+        retry=RetryEngine(max_attempts=3),
+    )
+
+    assert result.status_code == 503
+    assert len(calls) == 3
+
+
+def test_send_with_retry_does_not_resend_failed_actions(clock):
+    calls = []
+
+    def send():
+        calls.append(1)
+        return response(500)
+
+    result = send_with_retry(
+        send,
+        url="https://management.azure.com/subscriptions/sub-1/testConnectivity",
+        method="POST",
+        principal="me",
+        limiter=ArmRateLimiter(),
+    )
+
+    assert result.status_code == 500
+    assert len(calls) == 1
+
+
+def test_send_with_retry_feeds_remaining_quota_back(clock):
+    limiter = ArmRateLimiter(limits={"read": (100, 1.0), "write": (100, 1.0)})
+    headers = {"x-ms-ratelimit-remaining-subscription-reads": "0"}
+
+    send_with_retry(
+        lambda: response(200, headers),
+        url="https://management.azure.com/subscriptions/SUB-1/providers",
+        method="GET",
+        principal="me",
+        limiter=limiter,
+    )
+
+    assert limiter.reserve("sub-1", "me", "GET") > 0
+
+
+def test_request_scope_and_principal():
+    assert request_scope("https://management.azure.com/subscriptions/ABC/x") == "abc"
+    assert request_scope("https://myvault.vault.azure.net/secrets/x") == (
+        "myvault.vault.azure.net"
+    )
+    payload = base64.urlsafe_b64encode(json.dumps({"oid": "user-1"}).encode())
+    token = f"header.{payload.decode().rstrip('=')}.signature"
+    assert principal_from_token(f"Bearer {token}") == "user-1"
+    assert principal_from_token("not-a-jwt") == "unknown"
+    assert principal_from_token(None) == "unknown"
@@ -0,0 +1,145 @@
+import json
+import time
+from unittest import mock
+
+import pytest
+from azure.core.credentials import AccessToken
+from cryptography.fernet import Fernet
+from msal_extensions.persistence import PersistenceNotFound
+
+from azure_tools import token_cache
+from azure_tools.token_cache import (
+    CachedTokenCredential,
+    PersistentTokenCache,
+    credential_identity,
+)
+
+
+class FakeCredential:
+    def __init__(self):
+        self.calls = []
+
+    def get_token(self, *scopes, **kwargs):
+        self.calls.append((scopes, kwargs))
+        return AccessToken(f"token-{len(self.calls)}", int(time.time()) + 3600)
+
+    def close(self):
+        pass
+
+
+class FakeKeyStore:
+    def __init__(self):
+        self.value = None
+
+    def load(self):
+        if self.value is None:
+            raise PersistenceNotFound()
+        return self.value
+
+    def save(self, content):
+        self.value = content
+
+
+@pytest.fixture
+def identity_env(monkeypatch, tmp_path):
+    for name in ("AZURE_CLIENT_ID", "AZURE_TENANT_ID", "AZURE_USERNAME"):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv("AZURE_CONFIG_DIR", str(tmp_path / "az"))
+    (tmp_path / "az").mkdir()
+    return tmp_path / "az"
+
+
+def cli_login(config_dir, tenant, user):
+    profile = {
+        "subscriptions": [
+            {"isDefault": False, "tenantId": "other", "user": {"name": "x"}},
+            {"isDefault": True, "tenantId": tenant, "user": {"name": user}},
+        ]
+    }
+    # The CLI writes the profile with a byte order mark
+    (config_dir / "azureProfile.json").write_text(
+        json.dumps(profile), encoding="utf-8-sig"
+    )
+
+
+def test_identity_follows_the_cli_account(identity_env):
+    cli_login(identity_env, "tenant-a", "alice@contoso.com")
+    alice = credential_identity()
+    cli_login(identity_env, "tenant-a", "bob@contoso.com")
+    bob = credential_identity()
+    cli_login(identity_env, "tenant-b", "bob@contoso.com")
+
+    assert len({alice, bob, credential_identity()}) == 3
+
+
+def test_identity_follows_the_service_principal(identity_env, monkeypatch):
+    without = credential_identity()
+    monkeypatch.setenv("AZURE_CLIENT_ID", "app-1")
+
+    assert credential_identity() != without
+
+
+def test_entries_are_not_shared_between_principals(identity_env, tmp_path):
+    cache = PersistentTokenCache(str(tmp_path / "cache.bin"), Fernet.generate_key())
+    cli_login(identity_env, "tenant-a", "alice@contoso.com")
+    alice = CachedTokenCredential(FakeCredential(), cache)
+    cli_login(identity_env, "tenant-a", "bob@contoso.com")
+    bob = CachedTokenCredential(FakeCredential(), cache)
+
+    try:
+        assert alice.get_token("scope/.default").token == "token-1"
+        assert bob.get_token("scope/.default").token == "token-1"
+        assert len(bob.credential.calls) == 1
+    finally:
+        alice.close()
+        bob.close()
+
+
+def test_other_processes_reuse_the_entry_of_the_same_principal(identity_env, tmp_path):
+    cache = PersistentTokenCache(str(tmp_path / "cache.bin"), Fernet.generate_key())
+    first = CachedTokenCredential(FakeCredential(), cache)
+    second = CachedTokenCredential(FakeCredential(), cache)
+
+    try:
+        token = first.get_token("scope/.default", tenant_id="tenant-a")
+        assert second.get_token("scope/.default", tenant_id="tenant-a") == token
+        assert second.credential.calls == []
+        second.get_token("scope/.default")
+        assert len(second.credential.calls) == 1
+    finally:
+        first.close()
+        second.close()
+
+
+def test_unreadable_cache_only_costs_a_fresh_token(identity_env, tmp_path):
+    path = str(tmp_path / "cache.bin")
+    PersistentTokenCache(path, Fernet.generate_key()).save(
+        "key", AccessToken("old", int(time.time()) + 3600)
+    )
+
+    assert PersistentTokenCache(path, Fernet.generate_key()).load("key") is None
+
+
+def test_key_is_kept_in_the_os_key_store(monkeypatch, tmp_path):
+    monkeypatch.delenv(token_cache.TOKEN_CACHE_KEY_ENV, raising=False)
+    store = FakeKeyStore()
+    (tmp_path / "token_cache.key").write_bytes(Fernet.generate_key())
+
+    with mock.patch.object(PersistentTokenCache, "_key_store", return_value=store):
+        cache = PersistentTokenCache(str(tmp_path / "cache.bin"))
+        cache.save("key", AccessToken("token", int(time.time()) + 3600))
+        reopened = PersistentTokenCache(str(tmp_path / "cache.bin"))
+
+    assert store.value is not None
+    assert not (tmp_path / "token_cache.key").exists()
+    assert reopened.load("key").token == "token"
+
+
+def test_key_file_is_used_without_an_os_key_store(monkeypatch, tmp_path):
+    monkeypatch.delenv(token_cache.TOKEN_CACHE_KEY_ENV, raising=False)
+
+    with mock.patch.object(PersistentTokenCache, "_key_store", return_value=None):
+        PersistentTokenCache(str(tmp_path / "cache.bin"))
+
+    key_file = tmp_path / "token_cache.key"
+    assert key_file.stat().st_mode & 0o777 == 0o600
@@ -0,0 +1,102 @@
+import asyncio
+import itertools
+import threading
+
+import pytest
+
+from azure_tools import waiters
+from azure_tools.waiters import WaitCancelledError, Waiter, async_wait_until
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(waiters.time, "monotonic", clock.monotonic)
+    monkeypatch.setattr(waiters.time, "sleep", clock.sleep)
+    return clock
+
+
+def test_delays_grow_by_factor_up_to_max_delay():
+    waiter = Waiter(initial_delay=1, factor=2, max_delay=5)
+
+    assert list(itertools.islice(waiter.delays(), 5)) == [1, 2, 4, 5, 5]
+
+
+def test_invalid_schedule_is_rejected():
+    with pytest.raises(ValueError):
+        Waiter(initial_delay=10, max_delay=1)
+    with pytest.raises(ValueError):
+        Waiter(factor=0.5)
+
+
+def test_wait_until_returns_first_truthy_result(clock):
+    results = iter([None, False, "done"])
+    progress = []
+    waiter = Waiter(
+        initial_delay=1,
+        factor=3,
+        on_progress=lambda attempt, elapsed, result: progress.append(
+            (attempt, elapsed, result)
+        ),
+    )
+
+    assert waiter.wait_until(lambda: next(results)) == "done"
+    assert clock.sleeps == [1, 3]
+    assert progress == [(1, 0.0, None), (2, 1.0, False)]
+
+
+def test_wait_until_caps_the_last_delay_at_the_deadline(clock):
+    waiter = Waiter(initial_delay=4, factor=2, timeout=10)
+
+    with pytest.raises(TimeoutError, match="pool steady"):
+        waiter.wait_until(lambda: False, description="pool steady")
+
+    assert clock.sleeps == [4, 6]
+
+
+def test_wait_until_is_cancelled_by_event():
+    cancel = threading.Event()
+    cancel.set()
+    waiter = Waiter(initial_delay=10, cancel_event=cancel)
+
+    with pytest.raises(WaitCancelledError):
+        waiter.wait_until(lambda: False)
+
+
+def test_async_wait_until_accepts_coroutine_predicates():
+    checks = []
+
+    async def predicate():
+        checks.append(1)
+        return len(checks) == 3
+
+    result = asyncio.run(
+        async_wait_until(predicate, initial_delay=0.001, max_delay=0.001)
+    )
+
+    assert result is True
+    assert len(checks) == 3
+
+
+def test_async_wait_until_is_cancelled_by_event():
+    async def scenario():
+        cancel = asyncio.Event()
+        asyncio.get_running_loop().call_later(0.01, cancel.set)
+        waiter = Waiter(initial_delay=10, cancel_event=cancel)
+        await waiter.async_wait_until(lambda: False)
+
+    with pytest.raises(WaitCancelledError):
+        asyncio.run(scenario())